@@ -1,7 +1,13 @@
 """Provide a wrapper around epplib to handle authentication and errors."""
 
 import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+from gevent import Timeout
 from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
+from gevent.queue import Empty, LifoQueue
 
 try:
     from epplib.client import Client
@@ -53,7 +59,8 @@ class EPPLibWrapper:
                 "urn:ietf:params:xml:ns:contact-1.0",
             ],
         )
-        # We should only ever have one active connection at a time
+        # A session may only have one command in flight at a time;
+        # see EPPConnectionPool for sending commands concurrently
         self.connection_lock = BoundedSemaphore(1)
 
         self.connection_lock.acquire()
@@ -190,9 +197,216 @@ class EPPLibWrapper:
             self.connection_lock.release()
 
 
+@dataclass
+class SessionHealth:
+    """Bookkeeping for a single pooled registry session."""
+
+    commands_sent: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+    # set when the session was interrupted mid-command and cannot be trusted
+    broken: bool = False
+
+
+class EPPConnectionPool:
+    """
+    A pool of logged-in EPPLibWrapper sessions.
+
+    gunicorn runs gevent workers, so a single worker can serve many requests
+    at the same time. Rather than queueing all of them behind one socket, each
+    command checks out an idle session, is sent over it and checks it back in.
+
+    Sessions are created on demand, up to `size`. A session is replaced after
+    `max_failures` consecutive connection-level failures; each session still
+    retries and reconnects on its own, as EPPLibWrapper.send always has.
+
+    ATTN: This should not be used directly. Use `Domain` from domain.py.
+    """
+
+    def __init__(self, size=1, timeout=None, max_failures=3) -> None:
+        """Initialize the pool and log in the first session."""
+        if size < 1:
+            raise ValueError("The connection pool needs at least one session.")
+        self.size = size
+        # seconds to wait for a free session, or None to wait forever
+        self.timeout = timeout
+        self.max_failures = max_failures
+
+        # most recently used sessions are handed out first,
+        # so that surplus sessions are the ones that go quiet
+        self._idle = LifoQueue()
+        self._health: dict[EPPLibWrapper, SessionHealth] = {}
+        self._in_use = 0
+        # sessions being logged in that do not have a health record yet
+        self._reserved = 0
+        # guards the session count while a new session is being reserved
+        self._reserve_lock = BoundedSemaphore(1)
+
+        self._metrics = {
+            "checkouts": 0,
+            "checkout_timeouts": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "peak_in_use": 0,
+            "sessions_created": 0,
+            "sessions_replaced": 0,
+        }
+
+        # Log in one session up front, as the single client used to do,
+        # so that registry problems show up at app initialization
+        self._idle.put(self._create_session())
+
+    def _create_session(self) -> EPPLibWrapper:
+        """Create a new session and start tracking its health."""
+        session = EPPLibWrapper()
+        self._health[session] = SessionHealth()
+        self._metrics["sessions_created"] += 1
+        return session
+
+    def _reserve_new_session(self) -> bool:
+        """Returns True if the pool has room for one more session, and claims it."""
+        with self._reserve_lock:
+            if len(self._health) + self._reserved < self.size:
+                self._reserved += 1
+                return True
+        return False
+
+    def _release_reservation(self) -> None:
+        """Give back a claim made by _reserve_new_session."""
+        with self._reserve_lock:
+            self._reserved -= 1
+
+    def _checkout(self) -> EPPLibWrapper:
+        """Take an idle session, create one if the pool has room,
+        or else wait up to `timeout` seconds for one to be checked in."""
+        started = time.monotonic()
+        try:
+            session = self._idle.get_nowait()
+        except Empty:
+            if self._reserve_new_session():
+                try:
+                    session = self._create_session()
+                finally:
+                    self._release_reservation()
+            else:
+                try:
+                    session = self._idle.get(timeout=self.timeout)
+                except Empty as err:
+                    self._metrics["checkout_timeouts"] += 1
+                    message = "No registry connection became available in time."
+                    logger.error(f"{message} Pool stats: {self.stats()}")
+                    raise RegistryError(message, code=ErrorCode.TRANSPORT_ERROR) from err
+
+        waited = time.monotonic() - started
+        self._in_use += 1
+        self._metrics["checkouts"] += 1
+        self._metrics["total_wait_seconds"] += waited
+        self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], waited)
+        self._metrics["peak_in_use"] = max(self._metrics["peak_in_use"], self._in_use)
+        return session
+
+    def _checkin(self, session: EPPLibWrapper) -> None:
+        """Return a session to the pool, replacing it if it keeps failing."""
+        self._in_use -= 1
+        health = self._health.get(session)
+        if health is not None and (health.broken or health.consecutive_failures >= self.max_failures):
+            logger.warning(
+                f"Closing a registry session after {health.consecutive_failures} "
+                f"consecutive failures. Last error: {health.last_error}"
+            )
+            del self._health[session]
+            self._metrics["sessions_replaced"] += 1
+            session._disconnect()
+            # Replace it straight away so that anyone waiting on the pool is woken up
+            session = self._create_session()
+        self._idle.put(session)
+
+    def _record_result(self, session: EPPLibWrapper, err: Optional[RegistryError] = None, broken=False) -> None:
+        """Update a session's health after it sent a command."""
+        health = self._health.get(session)
+        if health is None:
+            return
+        health.commands_sent += 1
+        health.broken = health.broken or broken
+        # Error responses about the request itself (codes 2000 - 2308)
+        # mean the session is working fine
+        if err is None or err.is_client_error():
+            health.consecutive_failures = 0
+        else:
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.last_error = str(err)
+
+    def send(self, command, *, cleaned=False, timeout=None):
+        """Send the command over a pooled session.
+
+        If `timeout` seconds pass without a response, a RegistryError is raised
+        and the session, which may still receive the late response, is replaced."""
+        session = self._checkout()
+        timer = Timeout(timeout)
+        timer.start()
+        try:
+            response = session.send(command, cleaned=cleaned)
+        except Timeout as err:
+            if err is not timer:
+                raise
+            cmd_type = command.__class__.__name__
+            message = f"{cmd_type} failed to execute because the registry did not respond in time."
+            logger.error(f"{message} Timeout: {timeout} seconds")
+            timeout_error = RegistryError(message, code=ErrorCode.TRANSPORT_ERROR)
+            self._record_result(session, timeout_error, broken=True)
+            raise timeout_error from err
+        except RegistryError as err:
+            self._record_result(session, err)
+            raise err
+        else:
+            self._record_result(session)
+            return response
+        finally:
+            timer.close()
+            self._checkin(session)
+
+    def send_many(self, commands, *, cleaned=False, timeout=None, concurrency=None) -> list:
+        """Send several independent commands at once, spread over the pool's sessions.
+
+        At most `concurrency` commands are in flight at a time, which defaults to
+        (and cannot usefully exceed) the pool's size.
+
+        Returns a list in the same order as `commands`. Each item is either the
+        response, or the RegistryError raised for that command (including timeouts),
+        so a single failure does not hide the other results."""
+
+        def send_one(command):
+            try:
+                return self.send(command, cleaned=cleaned, timeout=timeout)
+            except RegistryError as err:
+                return err
+
+        if len(commands) <= 1:
+            return [send_one(command) for command in commands]
+        return Pool(min(concurrency or self.size, self.size)).map(send_one, commands)
+
+    def stats(self) -> dict:
+        """Returns a snapshot of pool usage, for logging and debugging."""
+        checkouts = self._metrics["checkouts"]
+        return {
+            **self._metrics,
+            "size": self.size,
+            "open_sessions": len(self._health),
+            "idle_sessions": self._idle.qsize(),
+            "in_use": self._in_use,
+            "average_wait_seconds": self._metrics["total_wait_seconds"] / checkouts if checkouts else 0.0,
+            "session_failures": [health.failures for health in self._health.values()],
+        }
+
+
 try:
     # Initialize epplib
-    CLIENT = EPPLibWrapper()
+    CLIENT = EPPConnectionPool(
+        size=settings.EPP_CONNECTION_POOL_SIZE,
+        timeout=settings.EPP_CONNECTION_POOL_TIMEOUT,
+    )
     logger.info("registry client initialized")
 except Exception:
     logger.warning("Unable to configure epplib. Registrar cannot contact registry.")
@@ -1,10 +1,17 @@
 import datetime
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import gevent
 from dateutil.tz import tzlocal  # type: ignore
 from unittest.mock import MagicMock, patch
 from pathlib import Path
+from manage import GEVENT_COMMANDS
 from django.test import TestCase
 from gevent.exceptions import ConcurrentObjectUseError
-from epplibwrapper.client import EPPLibWrapper
+from epplibwrapper.client import EPPConnectionPool, EPPLibWrapper
 from epplibwrapper.errors import RegistryError, LoginError
 from .common import less_console_noise
 import logging
@@ -375,3 +382,226 @@ class TestClient(TestCase):
             ):
                 result = wrapper.send(tested_command, cleaned=True)
                 self.assertEqual(expected_result, result.__dict__)
+
+
+class TestConnectionPool(TestCase):
+    """Test the pool of EPPlibwrapper sessions"""
+
+    def fake_result(self, code, msg):
+        """Helper function to create a fake Result object"""
+        return MagicMock(code=code, msg=msg, res_data=[])
+
+    def slow_send(self, *args, **kwargs):
+        """Simulates a registry command which takes a moment to answer"""
+        gevent.sleep(0.05)
+        return self.fake_result(1000, "Command completed successfully")
+
+    @patch("epplibwrapper.client.Client")
+    def test_pool_reuses_idle_session(self, mock_client):
+        """Sequential commands are all sent over the session created at initialization"""
+        with less_console_noise():
+            mock_client.return_value.send = MagicMock(
+                return_value=self.fake_result(1000, "Command completed successfully")
+            )
+            pool = EPPConnectionPool(size=3)
+            pool.send("InfoDomainCommand", cleaned=True)
+            pool.send("InfoDomainCommand", cleaned=True)
+
+            stats = pool.stats()
+            self.assertEqual(stats["sessions_created"], 1)
+            self.assertEqual(stats["checkouts"], 2)
+            self.assertEqual(stats["in_use"], 0)
+            self.assertEqual(stats["idle_sessions"], 1)
+            mock_client.return_value.connect.assert_called_once()
+
+    @patch("epplibwrapper.client.Client")
+    def test_pool_opens_sessions_up_to_size(self, mock_client):
+        """Concurrent commands get their own session, up to the pool size"""
+        with less_console_noise():
+            mock_client.return_value.send = MagicMock(side_effect=self.slow_send)
+            pool = EPPConnectionPool(size=2)
+            greenlets = [gevent.spawn(pool.send, "InfoDomainCommand", cleaned=True) for _ in range(3)]
+            gevent.joinall(greenlets, raise_error=True)
+
+            stats = pool.stats()
+            self.assertEqual(stats["sessions_created"], 2)
+            self.assertEqual(stats["peak_in_use"], 2)
+            self.assertEqual(stats["checkouts"], 3)
+            self.assertEqual(stats["idle_sessions"], 2)
+            # the third command had to wait for a session to be checked in
+            self.assertGreater(stats["max_wait_seconds"], 0)
+
+    @patch("epplibwrapper.client.Client")
+    def test_pool_checkout_times_out(self, mock_client):
+        """A command raises a RegistryError when no session frees up in time"""
+        with less_console_noise():
+            mock_client.return_value.send = MagicMock(side_effect=self.slow_send)
+            pool = EPPConnectionPool(size=1, timeout=0.01)
+            holder = gevent.spawn(pool.send, "InfoDomainCommand", cleaned=True)
+            gevent.sleep(0)
+
+            with self.assertRaises(RegistryError) as context:
+                pool.send("InfoDomainCommand", cleaned=True)
+            self.assertTrue(context.exception.is_transport_error())
+            holder.join()
+            self.assertEqual(pool.stats()["checkout_timeouts"], 1)
+
+    @patch("epplibwrapper.client.Client")
+    def test_pool_replaces_failing_session(self, mock_client):
+        """A session that keeps failing is closed and replaced by a new one"""
+        with less_console_noise():
+            command_failure_result = self.fake_result(2400, "Command failed")
+            login_success_result = self.fake_result(1000, "Command completed successfully")
+
+            def side_effect(*args, **kwargs):
+                if args[0] == "InfoDomainCommand":
+                    return command_failure_result
+                return login_success_result
+
+            mock_client.return_value.send = MagicMock(side_effect=side_effect)
+            pool = EPPConnectionPool(size=1, max_failures=1)
+            with self.assertRaises(RegistryError):
+                pool.send("InfoDomainCommand", cleaned=True)
+
+            stats = pool.stats()
+            self.assertEqual(stats["sessions_replaced"], 1)
+            self.assertEqual(stats["sessions_created"], 2)
+            self.assertEqual(stats["open_sessions"], 1)
+            self.assertEqual(stats["idle_sessions"], 1)
+
+    @patch("epplibwrapper.client.Client")
+    def test_pool_client_errors_do_not_count_against_session(self, mock_client):
+        """Error responses about the command itself leave the session healthy"""
+        with less_console_noise():
+            not_found_result = self.fake_result(2303, "Object does not exist")
+            login_success_result = self.fake_result(1000, "Command completed successfully")
+
+            def side_effect(*args, **kwargs):
+                if args[0] == "InfoDomainCommand":
+                    return not_found_result
+                return login_success_result
+
+            mock_client.return_value.send = MagicMock(side_effect=side_effect)
+            pool = EPPConnectionPool(size=1, max_failures=1)
+            with self.assertRaises(RegistryError):
+                pool.send("InfoDomainCommand", cleaned=True)
+
+            stats = pool.stats()
+            self.assertEqual(stats["sessions_replaced"], 0)
+            self.assertEqual(stats["session_failures"], [0])
+
+    @patch("epplibwrapper.client.Client")
+    def test_send_many_keeps_order_and_reports_errors_per_command(self, mock_client):
+        """Batched commands come back in order, with failures in place of their responses"""
+        with less_console_noise():
+            login_success_result = self.fake_result(1000, "Command completed successfully")
+            not_found_result = self.fake_result(2303, "Object does not exist")
+
+            def side_effect(*args, **kwargs):
+                command = args[0]
+                if not (isinstance(command, str) and command.startswith("InfoHost")):
+                    return login_success_result
+                gevent.sleep(0.01)
+                if command == "InfoHost missing":
+                    return not_found_result
+                return self.fake_result(1000, command)
+
+            mock_client.return_value.send = MagicMock(side_effect=side_effect)
+            pool = EPPConnectionPool(size=3)
+            results = pool.send_many(["InfoHost ns1", "InfoHost missing", "InfoHost ns2"], cleaned=True)
+
+            self.assertEqual(len(results), 3)
+            self.assertEqual(results[0].msg, "InfoHost ns1")
+            self.assertIsInstance(results[1], RegistryError)
+            self.assertEqual(results[1].code, 2303)
+            self.assertEqual(results[2].msg, "InfoHost ns2")
+            self.assertEqual(pool.stats()["peak_in_use"], 3)
+
+    @patch("epplibwrapper.client.Client")
+    def test_send_many_limits_concurrency(self, mock_client):
+        """No more than `concurrency` batched commands are in flight at once"""
+        with less_console_noise():
+            login_success_result = self.fake_result(1000, "Command completed successfully")
+
+            def side_effect(*args, **kwargs):
+                gevent.sleep(0.01)
+                return login_success_result
+
+            mock_client.return_value.send = MagicMock(side_effect=side_effect)
+            pool = EPPConnectionPool(size=3)
+            results = pool.send_many(["InfoHost ns1", "InfoHost ns2", "InfoHost ns3"], cleaned=True, concurrency=2)
+
+            self.assertEqual(results, [login_success_result] * 3)
+            self.assertEqual(pool.stats()["peak_in_use"], 2)
+
+    @patch("epplibwrapper.client.Client")
+    def test_send_timeout_replaces_session(self, mock_client):
+        """A command that gets no response in time fails alone, and its session is replaced"""
+        with less_console_noise():
+            login_success_result = self.fake_result(1000, "Command completed successfully")
+
+            def side_effect(*args, **kwargs):
+                if args[0] == "InfoHost slow":
+                    gevent.sleep(1)
+                return login_success_result
+
+            mock_client.return_value.send = MagicMock(side_effect=side_effect)
+            pool = EPPConnectionPool(size=2)
+            results = pool.send_many(["InfoHost slow", "InfoHost fast"], cleaned=True, timeout=0.05)
+
+            self.assertIsInstance(results[0], RegistryError)
+            self.assertTrue(results[0].is_transport_error())
+            self.assertEqual(results[1], login_success_result)
+            self.assertEqual(pool.stats()["sessions_replaced"], 1)
+            self.assertEqual(pool.stats()["open_sessions"], 2)
+
+    # Sends blocking registry commands the way a management command run by manage.py would
+    BLOCKING_SENDS_SCRIPT = textwrap.dedent(
+        """
+        import json, sys, time
+        import manage
+        manage.patch_for_gevent(["manage.py", sys.argv[1]])
+        from unittest.mock import MagicMock, patch
+        from epplibwrapper.client import EPPConnectionPool, RegistryError
+
+        def blocking_send(command):
+            if isinstance(command, str):
+                # blocks the whole process, unless gevent patched the standard library
+                time.sleep(0.2 if command == "InfoDomain" else 0.5)
+            return MagicMock(code=1000, res_data=[])
+
+        with patch("epplibwrapper.client.Client") as client, patch("epplibwrapper.client.commands"):
+            client.return_value.send = MagicMock(side_effect=blocking_send)
+            pool = EPPConnectionPool(size=5)
+            started = time.monotonic()
+            pool.send_many(["InfoDomain"] * 5, cleaned=True)
+            elapsed = time.monotonic() - started
+            results = pool.send_many(["InfoDomain slow", "InfoDomain"], cleaned=True, timeout=0.05)
+        print(json.dumps({"elapsed": elapsed, "timed_out": isinstance(results[0], RegistryError)}))
+        """
+    )
+
+    def run_blocking_sends(self, command_name):
+        """Returns how long 5 blocking sends took, and whether a timeout interrupted one, in a new process"""
+        output = subprocess.run(
+            [sys.executable, "-c", self.BLOCKING_SENDS_SCRIPT, command_name],
+            cwd=Path(__file__).resolve().parents[2],
+            env=os.environ,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_send_many_overlaps_blocking_sends_in_gevent_commands(self):
+        """Commands in GEVENT_COMMANDS send batches concurrently, even over blocking sockets"""
+        for command_name in GEVENT_COMMANDS:
+            with self.subTest(command_name):
+                result = self.run_blocking_sends(command_name)
+                self.assertLess(result["elapsed"], 0.6)
+                self.assertTrue(result["timed_out"])
+
+        # other commands leave the standard library alone, so blocking sends run one after another
+        result = self.run_blocking_sends("migrate")
+        self.assertGreaterEqual(result["elapsed"], 1.0)
+        self.assertFalse(result["timed_out"])
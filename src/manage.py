@@ -2,9 +2,25 @@
 """Django's command-line utility for administrative tasks."""
 import sys
 
+# Commands which send many registry commands at once (see EPPConnectionPool.send_many).
+# Like gunicorn's gevent workers, these need the standard library patched by gevent,
+# so that a command waiting on the registry lets the others run. Without it, their
+# batches are sent one command at a time and send timeouts can not interrupt a read.
+GEVENT_COMMANDS = ["extend_expiration_dates", "sync_registry_data"]
+
+
+def patch_for_gevent(argv):
+    """Patches the standard library for gevent if argv runs one of GEVENT_COMMANDS.
+    This must happen before anything else (Django included) is imported."""
+    if len(argv) > 1 and argv[1] in GEVENT_COMMANDS:
+        from gevent import monkey
+
+        monkey.patch_all()
+
 
 def main():
     """Run administrative tasks."""
+    patch_for_gevent(sys.argv)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -2,9 +2,10 @@ from datetime import date
 import logging
 import copy
 import json
+from django.conf import settings
 from django.template.loader import get_template
 from django import forms
-from django.db.models import Value, CharField, Q
+from django.db.models import Value, CharField, Q, TextField
 from django.db.models.functions import Concat, Coalesce
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect
@@ -18,10 +19,15 @@ from epplibwrapper.errors import ErrorCode, RegistryError
 from registrar.models.user_domain_role import UserDomainRole
 from waffle.admin import FlagAdmin
 from waffle.models import Sample, Switch
-from registrar.models import Contact, Domain, DomainRequest, DraftDomain, User, Website
+from registrar.models import Contact, Domain, DomainRequest, DomainRequestStatusChange, DraftDomain, User, Website
+from registrar.models.utility.search import annotate_search_rank
+from registrar.utility.admin_counts import EstimatedCountPaginator, admin_counter
 from registrar.utility.errors import FSMDomainRequestError, FSMErrorCodes
+from registrar.utility.safe_cache import SafeCache
 from registrar.views.utility.mixins import OrderableFieldsMixin
 from django.contrib.admin.views.main import ORDER_VAR
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.paginator import InvalidPage
 from registrar.widgets import NoAutocompleteFilteredSelectMultiple
 from . import models
 from auditlog.models import LogEntry  # type: ignore
@@ -33,7 +39,7 @@ from django.contrib.auth.forms import UserChangeForm, UsernameField
 from django_admin_multiple_choice_list_filter.list_filters import MultipleChoiceListFilter
 from import_export import resources
 from import_export.admin import ImportExportModelAdmin
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import FieldDoesNotExist
 
 from django.utils.translation import gettext_lazy as _
 
@@ -304,11 +310,71 @@ class DomainRequestAdminForm(forms.ModelForm):
 
 
 # Based off of this excellent example: https://djangosnippets.org/snippets/10471/
-class MultiFieldSortableChangeList(admin.views.main.ChangeList):
+class EstimatedCountChangeList(admin.views.main.ChangeList):
     """
-    This class overrides the behavior of column sorting in django admin tables in order
-    to allow for multi field sorting on admin_order_field
+    This class overrides how django admin tables count the rows in the table, so that
+    large tables are not counted in full on every page (see AdminCounter).
+
+    Usage:
+
+    class MyCustomAdmin(EstimatedCountMixin, admin.ModelAdmin):
+        ...
+
+    """
+
+    def get_results(self, request):
+        """
+        Mostly identical to the base implementation, except that the total number of
+        rows (with no admin filters applied) is counted with admin_counter.
+        The filtered number of rows is counted by the admin's paginator.
+        """
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        # Get the number of objects, with admin filters applied.
+        result_count = paginator.count
+
+        # Get the total number of objects, with no admin filters applied.
+        if self.model_admin.show_full_result_count:
+            full_result_count = admin_counter.count(self.root_queryset)
+        else:
+            full_result_count = None
+        can_show_all = result_count <= self.list_max_show_all
+        multi_page = result_count > self.list_per_page
+
+        # Get the list of objects to display on this page.
+        if (self.show_all and can_show_all) or not multi_page:
+            result_list = self.queryset._clone()
+        else:
+            try:
+                result_list = paginator.page(self.page_num).object_list
+            except InvalidPage:
+                raise IncorrectLookupParameters
+
+        self.result_count = result_count
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        # Admin actions are shown if there is at least one entry
+        # or if entries are not counted because show_full_result_count is disabled
+        self.show_admin_actions = not self.show_full_result_count or bool(full_result_count)
+        self.full_result_count = full_result_count
+        self.result_list = result_list
+        self.can_show_all = can_show_all
+        self.multi_page = multi_page
+        self.paginator = paginator
+
 
+class EstimatedCountMixin:
+    """Counts the rows of an admin's changelist with admin_counter, see EstimatedCountChangeList"""
+
+    paginator = EstimatedCountPaginator
+
+    def get_changelist(self, request, **kwargs):
+        return EstimatedCountChangeList
+
+
+class MultiFieldSortableChangeList(EstimatedCountChangeList):
+    """
+    This class overrides the behavior of column sorting in django admin tables in order
+    to allow for multi field sorting on admin_order_field.
+    Rows are counted as in EstimatedCountChangeList.
 
     Usage:
 
@@ -333,6 +399,11 @@ class MultiFieldSortableChangeList(admin.views.main.ChangeList):
         params = self.params
         ordering = list(self.model_admin.get_ordering(request) or self._get_default_ordering())
 
+        # Searches are listed closest match first, unless a column was sorted on
+        # (see ListHeaderAdmin.get_search_results)
+        if ORDER_VAR not in params and "search_rank" in queryset.query.annotations:
+            ordering = ["search_rank", "-search_similarity"] + ordering
+
         if ORDER_VAR in params:
             # Clear ordering and used params
             ordering = []
@@ -370,7 +441,7 @@ class MultiFieldSortableChangeList(admin.views.main.ChangeList):
         return ordering
 
 
-class CustomLogEntryAdmin(LogEntryAdmin):
+class CustomLogEntryAdmin(EstimatedCountMixin, LogEntryAdmin):
     """Overwrite the generated LogEntry admin class"""
 
     list_display = [
@@ -528,9 +599,9 @@ class AuditedAdmin(admin.ModelAdmin):
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
-class ListHeaderAdmin(AuditedAdmin, OrderableFieldsMixin):
-    """Custom admin to add a descriptive subheader to list views
-    and custom table sort behaviour"""
+class ListHeaderAdmin(EstimatedCountMixin, AuditedAdmin, OrderableFieldsMixin):
+    """Custom admin to add a descriptive subheader to list views,
+    custom table sort behaviour and estimated row counts for large tables"""
 
     def get_changelist(self, request, **kwargs):
         """Returns a custom ChangeList class, as opposed to the default.
@@ -542,6 +613,103 @@ class ListHeaderAdmin(AuditedAdmin, OrderableFieldsMixin):
         """
         return MultiFieldSortableChangeList
 
+    def get_list_select_related(self, request):
+        """Returns the relations to join in the changelist query, so that each row on
+        the page does not query for them separately.
+
+        These are found from list_display: fields which are themselves relations, and
+        columns whose admin_order_field (including those made for orderable_fk_fields)
+        goes through a relation, such as "domain_info__city". Relations listed in
+        list_select_related are joined as well, and list_select_related = True
+        keeps django's behaviour of joining every non-null foreign key.
+        """
+        list_select_related = super().get_list_select_related(request)
+        if list_select_related is True:
+            return True
+
+        related_lookups = list(list_select_related or [])
+        lookups = [field for field, _ in self.orderable_fk_fields]
+        for name in self.get_list_display(request):
+            lookups.extend(self._get_lookups_for_column(name))
+
+        for lookup in lookups:
+            related_lookup = self._get_related_lookup(lookup)
+            if related_lookup and related_lookup not in related_lookups:
+                related_lookups.append(related_lookup)
+        # With nothing to join, fall back to django's own check for foreign keys in list_display
+        return related_lookups or list_select_related
+
+    def _get_lookups_for_column(self, name):
+        """Returns the lookups which a list_display column reads, as best as they can be told"""
+        if not isinstance(name, str):
+            name = getattr(name, "__name__", "")
+        try:
+            self.model._meta.get_field(name)
+            return [name]
+        except FieldDoesNotExist:
+            pass
+
+        order_field = getattr(getattr(self, name, None), "admin_order_field", None)
+        if isinstance(order_field, str):
+            return [order_field.lstrip("-")]
+        if isinstance(order_field, (list, tuple)):
+            return [field.lstrip("-") for field in order_field if isinstance(field, str)]
+        return []
+
+    def _get_related_lookup(self, lookup):
+        """Returns the longest part of lookup that follows single-valued relations
+        (foreign keys and one-to-one fields, either way), or None if it follows none.
+        For example, "domain_info__federal_agency__agency" gives "domain_info__federal_agency"."""
+        model = self.model
+        related_parts = []
+        for part in lookup.split("__"):
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                break
+            if not field.is_relation or not (field.many_to_one or field.one_to_one):
+                break
+            related_parts.append(part)
+            model = field.related_model
+        return "__".join(related_parts) or None
+
+    def get_search_results(self, request, queryset, search_term):
+        """Searches as django does, and annotates each result with how closely it matches
+        the search term (see annotate_search_rank), so that the changelist can list exact
+        matches first, then those which start with the term, then the rest by similarity.
+
+        Only plain search fields (no ^, = or @) on text columns, which are either on this model
+        or reached through single-valued relations, are ranked. Searches through many-valued
+        relations are left to django, which loses the annotations when removing duplicates.
+        """
+        queryset, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        search_term = search_term.strip() if search_term else ""
+        if not search_term:
+            return queryset, may_have_duplicates
+
+        rankable_fields = [field for field in self.get_search_fields(request) if self._is_rankable_search_field(field)]
+        if rankable_fields:
+            queryset = annotate_search_rank(queryset, rankable_fields, search_term)
+        return queryset, may_have_duplicates
+
+    def _is_rankable_search_field(self, search_field):
+        """Returns True if search_field is a plain lookup of a text column, through
+        single-valued relations only"""
+        if not isinstance(search_field, str) or search_field[:1] in ("^", "=", "@"):
+            return False
+        *relation_parts, field_name = search_field.split("__")
+        if (self._get_related_lookup(search_field) or "") != "__".join(relation_parts):
+            return False
+
+        model = self.model
+        for part in relation_parts:
+            model = model._meta.get_field(part).related_model
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return False
+        return isinstance(field, (CharField, TextField))
+
     def changelist_view(self, request, extra_context=None):
         if extra_context is None:
             extra_context = {}
@@ -835,7 +1003,7 @@ class HostResource(resources.ModelResource):
         model = models.Host
 
 
-class MyHostAdmin(AuditedAdmin, ImportExportModelAdmin):
+class MyHostAdmin(EstimatedCountMixin, AuditedAdmin, ImportExportModelAdmin):
     """Custom host admin class to use our inlines."""
 
     resource_classes = [HostResource]
@@ -861,7 +1029,7 @@ class HostIpResource(resources.ModelResource):
         model = models.HostIP
 
 
-class HostIpAdmin(AuditedAdmin, ImportExportModelAdmin):
+class HostIpAdmin(EstimatedCountMixin, AuditedAdmin, ImportExportModelAdmin):
     """Custom host ip admin class"""
 
     resource_classes = [HostIpResource]
@@ -1388,6 +1556,9 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
     form = DomainRequestAdminForm
     change_form_template = "django/admin/domain_request_change_form.html"
 
+    # rendered action needed emails, see get_all_action_needed_reason_emails_as_json
+    action_needed_email_cache = SafeCache("action needed email", "ACTION_NEEDED_EMAIL_CACHE_ALIAS")
+
     class StatusListFilter(MultipleChoiceListFilter):
         """Custom status filter which is a multiple choice filter"""
 
@@ -1895,17 +2066,13 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         filtered_audit_log_entries = []
 
         try:
-            # Retrieve and order audit log entries by timestamp in descending order
-            audit_log_entries = LogEntry.objects.filter(object_id=object_id).order_by("-timestamp")
-
-            # Process each log entry to filter based on the change criteria
-            for log_entry in audit_log_entries:
-                entry = self.process_log_entry(log_entry)
-                if entry:
-                    filtered_audit_log_entries.append(entry)
-
-        except ObjectDoesNotExist as e:
-            logger.error(f"Object with object_id {object_id} does not exist: {e}")
+            # Retrieve the recorded status changes, ordered by timestamp in descending order
+            status_changes = (
+                DomainRequestStatusChange.objects.filter(domain_request_id=object_id)
+                .select_related("actor")
+                .order_by("-timestamp", "-id")
+            )
+            filtered_audit_log_entries = [self.get_status_changelog_entry(change) for change in status_changes]
         except Exception as e:
             logger.error(f"An error occurred during change_view: {e}")
 
@@ -1919,14 +2086,48 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
 
     def get_all_action_needed_reason_emails_as_json(self, domain_request):
         """Returns a json dictionary of every action needed reason and its associated email
-        for this particular domain request."""
+        for this particular domain request.
+
+        Rendered emails are cached for settings.ACTION_NEEDED_EMAIL_CACHE_TIMEOUT seconds,
+        until the domain request (or a record the emails show) is next saved."""
+        key_prefix = self._get_action_needed_reason_email_key_prefix(domain_request)
+        keys = {f"{key_prefix}:{reason.value}": reason.value for reason in domain_request.ActionNeededReasons}
+        cached = self._get_cached_action_needed_reason_emails(keys.keys())
+
         emails = {}
-        for action_needed_reason in domain_request.ActionNeededReasons:
-            enum_value = action_needed_reason.value
-            # Change this in #1901. Just add a check for the current value.
-            emails[enum_value] = self._get_action_needed_reason_default_email_text(domain_request, enum_value)
+        rendered = {}
+        for key, enum_value in keys.items():
+            if key in cached:
+                emails[enum_value] = cached[key]
+            else:
+                # Change this in #1901. Just add a check for the current value.
+                emails[enum_value] = self._get_action_needed_reason_default_email_text(domain_request, enum_value)
+                rendered[key] = emails[enum_value]
+
+        self._cache_action_needed_reason_emails(rendered)
         return json.dumps(emails)
 
+    def _get_action_needed_reason_email_key_prefix(self, domain_request):
+        """Returns the start of the cache keys for a domain request's emails. It changes whenever the
+        domain request, its requested domain or its senior official (which the emails show) is saved."""
+        updated_ats = [
+            domain_request.updated_at,
+            getattr(domain_request.requested_domain, "updated_at", None),
+            getattr(domain_request.senior_official, "updated_at", None),
+        ]
+        version = "-".join(str(updated_at.timestamp()) if updated_at else "none" for updated_at in updated_ats)
+        return f"action_needed_email:{domain_request.pk}:{version}"
+
+    def _get_cached_action_needed_reason_emails(self, keys):
+        if settings.ACTION_NEEDED_EMAIL_CACHE_TIMEOUT <= 0:
+            return {}
+        return self.action_needed_email_cache.get_many(keys)
+
+    def _cache_action_needed_reason_emails(self, emails):
+        if not emails or settings.ACTION_NEEDED_EMAIL_CACHE_TIMEOUT <= 0:
+            return
+        self.action_needed_email_cache.set_many(emails, settings.ACTION_NEEDED_EMAIL_CACHE_TIMEOUT)
+
     def _get_action_needed_reason_default_email_text(self, domain_request, action_needed_reason: str):
         """Returns the default email associated with the given action needed reason"""
         if action_needed_reason is None or action_needed_reason == domain_request.ActionNeededReasons.OTHER:
@@ -1951,62 +2152,19 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
             "email_body_text": template.render(context=context),
         }
 
-    def process_log_entry(self, log_entry):
-        """Process a log entry and return filtered entry dictionary if applicable."""
-        changes = log_entry.changes
-        status_changed = "status" in changes
-        rejection_reason_changed = "rejection_reason" in changes
-        action_needed_reason_changed = "action_needed_reason" in changes
-
-        # Check if the log entry meets the filtering criteria
-        if status_changed or (not status_changed and (rejection_reason_changed or action_needed_reason_changed)):
-            entry = {}
-
-            # Handle status change
-            if status_changed:
-                _, status_value = changes.get("status")
-                if status_value:
-                    entry["status"] = DomainRequest.DomainRequestStatus.get_status_label(status_value)
-
-            # Handle rejection reason change
-            if rejection_reason_changed:
-                _, rejection_reason_value = changes.get("rejection_reason")
-                if rejection_reason_value:
-                    entry["rejection_reason"] = (
-                        ""
-                        if rejection_reason_value == "None"
-                        else DomainRequest.RejectionReasons.get_rejection_reason_label(rejection_reason_value)
-                    )
-                    # Handle case where rejection reason changed but not status
-                    if not status_changed:
-                        entry["status"] = DomainRequest.DomainRequestStatus.get_status_label(
-                            DomainRequest.DomainRequestStatus.REJECTED
-                        )
-
-            # Handle action needed reason change
-            if action_needed_reason_changed:
-                _, action_needed_reason_value = changes.get("action_needed_reason")
-                if action_needed_reason_value:
-                    entry["action_needed_reason"] = (
-                        ""
-                        if action_needed_reason_value == "None"
-                        else DomainRequest.ActionNeededReasons.get_action_needed_reason_label(
-                            action_needed_reason_value
-                        )
-                    )
-                    # Handle case where action needed reason changed but not status
-                    if not status_changed:
-                        entry["status"] = DomainRequest.DomainRequestStatus.get_status_label(
-                            DomainRequest.DomainRequestStatus.ACTION_NEEDED
-                        )
-
-            # Add actor and timestamp information
-            entry["actor"] = log_entry.actor
-            entry["timestamp"] = log_entry.timestamp
-
-            return entry
-
-        return None
+    def get_status_changelog_entry(self, status_change):
+        """Returns a status change as a dictionary of the labels shown in the status changelog."""
+        return {
+            "status": status_change.get_status_display() if status_change.status else None,
+            "rejection_reason": (
+                status_change.get_rejection_reason_display() if status_change.rejection_reason else None
+            ),
+            "action_needed_reason": (
+                status_change.get_action_needed_reason_display() if status_change.action_needed_reason else None
+            ),
+            "actor": status_change.actor,
+            "timestamp": status_change.timestamp,
+        }
 
 
 class TransitionDomainAdmin(ListHeaderAdmin):
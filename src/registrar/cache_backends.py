@@ -0,0 +1,133 @@
+"""Cache backends for the registrar, configured in settings.CACHES"""
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+# marks a missing entry, as None can be cached
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """
+    A per-process LRU cache in front of a cache shared by every worker.
+
+    LOCATION is the alias of the shared cache. Reads are answered by the process's own
+    copy when it has one, and otherwise fetched from the shared cache and kept locally.
+    Writes go to both.
+
+    Local copies are only kept for OPTIONS["LOCAL_TIMEOUT"] seconds (5 by default), as
+    a change made by another worker does not reach them: anything which must see other
+    workers' changes straight away, such as sessions, should use the shared cache.
+    OPTIONS["LOCAL_MAX_ENTRIES"] caps how many entries each process keeps (1000 by default).
+
+    Example:
+    CACHES = {
+        "default": {
+            "BACKEND": "registrar.cache_backends.TieredCache",
+            "LOCATION": "shared",
+        },
+        "shared": {...},
+    }
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = location
+        self.local_timeout = options.get("LOCAL_TIMEOUT", 5)
+        self.local = LocMemCache(
+            f"tiered:{location}",
+            {"TIMEOUT": self.local_timeout, "OPTIONS": {"MAX_ENTRIES": options.get("LOCAL_MAX_ENTRIES", 1000)}},
+        )
+
+    @property
+    def shared(self) -> BaseCache:
+        return caches[self._shared_alias]
+
+    def _local_timeout(self, timeout=DEFAULT_TIMEOUT):
+        """How long to keep a local copy of an entry stored for timeout seconds"""
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return self.local_timeout
+        return min(timeout, self.local_timeout)
+
+    def _keep_locally(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_timeout = self._local_timeout(timeout)
+        if local_timeout > 0:
+            self.local.set(key, value, local_timeout, version=version)
+        else:
+            self.local.delete(key, version=version)
+
+    def get(self, key, default=None, version=None):
+        value = self.local.get(key, _MISSING, version=version)
+        if value is not _MISSING:
+            return value
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self._keep_locally(key, value, version=version)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = self.local.get_many(keys, version=version)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            fetched = self.shared.get_many(missing, version=version)
+            for key, value in fetched.items():
+                self._keep_locally(key, value, version=version)
+            found.update(fetched)
+        return found
+
+    def has_key(self, key, version=None):
+        return self.local.has_key(key, version=version) or self.shared.has_key(key, version=version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version=version)
+        self._keep_locally(key, value, timeout, version=version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self._keep_locally(key, value, timeout, version=version)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self._keep_locally(key, value, timeout, version=version)
+        else:
+            # another worker's entry wins, so drop any older local copy
+            self.local.delete(key, version=version)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        # counters are shared, so never answered locally
+        self.local.delete(key, version=version)
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self.local.delete(key, version=version)
+        return self.shared.decr(key, delta, version=version)
+
+    def delete(self, key, version=None):
+        self.local.delete(key, version=version)
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.local.delete_many(keys, version=version)
+        self.shared.delete_many(keys, version=version)
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
@@ -83,6 +83,28 @@ secret_registry_key = b64decode(secret("REGISTRY_KEY", ""))
 secret_registry_key_passphrase = secret("REGISTRY_KEY_PASSPHRASE", "")
 secret_registry_hostname = secret("REGISTRY_HOSTNAME")
 
+# Number of logged-in registry sessions each worker may hold open
+env_epp_connection_pool_size = env.int("EPP_CONNECTION_POOL_SIZE", 3)
+# Seconds a request will wait for a free registry session before giving up
+env_epp_connection_pool_timeout = env.int("EPP_CONNECTION_POOL_TIMEOUT", 30)
+# Seconds that registry data about a domain is shared between requests (0 disables)
+env_registry_cache_timeout = env.int("REGISTRY_CACHE_TIMEOUT", 60)
+# Seconds that the registry's answer to whether a domain is available is shared (0 disables)
+env_availability_cache_available_timeout = env.int("AVAILABILITY_CACHE_AVAILABLE_TIMEOUT", 60)
+env_availability_cache_taken_timeout = env.int("AVAILABILITY_CACHE_TAKEN_TIMEOUT", 3600)
+# Seconds that action needed emails rendered for the domain request admin are kept (0 disables)
+env_action_needed_email_cache_timeout = env.int("ACTION_NEEDED_EMAIL_CACHE_TIMEOUT", 3600)
+# Unfiltered admin changelists on tables estimated to have at least this many rows show the estimate
+env_admin_estimated_count_threshold = env.int("ADMIN_ESTIMATED_COUNT_THRESHOLD", 100000)
+# Exact admin changelist counts of at least this many rows are cached...
+env_admin_cached_count_threshold = env.int("ADMIN_CACHED_COUNT_THRESHOLD", 1000)
+# ...for this many seconds (0 disables)
+env_admin_count_cache_timeout = env.int("ADMIN_COUNT_CACHE_TIMEOUT", 60)
+# Where the cache shared by every worker is kept, see CACHES
+env_shared_cache_url = env.str("SHARED_CACHE_URL", "")
+# Seconds each worker keeps its own copy of cached values (0 disables)
+env_cache_local_timeout = env.int("CACHE_LOCAL_TIMEOUT", 5)
+
 # region: Basic Django Config-----------------------------------------------###
 
 # Build paths inside the project like this: BASE_DIR / "subdir".
@@ -131,6 +153,8 @@ INSTALLED_APPS = [
     # (and any other places you specify) into a single location
     # that can easily be served in production
     "django.contrib.staticfiles",
+    # postgres lookups and indexes, such as the trigram indexes searches use
+    "django.contrib.postgres",
     # application used for integrating with Login.gov
     "djangooidc",
     # library to simplify form templating
@@ -201,11 +225,37 @@ WSGI_APPLICATION = "registrar.config.wsgi.application"
 # https://docs.djangoproject.com/en/4.0/howto/static-files/
 
 
-CACHES = {
-    "default": {
+# The cache shared by every worker is the database, unless SHARED_CACHE_URL is
+# redis://... for a Redis-compatible server (which needs the redis package),
+# or file:///path/to/dir for a stand-in on the local filesystem
+if env_shared_cache_url.startswith(("redis://", "rediss://")):
+    shared_cache = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env_shared_cache_url,
+    }
+elif env_shared_cache_url.startswith("file://"):
+    shared_cache = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": env_shared_cache_url.removeprefix("file://"),
+    }
+else:
+    shared_cache = {
         "BACKEND": "django.core.cache.backends.db.DatabaseCache",
         "LOCATION": "cache_table",
     }
+
+CACHES = {
+    # each worker keeps recently used entries in memory for a few seconds,
+    # see registrar/cache_backends.py
+    "default": {
+        "BACKEND": "registrar.cache_backends.TieredCache",
+        "LOCATION": "shared",
+        "OPTIONS": {
+            "LOCAL_TIMEOUT": env_cache_local_timeout,
+        },
+    },
+    # for anything every worker must see changes to straight away
+    "shared": shared_cache,
 }
 
 # Absolute path to the directory where `collectstatic`
@@ -623,6 +673,35 @@ SECRET_REGISTRY_KEY = secret_registry_key
 SECRET_REGISTRY_KEY_PASSPHRASE = secret_registry_key_passphrase
 SECRET_REGISTRY_HOSTNAME = secret_registry_hostname
 
+# gunicorn runs gevent workers, so one worker serves many requests at once.
+# Each worker keeps a pool of up to this many registry sessions, created on demand.
+EPP_CONNECTION_POOL_SIZE = env_epp_connection_pool_size
+EPP_CONNECTION_POOL_TIMEOUT = env_epp_connection_pool_timeout
+
+# Registry data fetched for a domain is shared across requests through this cache,
+# see registrar/models/utility/registry_cache.py. It is invalidated after updates,
+# so it must not be a cache with per worker copies.
+REGISTRY_CACHE_ALIAS = "shared"
+REGISTRY_CACHE_TIMEOUT = env_registry_cache_timeout
+
+# Whether a domain is available is shared across requests through this cache,
+# see registrar/models/utility/availability_cache.py
+AVAILABILITY_CACHE_ALIAS = "default"
+AVAILABILITY_CACHE_AVAILABLE_TIMEOUT = env_availability_cache_available_timeout
+AVAILABILITY_CACHE_TAKEN_TIMEOUT = env_availability_cache_taken_timeout
+
+# Admin changelists count their rows through this cache, or estimate them on large
+# tables, see registrar/utility/admin_counts.py
+ADMIN_COUNT_CACHE_ALIAS = "default"
+ADMIN_ESTIMATED_COUNT_THRESHOLD = env_admin_estimated_count_threshold
+ADMIN_CACHED_COUNT_THRESHOLD = env_admin_cached_count_threshold
+ADMIN_COUNT_CACHE_TIMEOUT = env_admin_count_cache_timeout
+
+# The action needed emails previewed on the domain request change form are kept in this
+# cache between page loads, see DomainRequestAdmin.get_all_action_needed_reason_emails_as_json
+ACTION_NEEDED_EMAIL_CACHE_ALIAS = "default"
+ACTION_NEEDED_EMAIL_CACHE_TIMEOUT = env_action_needed_email_cache_timeout
+
 # endregion
 # region: Security and Privacy----------------------------------------------###
 
@@ -749,8 +828,12 @@ SESSION_COOKIE_SAMESITE = "Lax"
 # instruct browser to only send cookie via HTTPS
 SESSION_COOKIE_SECURE = True
 
-# session engine to cache session information
-SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+# session engine to cache session information, which only writes
+# sessions back when they change, see registrar/session_backend.py
+SESSION_ENGINE = "registrar.session_backend"
+
+# sessions must not be read from a worker's own, possibly stale, copy
+SESSION_CACHE_ALIAS = "shared"
 
 # ~ Set by django.middleware.clickjacking.XFrameOptionsMiddleware
 # prevent clickjacking by instructing the browser not to load
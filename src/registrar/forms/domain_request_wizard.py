@@ -1,6 +1,7 @@
 from __future__ import annotations  # allows forward references in annotations
 import logging
 from api.views import DOMAIN_API_MESSAGES
+from epplibwrapper.errors import RegistryError
 from phonenumber_field.formfields import PhoneNumberField  # type: ignore
 
 from django import forms
@@ -291,6 +292,34 @@ class AlternativeDomainForm(RegistrarForm):
 class BaseAlternativeDomainFormSet(RegistrarFormSet):
     JOIN = "alternative_domains"
 
+    def full_clean(self):
+        """Checks the availability of every alternative domain in one registry call,
+        so that each form's validation finds its answer in the availability cache."""
+        if self.is_bound:
+            self.check_availability()
+        super().full_clean()
+
+    def check_availability(self):
+        """Checks the availability of the submitted alternative domains which look valid"""
+        domains = []
+        for form in self.forms:
+            try:
+                domain = DraftDomain._validate_domain_string(
+                    form.data.get(form.add_prefix("alternative_domain")), blank_ok=True
+                )
+            except ValueError:
+                # reported by the form's own validation
+                continue
+            if domain:
+                domains.append(f"{domain}.gov")
+
+        if len(domains) > 1:
+            try:
+                Domain.available_many(domains)
+            except RegistryError as err:
+                # each form will check, and report the error, for itself
+                logger.warning(f"Could not check alternative domains' availability: {err}")
+
     def should_delete(self, cleaned):
         domain = cleaned.get("alternative_domain", "")
         return domain.strip() == ""
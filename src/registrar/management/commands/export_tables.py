@@ -1,10 +1,11 @@
-from django.core.paginator import Paginator
+import csv
+import itertools
 import logging
 import os
 import pyzipper
-import tablib
 from django.core.management import BaseCommand
 import registrar.admin
+from registrar.management.commands.utility.batch_helper import run_in_processes
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,18 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = "Exports tables in csv format to zip file in tmp directory."
 
+    # The most rows to write to each csv file
+    rows_per_file = 10000
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="How many tables to export at once, each in its own process. Defaults to 1.",
+        )
+
     def handle(self, **options):
         """Generates CSV files for specified tables and creates a zip archive"""
         table_names = [
@@ -32,8 +45,8 @@ class Command(BaseCommand):
         # Ensure the tmp directory exists
         os.makedirs("tmp", exist_ok=True)
 
-        for table_name in table_names:
-            self.export_table(table_name)
+        # Tables are exported independently of each other, so can be exported at once
+        run_in_processes(export_table, table_names, workers=options.get("workers", 1))
 
         # Create a zip file containing all the CSV files
         zip_filename = "tmp/exported_tables.zip"
@@ -57,37 +70,35 @@ class Command(BaseCommand):
                     logger.info(f"Removed {file_path}")
 
     def export_table(self, table_name):
-        """Export a given table to csv files in the tmp directory"""
+        """Export a given table to csv files in the tmp directory.
+
+        Rows are read with a database cursor and written as they are read, rows_per_file
+        rows to a file, so no more than one file's worth of the table is held in memory."""
         resourcename = f"{table_name}Resource"
         try:
             resourceclass = getattr(registrar.admin, resourcename)
-            dataset = resourceclass().export()
-            if not isinstance(dataset, tablib.Dataset):
-                raise ValueError(f"Exported data from {resourcename} is not a tablib.Dataset")
-
-            # Determine the number of rows per file
-            rows_per_file = 10000
-
-            # Use Paginator to handle splitting the dataset
-            paginator = Paginator(dataset.dict, rows_per_file)
-            num_files = paginator.num_pages
-
-            logger.info(f"splitting {table_name} into {num_files} files")
-
-            # Export each page to a separate file
-            for page_num in paginator.page_range:
-                page = paginator.page(page_num)
-
-                # Create a new dataset for the chunk
-                chunk = tablib.Dataset(headers=dataset.headers)
-                for row_dict in page.object_list:
-                    row = [row_dict[header] for header in dataset.headers]
-                    chunk.append(row)
-
-                # Export the chunk to a new file
-                filename = f"tmp/{table_name}_{page_num}.csv"
-                with open(filename, "w") as f:
-                    f.write(chunk.export("csv"))
+            resource = resourceclass()
+            headers = resource.get_export_headers()
+            queryset = resource.filter_export(resource.get_queryset())
+            # iter_queryset reads the table in chunks (with a server-side cursor on postgres)
+            rows = (resource.export_resource(obj) for obj in resource.iter_queryset(queryset))
+
+            num_files = 0
+            while True:
+                chunk = list(itertools.islice(rows, self.rows_per_file))
+                # An empty table still gets a file, with just the headers
+                if not chunk and num_files > 0:
+                    break
+
+                num_files += 1
+                filename = f"tmp/{table_name}_{num_files}.csv"
+                with open(filename, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(headers)
+                    writer.writerows(chunk)
+
+                if len(chunk) < self.rows_per_file:
+                    break
 
             logger.info(f"Successfully exported {table_name} into {num_files} files.")
 
@@ -95,3 +106,8 @@ class Command(BaseCommand):
             logger.error(f"Resource class {resourcename} not found in registrar.admin")
         except Exception as e:
             logger.error(f"Failed to export {table_name}: {e}")
+
+
+def export_table(table_name):
+    """Exports table_name. Used to export tables in other processes."""
+    Command().export_table(table_name)
@@ -1,22 +1,26 @@
 """Data migration: Extends expiration dates for valid domains"""
 
 import argparse
+from collections import defaultdict
 from datetime import date
 import logging
 
 from django.core.management import BaseCommand
+from django.utils import timezone
+from epplibwrapper import CLIENT as registry, commands, common as epp
 from epplibwrapper.errors import RegistryError
 from registrar.models import Domain
-from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
+from registrar.management.commands.utility.batch_helper import Checkpoint
+from registrar.management.commands.utility.terminal_helper import (
+    BatchProgress,
+    ScriptDataHelper,
+    TerminalColors,
+    TerminalHelper,
+)
+from registrar.models.utility.registry_cache import registry_cache
 
 from registrar.models.transition_domain import TransitionDomain
 
-try:
-    from epplib.exceptions import TransportError
-except ImportError:
-    pass
-
-
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +53,29 @@ class Command(BaseCommand):
         parser.add_argument(
             "--disableIdempotentCheck", action=argparse.BooleanOptionalAction, help="Disable script idempotence"
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help=(
+                "How many registry commands to send at once. "
+                "Defaults to (and is capped by) the registry connection pool size."
+            ),
+        )
+        parser.add_argument(
+            "--batchSize",
+            type=int,
+            default=100,
+            help="How many domains to renew between progress journal entries. Defaults to 100.",
+        )
+        parser.add_argument(
+            "--journalFile",
+            default=None,
+            help=(
+                "A file to record progress in after each batch. If it exists, the script resumes "
+                "after the last domain it records. It is removed once every domain has been handled."
+            ),
+        )
         parser.add_argument("--debug", action=argparse.BooleanOptionalAction, help="Increases log chattiness")
 
     def handle(self, **options):
@@ -58,6 +85,13 @@ class Command(BaseCommand):
         If a parse limit is set and it's less than the total number of valid domains,
         the number of domains to change is set to the parse limit.
 
+        Domains are handled in batches, in order of name. Each batch sends its InfoDomain
+        commands, and then its RenewDomain commands, concurrently over the registry
+        connection pool (manage.py patches the standard library for gevent, see
+        GEVENT_COMMANDS), and saves the new expiration dates with a single bulk update.
+        After each batch, progress is written to the journal file (if given) so that an
+        interrupted run can pick up where it stopped.
+
         Includes an idempotence check.
         """
 
@@ -66,65 +100,158 @@ class Command(BaseCommand):
         limit_parse = options.get("limitParse")
         disable_idempotence = options.get("disableIdempotentCheck")
         debug = options.get("debug")
+        workers = options.get("workers")
+        batch_size = options.get("batchSize")
 
         # Does a check to see if parse_limit is a positive int.
         # Raise an error if not.
         self.check_if_positive_int(limit_parse, "limitParse")
+        self.check_if_positive_int(workers, "workers")
+        if batch_size < 1:
+            raise argparse.ArgumentTypeError(
+                f"{batch_size} is an invalid integer value for batchSize. Must be at least 1."
+            )
+
+        journal = Checkpoint(options.get("journalFile"))
+        progress_so_far = journal.load() or {}
+        last_name = progress_so_far.get("last_name", "")
+        self.update_success = progress_so_far.get("update_success", [])
+        self.update_skipped = progress_so_far.get("update_skipped", [])
+        self.update_failed = progress_so_far.get("update_failed", [])
 
         valid_domains = Domain.objects.filter(
             expiration_date__gte=self.expiration_minimum_cutoff,
             expiration_date__lte=self.expiration_maximum_cutoff,
             state=Domain.State.READY,
         ).order_by("name")
+        remaining_domains = valid_domains.filter(name__gt=last_name)
 
-        domains_to_change_count = valid_domains.count()
+        domains_to_change_count = remaining_domains.count()
         if limit_parse != 0:
-            domains_to_change_count = limit_parse
-            valid_domains = valid_domains[:limit_parse]
+            domains_to_change_count = min(limit_parse, domains_to_change_count)
 
         # Determines if we should continue code execution or not.
         # If the user prompts 'N', a sys.exit() will be called.
         self.prompt_user_to_proceed(extension_amount, domains_to_change_count)
 
-        for domain in valid_domains:
-            try:
-                is_idempotent = self.idempotence_check(domain, extension_amount)
-                if not disable_idempotence and not is_idempotent:
-                    self.update_skipped.append(domain.name)
-                    logger.info(f"{TerminalColors.YELLOW}" f"Skipping update for {domain}" f"{TerminalColors.ENDC}")
-                else:
-                    domain.renew_domain(extension_amount)
-                    self.update_success.append(domain.name)
-                    logger.info(
-                        f"{TerminalColors.OKCYAN}"
-                        f"Successfully updated expiration date for {domain}"
-                        f"{TerminalColors.ENDC}"
-                    )
-            # Catches registry errors. Failures indicate bad data, or a faulty connection.
-            except (RegistryError, KeyError, TransportError) as err:
-                self.update_failed.append(domain.name)
-                logger.error(
-                    f"{TerminalColors.FAIL}" f"Failed to update expiration date for {domain}" f"{TerminalColors.ENDC}"
+        # The idempotence data for every domain, in one query
+        self.transition_expiration_dates = self.get_transition_expiration_dates(remaining_domains)
+
+        progress = BatchProgress(domains_to_change_count, label="domains")
+        try:
+            while progress.processed < domains_to_change_count:
+                batch = list(
+                    valid_domains.filter(name__gt=last_name)[
+                        : min(batch_size, domains_to_change_count - progress.processed)
+                    ]
+                )
+                if not batch:
+                    break
+                self.renew_batch(batch, extension_amount, disable_idempotence, workers)
+
+                last_name = batch[-1].name
+                journal.save(
+                    {
+                        "last_name": last_name,
+                        "update_success": self.update_success,
+                        "update_skipped": self.update_skipped,
+                        "update_failed": self.update_failed,
+                    }
                 )
-                logger.error(err)
-            except Exception as err:
-                self.log_script_run_summary(debug)
-                raise err
+                progress.record_batch(
+                    len(batch),
+                    updated=len(self.update_success),
+                    skipped=len(self.update_skipped),
+                    failed=len(self.update_failed),
+                )
+        except Exception as err:
+            self.log_script_run_summary(debug)
+            raise err
+
+        if not valid_domains.filter(name__gt=last_name).exists():
+            journal.clear()
+        logger.info(progress.summary())
         self.log_script_run_summary(debug)
 
+    def renew_batch(self, domains: list[Domain], extension_amount, disable_idempotence, workers):
+        """
+        Looks up each domain's current expiration date in the registry, then renews
+        those which pass the idempotence check and saves their new expiration dates.
+        """
+        info_responses = registry.send_many(
+            [commands.InfoDomain(name=domain.name) for domain in domains], cleaned=True, concurrency=workers
+        )
+
+        to_renew = []
+        for domain, response in zip(domains, info_responses):
+            if isinstance(response, RegistryError):
+                self.log_failure(domain, response)
+                continue
+            current_expiration_date = getattr(response.res_data[0], "ex_date", None)
+            if current_expiration_date is None:
+                self.log_failure(domain, "The registry did not return an expiration date")
+                continue
+
+            is_idempotent = self.idempotence_check(domain, current_expiration_date)
+            if not disable_idempotence and not is_idempotent:
+                self.update_skipped.append(domain.name)
+                logger.info(f"{TerminalColors.YELLOW}" f"Skipping update for {domain}" f"{TerminalColors.ENDC}")
+            else:
+                to_renew.append((domain, current_expiration_date))
+
+        period = epp.Period(extension_amount, epp.Unit.YEAR)
+        renew_responses = registry.send_many(
+            [
+                commands.RenewDomain(name=domain.name, cur_exp_date=current_expiration_date, period=period)
+                for domain, current_expiration_date in to_renew
+            ],
+            cleaned=True,
+            concurrency=workers,
+        )
+
+        renewed = []
+        for (domain, _), response in zip(to_renew, renew_responses):
+            if isinstance(response, RegistryError):
+                self.log_failure(domain, response)
+                continue
+            domain.expiration_date = response.res_data[0].ex_date
+            # bulk updates skip auto_now
+            domain.updated_at = timezone.now()
+            renewed.append(domain)
+
+        ScriptDataHelper.bulk_update_fields(Domain, renewed, ["expiration_date", "updated_at"])
+        for domain in renewed:
+            # other requests may hold the old expiration date
+            registry_cache.delete(domain.name)
+            self.update_success.append(domain.name)
+            logger.info(
+                f"{TerminalColors.OKCYAN}" f"Successfully updated expiration date for {domain}" f"{TerminalColors.ENDC}"
+            )
+
     # == Helper functions == #
-    def idempotence_check(self, domain: Domain, extension_amount):
+    def get_transition_expiration_dates(self, domains) -> dict[str, set[date]]:
+        """Returns the epp_expiration_dates of the TransitionDomains for domains, by domain name"""
+        expiration_dates = defaultdict(set)
+        transition_domains = TransitionDomain.objects.filter(domain_name__in=domains.values("name")).values_list(
+            "domain_name", "epp_expiration_date"
+        )
+        for domain_name, epp_expiration_date in transition_domains:
+            expiration_dates[domain_name].add(epp_expiration_date)
+        return expiration_dates
+
+    def idempotence_check(self, domain: Domain, current_expiration_date: date):
         """Determines if the proposed operation violates idempotency"""
         # Because our migration data had a hard stop date, we can determine if our change
         # is valid simply checking the date is within a valid range and it was updated
         # in epp or not.
         # CAVEAT: This is a workaround. A more robust solution would be a db flag
-        current_expiration_date = domain.registry_expiration_date
-        transition_domains = TransitionDomain.objects.filter(
-            domain_name=domain.name, epp_expiration_date=current_expiration_date
-        )
+        return current_expiration_date in self.transition_expiration_dates.get(domain.name, ())
 
-        return transition_domains.count() > 0
+    def log_failure(self, domain: Domain, err):
+        """Records that domain failed to update. Failures indicate bad data, or a faulty connection."""
+        self.update_failed.append(domain.name)
+        logger.error(f"{TerminalColors.FAIL}" f"Failed to update expiration date for {domain}" f"{TerminalColors.ENDC}")
+        logger.error(err)
 
     def prompt_user_to_proceed(self, extension_amount, domains_to_change_count):
         """Asks if the user wants to proceed with this action"""
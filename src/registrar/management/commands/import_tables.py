@@ -1,13 +1,17 @@
 import argparse
+import copy
 import logging
 import os
 import pyzipper
 import tablib
 from django.apps import apps
 from django.conf import settings
-from django.db import transaction
+from django.db import models, transaction
 from django.core.management import BaseCommand
+from import_export.instance_loaders import CachedInstanceLoader
 import registrar.admin
+from registrar.management.commands.utility.batch_helper import run_in_processes
+from registrar.models import PublicContact
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +19,21 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = "Imports tables from a zip file, exported_tables.zip, containing CSV files in the tmp directory."
 
+    # How many rows to insert or update at a time, for tables imported in bulk
+    batch_size = 1000
+
     def add_arguments(self, parser):
         """Add command line arguments."""
         parser.add_argument("--skipEppSave", default=True, action=argparse.BooleanOptionalAction)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "How many tables to import at once, each in its own process. Tables are only "
+                "imported alongside tables they have no foreign keys to. Defaults to 1."
+            ),
+        )
 
     def handle(self, **options):
         """Extracts CSV files from a zip archive and imports them into the respective tables"""
@@ -56,9 +72,46 @@ class Command(BaseCommand):
             zipf.extractall("tmp")
             logger.info(f"Extracted zip file {zip_filename} into tmp directory")
 
-        # Import each CSV file
+        # Import each CSV file, a group of tables at a time
+        for group in self.group_tables_by_dependency(table_names):
+            run_in_processes(import_table, group, [self.skip_epp_save] * len(group), workers=options.get("workers", 1))
+
+    def group_tables_by_dependency(self, table_names):
+        """Splits table_names, which are in an order where tables come after the tables they
+        have foreign keys to, into groups (in the same order) which can be imported at the same time.
+        No table in a group has a foreign key to another table in that group."""
+        groups = []
+        group_models: set = set()
         for table_name in table_names:
-            self.import_table(table_name)
+            model = apps.get_model("registrar", table_name)
+            related_models = {
+                field.related_model for field in model._meta.get_fields() if field.concrete and field.is_relation
+            }
+            if not groups or related_models & group_models:
+                groups.append([])
+                group_models = set()
+            groups[-1].append(table_name)
+            group_models.add(model)
+        return groups
+
+    def get_resource(self, resourceclass):
+        """Returns an instance of resourceclass, set up to import in bulk where that is safe"""
+        resource = resourceclass()
+        # Options are shared by every instance of the resource class, so change a copy
+        resource._meta = copy.copy(resource._meta)
+        # Reads the existing rows for each file in one query, rather than one per row
+        resource._meta.instance_loader_class = CachedInstanceLoader
+        if self.can_import_in_bulk(resource._meta.model):
+            resource._meta.use_bulk = True
+            resource._meta.batch_size = self.batch_size
+        return resource
+
+    def can_import_in_bulk(self, model):
+        """Bulk imports skip save() and many to many fields, so are only used for models which
+        have neither (or, with skipEppSave, PublicContact, whose save only adds saving to the registry)"""
+        if model._meta.many_to_many:
+            return False
+        return model.save is models.Model.save or (model is PublicContact and self.skip_epp_save)
 
     def import_table(self, table_name):
         """Import data from a CSV file into the given table"""
@@ -77,7 +130,7 @@ class Command(BaseCommand):
         pattern = f"{table_name}_"
 
         resourceclass = getattr(registrar.admin, resourcename)
-        resource_instance = resourceclass()
+        resource_instance = self.get_resource(resourceclass)
 
         # Find all files that match the pattern
         matching_files = [file for file in os.listdir(tmp_dir) if file.startswith(pattern)]
@@ -118,3 +171,10 @@ class Command(BaseCommand):
             logger.error(f"Model for table {table_name} not found.")
         except Exception as e:
             logger.error(f"Error cleaning table {table_name}: {e}")
+
+
+def import_table(table_name, skip_epp_save):
+    """Imports table_name. Used to import tables in other processes."""
+    command = Command()
+    command.skip_epp_save = skip_epp_save
+    command.import_table(table_name)
@@ -54,6 +54,12 @@ class Command(BaseCommand):
 
         parser.add_argument("--directory", default="migrationdata", help="Desired directory")
 
+        parser.add_argument(
+            "--index_files",
+            action=argparse.BooleanOptionalAction,
+            help="Indexes rows of the adhoc files on disk rather than holding them in memory",
+        )
+
     def handle(self, migration_json_filename, **options):
         """Load organization address data into the TransitionDomain
         and DomainInformation tables by using the organization adhoc file and domain_additional file"""
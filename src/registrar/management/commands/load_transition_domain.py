@@ -9,11 +9,14 @@ from collections import defaultdict
 from django.conf import settings
 
 from django.core.management import BaseCommand
+from django.db import transaction
 from registrar.management.commands.utility.epp_data_containers import EnumFilenames
 
 from registrar.models import TransitionDomain
+from registrar.utility.audit_log import log_bulk_update
 
 from registrar.management.commands.utility.terminal_helper import (
+    ScriptDataHelper,
     TerminalColors,
     TerminalHelper,
 )
@@ -60,6 +63,12 @@ class Command(BaseCommand):
             action=argparse.BooleanOptionalAction,
         )
 
+        parser.add_argument(
+            "--index_files",
+            action=argparse.BooleanOptionalAction,
+            help="Indexes rows of the adhoc files on disk rather than holding them in memory",
+        )
+
         # This option should only be available when developing locally.
         # This should not be available to the end user.
         if settings.DEBUG:
@@ -420,6 +429,15 @@ class Command(BaseCommand):
         # Parse the domain_contacts file and create TransitionDomain objects,
         # using the dictionaries from steps 1 & 2 to lookup needed information.
         to_create = []
+        to_update = {}
+
+        # entries already in the table, and those about to be created,
+        # so that each row is checked without a query of its own
+        existing_entries = defaultdict(list)
+        for existing_entry in TransitionDomain.objects.order_by("id"):
+            existing_entries[(existing_entry.username, existing_entry.domain_name)].append(existing_entry)
+        to_create_domain_names = set()
+        to_create_domain_user_pairs = {}
 
         # keep track of statuses that don't match our available
         # status values
@@ -500,15 +518,8 @@ class Command(BaseCommand):
                 # However, track duplicate domains for now,
                 # since we are still deciding on whether
                 # to make this field unique or not. ~10/25/2023
-                existing_domain = next(
-                    (x for x in to_create if x.domain_name == new_entry_domain_name),
-                    None,
-                )
-                existing_domain_user_pair = next(
-                    (x for x in to_create if x.username == new_entry_email and x.domain_name == new_entry_domain_name),
-                    None,
-                )
-                if existing_domain is not None:
+                existing_domain_user_pair = to_create_domain_user_pairs.get((new_entry_email, new_entry_domain_name))
+                if new_entry_domain_name in to_create_domain_names:
                     # DEBUG:
                     TerminalHelper.print_conditional(
                         debug_on,
@@ -526,15 +537,10 @@ class Command(BaseCommand):
                     if existing_domain_user_pair not in duplicate_domain_user_combos:
                         duplicate_domain_user_combos.append(existing_domain_user_pair)
                 else:
-                    entry_exists = TransitionDomain.objects.filter(
-                        username=new_entry_email, domain_name=new_entry_domain_name
-                    ).exists()
-                    if entry_exists:
-                        try:
-                            existing_entry = TransitionDomain.objects.get(
-                                username=new_entry_email,
-                                domain_name=new_entry_domain_name,
-                            )
+                    matching_entries = existing_entries.get((new_entry_email, new_entry_domain_name))
+                    if matching_entries:
+                        if len(matching_entries) == 1:
+                            existing_entry = matching_entries[0]
 
                             if not existing_entry.processed:
                                 if existing_entry.status != new_entry_status:
@@ -548,7 +554,7 @@ class Command(BaseCommand):
                                     )
                                     existing_entry.status = new_entry_status
                                 existing_entry.email_sent = new_entry_emailSent
-                                existing_entry.save()
+                                to_update[existing_entry.id] = existing_entry
                             else:
                                 TerminalHelper.print_conditional(
                                     debug_on,
@@ -557,7 +563,7 @@ class Command(BaseCommand):
                                     f"{TerminalColors.ENDC}",
                                 )
 
-                        except TransitionDomain.MultipleObjectsReturned:
+                        else:
                             logger.info(
                                 f"{TerminalColors.FAIL}"
                                 f"!!! ERROR: duplicate entries exist in the"
@@ -577,6 +583,8 @@ class Command(BaseCommand):
                             processed=False,
                         )
                         to_create.append(new_entry)
+                        to_create_domain_names.add(new_entry_domain_name)
+                        to_create_domain_user_pairs[(new_entry_email, new_entry_domain_name)] = new_entry
                         total_new_entries += 1
 
                         # DEBUG:
@@ -594,7 +602,11 @@ class Command(BaseCommand):
                     )
                     break
 
-        TransitionDomain.objects.bulk_create(to_create)
+        with transaction.atomic():
+            TransitionDomain.objects.bulk_create(to_create)
+            log_bulk_update(to_update.values(), ["status", "email_sent"])
+            ScriptDataHelper.bulk_update_fields(TransitionDomain, list(to_update.values()), ["status", "email_sent"])
+        total_updated_domain_entries = len(to_update)
         # Print a summary of findings (duplicate entries,
         # missing data..etc.)
         self.print_summary_duplications(duplicate_domain_user_combos, duplicate_domains, users_without_email)
@@ -0,0 +1,93 @@
+"""Records the domain request status changes already in the audit log as DomainRequestStatusChanges"""
+
+import argparse
+import itertools
+import logging
+
+from auditlog.models import LogEntry  # type: ignore
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import BaseCommand
+
+from registrar.management.commands.utility.terminal_helper import BatchProgress, TerminalColors, TerminalHelper
+from registrar.models import DomainRequest, DomainRequestStatusChange
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Reads the audit log entries for domain requests which changed the status, rejection reason or "
+        "action needed reason, and records each as a DomainRequestStatusChange for the status changelog. "
+        "Entries which are already recorded, or whose domain request no longer exists, are skipped."
+    )
+
+    # the fields whose changes are recorded
+    tracked_fields = ["status", "rejection_reason", "action_needed_reason"]
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--batchSize",
+            type=int,
+            default=1000,
+            help="How many audit log entries to read and record at a time. Defaults to 1000.",
+        )
+        parser.add_argument("--disablePrompts", action=argparse.BooleanOptionalAction, help="Skip the prompt")
+
+    def handle(self, **options):
+        """Walks through the audit log entries in order of id, recording one batch at a time with a bulk create"""
+        batch_size = options.get("batchSize")
+        if batch_size < 1:
+            raise argparse.ArgumentTypeError("batchSize must be at least 1.")
+
+        log_entries = (
+            LogEntry.objects.filter(
+                content_type=ContentType.objects.get_for_model(DomainRequest),
+                changes__has_any_keys=self.tracked_fields,
+            )
+            .exclude(action=LogEntry.Action.DELETE)
+            .only("id", "object_id", "action", "changes", "actor_id", "timestamp")
+            .order_by("id")
+        )
+        total = log_entries.count()
+
+        if not options.get("disablePrompts"):
+            TerminalHelper.prompt_for_execution(
+                system_exit_on_terminate=True,
+                info_to_inspect=f"""
+                ==Proposed Changes==
+                Audit log entries to read: {total}
+                Changes to these fields will be recorded: {self.tracked_fields}
+                """,
+                prompt_title="Do you wish to record domain request status changes?",
+            )
+
+        domain_request_ids = set(DomainRequest.objects.values_list("id", flat=True))
+        recorded_log_entry_ids = set(
+            DomainRequestStatusChange.objects.filter(log_entry__isnull=False).values_list("log_entry_id", flat=True)
+        )
+
+        created = 0
+        skipped = 0
+        progress = BatchProgress(total, label="audit log entries")
+        iterator = log_entries.iterator(chunk_size=batch_size)
+        while batch := list(itertools.islice(iterator, batch_size)):
+            to_create = []
+            for log_entry in batch:
+                if log_entry.id in recorded_log_entry_ids or log_entry.object_id not in domain_request_ids:
+                    skipped += 1
+                    continue
+                status_change = DomainRequestStatusChange.from_log_entry(log_entry)
+                if status_change is not None:
+                    to_create.append(status_change)
+
+            DomainRequestStatusChange.objects.bulk_create(to_create)
+            created += len(to_create)
+            progress.record_batch(len(batch), recorded=created, skipped=skipped)
+
+        logger.info(
+            f"{TerminalColors.OKGREEN}"
+            f"============= FINISHED =============== {progress.summary()}\n"
+            f"Recorded {created} status changes, skipped {skipped} audit log entries"
+            f"{TerminalColors.ENDC}"
+        )
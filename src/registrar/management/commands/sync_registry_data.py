@@ -0,0 +1,222 @@
+"""Brings the expiration and creation dates stored for domains in line with the registry"""
+
+import argparse
+import logging
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from epplibwrapper import CLIENT as registry, commands, ErrorCode, RegistryError
+from registrar.management.commands.utility.batch_helper import Checkpoint, RateLimiter
+from registrar.management.commands.utility.terminal_helper import (
+    BatchProgress,
+    ScriptDataHelper,
+    TerminalColors,
+    TerminalHelper,
+)
+from registrar.models import Domain
+from registrar.models.utility.registry_cache import registry_cache
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Sends InfoDomain for every domain, in batches, and updates the expiration and creation dates "
+        "stored in the database where they differ from the registry's. "
+        "Domains whose hold status differs from the registry's are reported, but not changed. "
+        "Domains in the unknown state are synced too, but their state is not fixed here: that adds any "
+        "missing contacts to the registry, so is still done when the domain is next viewed. Unknown "
+        "domains which are not in the registry yet are skipped. Deleted domains are no longer in the "
+        "registry, so are not synced."
+    )
+
+    # the fields this script updates
+    fields_to_update = ["expiration_date", "created_at", "updated_at"]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.updated = []
+        self.unchanged = []
+        self.failed = []
+        self.hold_mismatches = []
+        self.unknown_in_registry = []
+        self.not_in_registry = []
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--batchSize",
+            type=int,
+            default=100,
+            help="How many domains to read, send InfoDomain for and update at a time. Defaults to 100.",
+        )
+        parser.add_argument(
+            "--rateLimit",
+            type=float,
+            default=10,
+            help="The most InfoDomain commands to send per second, on average. 0 turns the limit off. Defaults to 10.",
+        )
+        parser.add_argument(
+            "--checkpointFile",
+            default=None,
+            help=(
+                "A file to record progress in after each batch. If it exists, the script resumes "
+                "after the last domain it records. It is removed once every domain has been synced."
+            ),
+        )
+        parser.add_argument(
+            "--limitParse",
+            type=int,
+            default=0,
+            help="Sets a cap on the number of domains to sync",
+        )
+        parser.add_argument("--disablePrompts", action=argparse.BooleanOptionalAction, help="Skip the prompt")
+        parser.add_argument("--debug", action=argparse.BooleanOptionalAction, help="Increases log chattiness")
+
+    def handle(self, **options):
+        """
+        Walks through domains in order of id, one batch at a time. Each batch sends its InfoDomain
+        commands concurrently over the registry connection pool (see EPPConnectionPool.send_many).
+        They only overlap when run through manage.py, which patches the standard library for gevent
+        (see GEVENT_COMMANDS). Each batch then saves the changed domains with a bulk update and
+        records a checkpoint.
+        """
+        batch_size = options.get("batchSize")
+        limit_parse = options.get("limitParse")
+        if batch_size < 1 or limit_parse < 0 or options.get("rateLimit") < 0:
+            raise argparse.ArgumentTypeError(
+                "batchSize must be at least 1, and limitParse and rateLimit cannot be negative."
+            )
+
+        checkpoint = Checkpoint(options.get("checkpointFile"))
+        last_id = (checkpoint.load() or {}).get("last_id", 0)
+
+        domains = Domain.objects.exclude(state=Domain.State.DELETED).order_by("id")
+        total = domains.filter(id__gt=last_id).count()
+        if limit_parse:
+            total = min(total, limit_parse)
+
+        if not options.get("disablePrompts"):
+            TerminalHelper.prompt_for_execution(
+                system_exit_on_terminate=True,
+                info_to_inspect=f"""
+                ==Proposed Changes==
+                Domains to sync with the registry: {total}
+                These fields will be updated where they differ: {self.fields_to_update}
+                Batch size: {batch_size}, at most {options.get("rateLimit")} InfoDomain commands per second
+                """,
+                prompt_title="Do you wish to sync domains with the registry?",
+            )
+
+        rate_limiter = RateLimiter(options.get("rateLimit"))
+        progress = BatchProgress(total, label="domains")
+        while progress.processed < total:
+            batch = list(
+                domains.filter(id__gt=last_id).only("id", "name", "state", "expiration_date", "created_at")[
+                    : min(batch_size, total - progress.processed)
+                ]
+            )
+            if not batch:
+                break
+            rate_limiter.wait(len(batch))
+            self.sync_batch(batch)
+
+            last_id = batch[-1].id
+            checkpoint.save({"last_id": last_id})
+            progress.record_batch(len(batch), updated=len(self.updated), failed=len(self.failed))
+
+        # only a run which reached the last domain is done with the checkpoint
+        if not domains.filter(id__gt=last_id).exists():
+            checkpoint.clear()
+        self.log_script_run_summary(progress, options.get("debug"))
+
+    def sync_batch(self, batch: list[Domain]):
+        """Sends InfoDomain for each domain in batch, and saves those whose dates differ from the registry"""
+        responses = registry.send_many([commands.InfoDomain(name=domain.name) for domain in batch], cleaned=True)
+
+        to_update = []
+        for domain, response in zip(batch, responses):
+            if isinstance(response, RegistryError):
+                # domains start out unknown, until they are created in the registry
+                if domain.state == Domain.State.UNKNOWN and response.code == ErrorCode.OBJECT_DOES_NOT_EXIST:
+                    self.not_in_registry.append(domain.name)
+                    continue
+                self.failed.append(domain.name)
+                logger.error(
+                    f"{TerminalColors.FAIL}"
+                    f"Failed to get {domain.name} from the registry: {response}"
+                    f"{TerminalColors.ENDC}"
+                )
+                continue
+            if self.update_from_registry(domain, response.res_data[0]):
+                to_update.append(domain)
+            else:
+                self.unchanged.append(domain.name)
+
+        if to_update:
+            ScriptDataHelper.bulk_update_fields(Domain, to_update, self.fields_to_update)
+            for domain in to_update:
+                self.updated.append(domain.name)
+                # views read dates from the shared registry cache too, which may now be stale
+                registry_cache.delete(domain.name)
+
+    def update_from_registry(self, domain: Domain, data) -> bool:
+        """Sets domain's dates to those in the InfoDomain response data. Returns True if either changed."""
+        changed = False
+        expiration_date = getattr(data, "ex_date", None)
+        if expiration_date is not None and expiration_date != domain.expiration_date:
+            domain.expiration_date = expiration_date
+            changed = True
+
+        creation_date = getattr(data, "cr_date", None)
+        if creation_date is not None and creation_date != domain.created_at:
+            domain.created_at = creation_date
+            changed = True
+
+        if changed:
+            # bulk updates skip auto_now
+            domain.updated_at = timezone.now()
+
+        if domain.state == Domain.State.UNKNOWN:
+            # _fix_unknown_state sets the state when the domain is next viewed
+            self.unknown_in_registry.append(domain.name)
+            return changed
+
+        statuses = [status.state for status in getattr(data, "statuses", None) or []]
+        on_hold_in_registry = Domain.Status.CLIENT_HOLD in statuses
+        if on_hold_in_registry != (domain.state == Domain.State.ON_HOLD):
+            self.hold_mismatches.append(domain.name)
+            logger.warning(
+                f"{TerminalColors.YELLOW}{domain.name} is {domain.state} in the database, but "
+                f"{'has' if on_hold_in_registry else 'does not have'} clientHold in the registry"
+                f"{TerminalColors.ENDC}"
+            )
+        return changed
+
+    def log_script_run_summary(self, progress: BatchProgress, debug):
+        """Logs counts, throughput and (with debug) the affected domains"""
+        TerminalHelper.log_script_run_summary(
+            self.updated,
+            self.failed,
+            [],
+            debug=debug,
+            log_header=f"============= FINISHED =============== {progress.summary()}",
+        )
+        logger.info(f"{len(self.unchanged)} domains already matched the registry")
+        if self.not_in_registry:
+            logger.info(f"{len(self.not_in_registry)} domains in the unknown state are not in the registry yet")
+        if self.unknown_in_registry:
+            logger.warning(
+                f"{TerminalColors.YELLOW}"
+                f"{len(self.unknown_in_registry)} domains in the registry are in the unknown state in the database. "
+                f"Their state is fixed when they are next viewed: {self.unknown_in_registry}"
+                f"{TerminalColors.ENDC}"
+            )
+        if self.hold_mismatches:
+            logger.warning(
+                f"{TerminalColors.YELLOW}"
+                f"{len(self.hold_mismatches)} domains have a different hold status in the registry: "
+                f"{self.hold_mismatches}"
+                f"{TerminalColors.ENDC}"
+            )
@@ -0,0 +1,39 @@
+"""Records the numbers shown on the analytics page in an AnalyticsSnapshot."""
+
+import logging
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+from registrar.models import AnalyticsSnapshot
+from registrar.utility import csv_export
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Counts domains and domain requests for the analytics page and stores them in an AnalyticsSnapshot, "
+        "so that the page does not recount them on every load."
+    )
+
+    def add_arguments(self, parser):
+        """Add our optional arguments."""
+        parser.add_argument(
+            "--keep_days",
+            type=int,
+            default=7,
+            help="Snapshots older than this many days are deleted. Defaults to 7.",
+        )
+
+    def handle(self, **options):
+        """Takes a new snapshot, then deletes old ones"""
+        logger.info("Taking analytics snapshot...")
+        snapshot = csv_export.take_analytics_snapshot()
+        logger.info(f"Success! Created {snapshot} with {snapshot.counts.count()} counts")
+
+        cutoff = timezone.now() - timedelta(days=options.get("keep_days"))
+        _, deleted = AnalyticsSnapshot.objects.filter(created_at__lt=cutoff).exclude(id=snapshot.id).delete()
+        if deleted:
+            logger.info(f"Deleted {deleted.get('registrar.AnalyticsSnapshot', 0)} old analytics snapshots")
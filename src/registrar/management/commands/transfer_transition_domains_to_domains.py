@@ -1,16 +1,21 @@
 import logging
 import argparse
 import sys
+from collections import defaultdict
 
 from django_fsm import TransitionNotAllowed  # type: ignore
 
 from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
 
 from registrar.models import TransitionDomain
 from registrar.models import Domain
 from registrar.models import DomainInvitation
+from registrar.utility.audit_log import log_bulk_create, log_bulk_update
 
 from registrar.management.commands.utility.terminal_helper import (
+    ScriptDataHelper,
     TerminalColors,
     TerminalHelper,
 )
@@ -30,6 +35,14 @@ class Command(BaseCommand):
     entries for every domain we ADD (but not for domains
     we UPDATE)"""
 
+    # the fields of existing domain information which transition domains overwrite
+    domain_information_fields_to_update = [
+        "generic_org_type",
+        "federal_type",
+        "federal_agency",
+        "organization_name",
+    ]
+
     # ======================================================
     # ===================== ARGUMENTS  =====================
     # ======================================================
@@ -42,6 +55,12 @@ class Command(BaseCommand):
             help="Sets max number of entries to load, set to 0 to load all entries",
         )
 
+        parser.add_argument(
+            "--batchSize",
+            default=1000,
+            help="Sets the number of entries to transfer in each transaction",
+        )
+
     # ======================================================
     # ===================== PRINTING  ======================
     # ======================================================
@@ -122,12 +141,8 @@ class Command(BaseCommand):
             )
 
         # determine domainInvitations we SKIPPED
-        skipped_domain_invitations = []
-        for domain in domains_to_create:
-            skipped_domain_invitations.append(domain)
-        for domain_invite in domain_invitations_to_create:
-            if domain_invite.domain in skipped_domain_invitations:
-                skipped_domain_invitations.remove(domain_invite.domain)
+        invited_domain_names = {domain_invite.domain.name for domain_invite in domain_invitations_to_create}
+        skipped_domain_invitations = [domain for domain in domains_to_create if domain.name not in invited_domain_names]
         if len(skipped_domain_invitations) > 0:
             logger.info(
                 f"""{TerminalColors.FAIL}
@@ -152,13 +167,43 @@ class Command(BaseCommand):
             """,
         )
 
+    # ======================================================
+    # ==================  PRELOADING  ======================
+    # ======================================================
+    def load_existing_records(self, transition_domains):
+        """Reads the domains, domain information, invitations and senior official
+        contacts which already exist for transition_domains (a queryset), so that
+        each transition domain can be matched against them without a query of its own.
+        """
+        domain_names = transition_domains.values("domain_name")
+        self.existing_domains = {domain.name: domain for domain in Domain.objects.filter(name__in=domain_names)}
+        self.existing_domain_information = {
+            domain_information.domain.name: domain_information
+            for domain_information in DomainInformation.objects.filter(domain__name__in=domain_names).select_related(
+                "domain"
+            )
+        }
+        self.existing_invitations = set(
+            DomainInvitation.objects.filter(domain__name__in=domain_names).values_list("email", "domain__name")
+        )
+        self.contacts_by_email = defaultdict(list)
+        for contact in Contact.objects.filter(email__in=transition_domains.values("email")).order_by("id"):
+            self.contacts_by_email[contact.email].append(contact)
+
+        # Domains created by this run, by name
+        self.created_domains: dict[str, Domain] = {}
+        # Domain information created by this run, by domain name
+        self.created_domain_information: dict[str, DomainInformation] = {}
+
+        self.default_creator, _ = User.objects.get_or_create(username="System")
+
     # ======================================================
     # ===================    DOMAIN    =====================
     # ======================================================
     def update_or_create_domain(self, transition_domain: TransitionDomain, debug_on: bool):
         """Given a transition domain, either finds & updates an existing
-        corresponding domain, or creates a new corresponding domain in
-        the Domain table.
+        corresponding domain, or creates a new corresponding domain
+        (which is not saved here).
 
         Returns the corresponding Domain object and a boolean
         that is TRUE if that Domain was newly created.
@@ -170,12 +215,10 @@ class Command(BaseCommand):
         transition_domain_creation_date = transition_domain.epp_creation_date
         transition_domain_expiration_date = transition_domain.epp_expiration_date
 
-        domain_exists = Domain.objects.filter(name=transition_domain_name).exists()
-        if domain_exists:
+        target_domain = self.existing_domains.get(transition_domain_name)
+        if target_domain is not None:
             try:
                 # ----------------------- UPDATE DOMAIN -----------------------
-                # ---- GET THE DOMAIN
-                target_domain = Domain.objects.get(name=transition_domain_name)
                 # DEBUG:
                 TerminalHelper.print_conditional(
                     debug_on,
@@ -200,32 +243,9 @@ class Command(BaseCommand):
 
                 if transition_domain_expiration_date is not None:
                     target_domain.expiration_date = transition_domain_expiration_date
-                target_domain.save()
 
                 return (target_domain, False)
 
-            except Domain.MultipleObjectsReturned:
-                # This exception was thrown once before during testing.
-                # While the circumstances that led to corrupt data in
-                # the domain table was a freak accident, and the possibility of it
-                # happening again is safe-guarded by a key constraint,
-                # better to keep an eye out for it since it would require
-                # immediate attention.
-                logger.warning(
-                    f"""
-                    {TerminalColors.FAIL}
-                    !!! ERROR: duplicate entries already exist in the
-                    Domain table for the following domain:
-                    {transition_domain_name}
-
-                    RECOMMENDATION:
-                    This means the Domain table is corrupt.  Please
-                    check the Domain table data as there should be a key
-                    constraint which prevents duplicate entries.
-
-                    ----------TERMINATING----------"""
-                )
-                sys.exit()
             except TransitionNotAllowed as err:
                 logger.warning(
                     f"""{TerminalColors.FAIL}
@@ -256,7 +276,7 @@ class Command(BaseCommand):
 
     def update_domain_status(self, transition_domain: TransitionDomain, target_domain: Domain, debug_on: bool) -> bool:
         """Given a transition domain that matches an existing domain,
-        updates the existing domain object with that status of
+        updates the existing domain object (without saving it) with that status of
         the transition domain.
         Returns TRUE if an update was made.  FALSE if the states
         matched and no update was made"""
@@ -268,7 +288,6 @@ class Command(BaseCommand):
                 target_domain.place_client_hold(ignoreEPP=True)
             else:
                 target_domain.revert_client_hold(ignoreEPP=True)
-            target_domain.save()
 
             # DEBUG:
             TerminalHelper.print_conditional(
@@ -286,8 +305,8 @@ class Command(BaseCommand):
     # ================ DOMAIN INVITATION  ==================
     # ======================================================
     def try_add_domain_invitation(self, domain_email: str, associated_domain: Domain) -> DomainInvitation | None:
-        """If no domain invitation exists for the given domain and
-        e-mail, create and return a new domain invitation object.
+        """If no domain invitation exists (or is about to be created) for the given
+        domain and e-mail, create and return a new domain invitation object.
         If one already exists, or if the email is invalid, return NONE"""
 
         # this should never happen, but adding it just in case
@@ -312,10 +331,9 @@ class Command(BaseCommand):
         if domain_email is not None and domain_email != "":
             # check that a domain invitation doesn't already
             # exist for this e-mail / Domain pair
-            domain_email_already_in_domain_invites = DomainInvitation.objects.filter(
-                email=domain_email.lower(), domain=associated_domain
-            ).exists()
-            if not domain_email_already_in_domain_invites:
+            invitation_key = (domain_email.lower(), associated_domain.name)
+            if invitation_key not in self.existing_invitations:
+                self.existing_invitations.add(invitation_key)
                 # Create new domain invitation
                 new_domain_invitation = DomainInvitation(email=domain_email.lower(), domain=associated_domain)
                 return new_domain_invitation
@@ -325,57 +343,41 @@ class Command(BaseCommand):
     # ================ DOMAIN INFORMATION  =================
     # ======================================================
     def update_domain_information(self, current: DomainInformation, target: DomainInformation, debug_on: bool) -> bool:
+        """Copies the fields which transition domains set from target to current (without saving it)"""
         # DEBUG:
         TerminalHelper.print_conditional(
             debug_on,
             (f"{TerminalColors.OKCYAN}" f"Updating: {current}" f"{TerminalColors.ENDC}"),  # noqa
         )
 
-        updated = False
-
-        fields_to_update = [
-            "generic_org_type",
-            "federal_type",
-            "federal_agency",
-            "organization_name",
-        ]
-        defaults = {field: getattr(target, field) for field in fields_to_update}
-        if current != target:
-            current = target
-            DomainInformation.objects.filter(domain=current.domain).update(**defaults)
-            updated = True
-
-        return updated
+        for field in self.domain_information_fields_to_update:
+            setattr(current, field, getattr(target, field))
+        return True
 
     def update_contact_info(self, first_name, middle_name, last_name, email, phone):
-        contact = None
-        contacts = Contact.objects.filter(email=email)
-        contact_count = contacts.count()
+        """Finds the contacts with the given email (or makes a new one), and sets their details.
+        Returns the contact to use, which is saved along with the rest of its batch."""
+        contacts = self.contacts_by_email.get(email, []) if email is not None else []
         # Create a new one
-        if contact_count == 0:
+        if len(contacts) == 0:
             contact = Contact(
                 first_name=first_name, middle_name=middle_name, last_name=last_name, email=email, phone=phone
             )
-            contact.save()
-        elif contact_count == 1:
-            contact = contacts.get()
-            contact.first_name = first_name
-            contact.middle_name = middle_name
-            contact.last_name = last_name
-            contact.email = email
-            contact.phone = phone
-            contact.save()
-        else:
-            logger.warning(f"Duplicate contact found {contact}. Updating all relevant entries.")
-            for c in contacts:
-                c.first_name = first_name
-                c.middle_name = middle_name
-                c.last_name = last_name
-                c.email = email
-                c.phone = phone
-                c.save()
-            contact = contacts.first()
-        return contact
+            if email is not None:
+                self.contacts_by_email[email] = [contact]
+            self.contacts_to_save[id(contact)] = contact
+            return contact
+
+        if len(contacts) > 1:
+            logger.warning(f"Duplicate contact found {contacts[0]}. Updating all relevant entries.")
+        for c in contacts:
+            c.first_name = first_name
+            c.middle_name = middle_name
+            c.last_name = last_name
+            c.email = email
+            c.phone = phone
+            self.contacts_to_save[id(c)] = c
+        return contacts[0]
 
     def create_new_domain_info(
         self,
@@ -423,12 +425,10 @@ class Command(BaseCommand):
         valid_fed_type = fed_type in fed_choices
         valid_fed_agency = fed_agency in agency_choices
 
-        default_creator, _ = User.objects.get_or_create(username="System")
-
         new_domain_info_data = {
             "domain": domain,
             "organization_name": transition_domain.organization_name,
-            "creator": default_creator,
+            "creator": self.default_creator,
             "senior_official": contact,
         }
 
@@ -471,8 +471,8 @@ class Command(BaseCommand):
         transition_domain_name = transition_domain.domain_name
 
         # Get associated domain
-        domain_data = Domain.objects.filter(name=transition_domain.domain_name)
-        if not domain_data.exists():
+        domain = self.existing_domains.get(transition_domain_name) or self.created_domains.get(transition_domain_name)
+        if domain is None:
             logger.warn(
                 f"{TerminalColors.FAIL}"
                 f"WARNING: No Domain exists for:"
@@ -480,7 +480,6 @@ class Command(BaseCommand):
                 f"{TerminalColors.ENDC}\n"
             )
             return (None, None, False)
-        domain = domain_data.get()
         template_domain_information = self.create_new_domain_info(
             transition_domain,
             domain,
@@ -489,50 +488,27 @@ class Command(BaseCommand):
             org_choices,
             debug_on,
         )
-        target_domain_information = None
-        domain_information_exists = DomainInformation.objects.filter(domain__name=transition_domain_name).exists()
-        if domain_information_exists:
-            try:
-                # get the existing domain information object
-                target_domain_information = DomainInformation.objects.get(domain__name=transition_domain_name)
-                # DEBUG:
-                TerminalHelper.print_conditional(
-                    debug_on,
-                    (
-                        f"{TerminalColors.FAIL}"
-                        f"Found existing entry in Domain Information table for:"
-                        f"{transition_domain_name}"
-                        f"{TerminalColors.ENDC}"
-                    ),  # noqa
-                )
-
-                # for existing entry, update the status to
-                # the transition domain status
-                self.update_domain_information(target_domain_information, template_domain_information, debug_on)
-                # TODO: not all domains need to be updated
-                # (the information is the same).
-                # Need to bubble this up to the final report.
-
-                return (target_domain_information, domain, False)
-            except DomainInformation.MultipleObjectsReturned:
-                # This should never happen (just like with the Domain Table).
-                # However, because such an error did occur in the past,
-                # we will watch for it in this script
-                logger.warning(
-                    f"""
-                    {TerminalColors.FAIL}
-                    !!! ERROR: duplicate entries already exist in the
-                    Domain Information table for the following domain:
-                    {transition_domain_name}
+        target_domain_information = self.existing_domain_information.get(transition_domain_name)
+        if target_domain_information is not None:
+            # DEBUG:
+            TerminalHelper.print_conditional(
+                debug_on,
+                (
+                    f"{TerminalColors.FAIL}"
+                    f"Found existing entry in Domain Information table for:"
+                    f"{transition_domain_name}"
+                    f"{TerminalColors.ENDC}"
+                ),  # noqa
+            )
 
-                    RECOMMENDATION:
-                    This means the Domain Information table is corrupt.  Please
-                    check the Domain Information table data as there should be a key
-                    constraint which prevents duplicate entries.
+            # for existing entry, update the status to
+            # the transition domain status
+            self.update_domain_information(target_domain_information, template_domain_information, debug_on)
+            # TODO: not all domains need to be updated
+            # (the information is the same).
+            # Need to bubble this up to the final report.
 
-                    ----------TERMINATING----------"""
-                )
-                sys.exit()
+            return (target_domain_information, domain, False)
         else:
             # no matching entry, make one
             target_domain_information = template_domain_information
@@ -548,9 +524,9 @@ class Command(BaseCommand):
             )
             return (target_domain_information, domain, True)
 
-    # C901 'Command.handle' is too complex
     def process_domain_information(
         self,
+        transition_domains,
         valid_agency_choices,
         valid_fed_choices,
         valid_org_choices,
@@ -558,11 +534,11 @@ class Command(BaseCommand):
         skipped_domain_information_entries,
         domain_information_to_create,
         updated_domain_information,
-        debug_max_entries_to_parse,
-        total_rows_parsed,
     ):
-        changed_transition_domains = TransitionDomain.objects.filter(processed=False)
-        for transition_domain in changed_transition_domains:
+        """Works out the domain information (and senior official contacts) to create or update
+        for a batch of transition domains. Returns the domain information to update."""
+        domain_information_to_update = {}
+        for transition_domain in transition_domains:
             (
                 target_domain_information,
                 associated_domain,
@@ -593,62 +569,43 @@ class Command(BaseCommand):
                 # ---------------- DUPLICATE ----------------
                 # The unique key constraint does not allow multiple domain
                 # information objects to share the same domain
-                existing_domain_information_in_to_create = next(
-                    (x for x in domain_information_to_create if x.domain.name == target_domain_information.domain.name),
-                    None,
-                )
-                # TODO: this is redundant.
-                # Currently debugging....
-                # running into unique key constraint error....
-                existing_domain_info = DomainInformation.objects.filter(
-                    domain__name=target_domain_information.domain.name
-                ).exists()
-                if existing_domain_information_in_to_create is not None or existing_domain_info:
+                existing_domain_information_in_to_create = self.created_domain_information.get(associated_domain.name)
+                if existing_domain_information_in_to_create is not None:
                     debug_string = f"""{TerminalColors.YELLOW}
                         Duplicate Detected: {existing_domain_information_in_to_create}.
                         Cannot add duplicate Domain Information object
                         {TerminalColors.ENDC}"""
                 else:
                     # ---------------- CREATED ----------------
+                    self.created_domain_information[associated_domain.name] = target_domain_information
                     domain_information_to_create.append(target_domain_information)
                     debug_string = f"created domain information: {target_domain_information}"
-            elif not was_created:
+            else:
                 # ---------------- UPDATED ----------------
+                domain_information_to_update[associated_domain.name] = target_domain_information
                 updated_domain_information.append(target_domain_information)
                 debug_string = f"updated domain information: {target_domain_information}"
-            else:
-                debug_string = "domain information already exists and "
-                f"matches incoming data (NO CHANGES MADE): {target_domain_information}"
 
             # DEBUG:
             TerminalHelper.print_conditional(
                 debug_on,
                 (f"{TerminalColors.OKCYAN}{debug_string}{TerminalColors.ENDC}"),
             )
+        return list(domain_information_to_update.values())
 
-            # ------------------ Parse limit reached? ------------------
-            # Check parse limit and exit loop if parse limit has been reached
-            if self.parse_limit_reached(debug_max_entries_to_parse, total_rows_parsed):
-                break
-        return (
-            skipped_domain_information_entries,
-            domain_information_to_create,
-            updated_domain_information,
-        )
-
-    # C901 'Command.handle' is too complex
     def process_domain_and_invitations(
         self,
+        transition_domains,
         debug_on,
         skipped_domain_entries,
         domains_to_create,
         updated_domain_entries,
         domain_invitations_to_create,
-        debug_max_entries_to_parse,
-        total_rows_parsed,
     ):
-        changed_transition_domains = TransitionDomain.objects.filter(processed=False)
-        for transition_domain in changed_transition_domains:
+        """Works out the domains and invitations to create, and the domains to update,
+        for a batch of transition domains. Returns the domains to update."""
+        domains_to_update = {}
+        for transition_domain in transition_domains:
             # Create some local variables to make data tracing easier
             transition_domain_name = transition_domain.domain_name
             transition_domain_status = transition_domain.status
@@ -682,22 +639,23 @@ class Command(BaseCommand):
                 # ---------------- DUPLICATE ----------------
                 # The unique key constraint does not allow duplicate domain entries
                 # even if there are different users.
-                existing_domain_in_to_create = next(
-                    (x for x in domains_to_create if x.name == transition_domain_name),
-                    None,
-                )
+                existing_domain_in_to_create = self.created_domains.get(transition_domain_name)
                 if existing_domain_in_to_create is not None:
                     debug_string = f"""{TerminalColors.YELLOW}
                         Duplicate Detected: {transition_domain_name}.
                         Cannot add duplicate entry for another username.
                         Violates Unique Key constraint.
                         {TerminalColors.ENDC}"""
+                    # invitations for this username go to the domain being created
+                    target_domain = existing_domain_in_to_create
                 else:
                     # ---------------- CREATED ----------------
+                    self.created_domains[transition_domain_name] = target_domain
                     domains_to_create.append(target_domain)
                     debug_string = f"created domain: {target_domain}"
-            elif not was_created:
+            else:
                 # ---------------- UPDATED ----------------
+                domains_to_update[transition_domain_name] = target_domain
                 updated_domain_entries.append(transition_domain.domain_name)
                 debug_string = f"updated domain: {target_domain}"
 
@@ -722,17 +680,95 @@ class Command(BaseCommand):
                     f"{TerminalColors.OKCYAN} Adding domain invitation: {new_domain_invitation} {TerminalColors.ENDC}",  # noqa
                 )
                 domain_invitations_to_create.append(new_domain_invitation)
+        return list(domains_to_update.values())
 
-            # ------------------ Parse limit reached? ------------------
-            # Check parse limit and exit loop if parse limit has been reached
-            if self.parse_limit_reached(debug_max_entries_to_parse, total_rows_parsed):
-                break
-        return (
-            skipped_domain_entries,
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
-        )
+    # ======================================================
+    # ===================== SAVING  ========================
+    # ======================================================
+    def save_contacts(self):
+        """Saves the senior official contacts created or changed by the current batch"""
+        contacts = list(self.contacts_to_save.values())
+        self.contacts_to_save = {}
+        log_bulk_create(Contact.objects.bulk_create([contact for contact in contacts if contact.pk is None]))
+        contacts_to_update = []
+        for contact in contacts:
+            if contact.user_id is not None:
+                # save() also copies the contact's details to its user
+                contact.save()
+            else:
+                contacts_to_update.append(contact)
+        fields_to_update = ["first_name", "middle_name", "last_name", "email", "phone"]
+        log_bulk_update(contacts_to_update, fields_to_update)
+        ScriptDataHelper.bulk_update_fields(Contact, contacts_to_update, fields_to_update)
+
+    def transfer_batch(
+        self,
+        transition_domains,
+        debug_on,
+        results,
+        valid_agency_choices,
+        valid_fed_choices,
+        valid_org_choices,
+    ):
+        """Transfers a batch of transition domains in one transaction, with a bulk
+        insert or update per table rather than a query per transition domain."""
+        domains_to_create_count = len(results["domains_to_create"])
+        invitations_to_create_count = len(results["domain_invitations_to_create"])
+        domain_information_to_create_count = len(results["domain_information_to_create"])
+        updated_domain_entries_count = len(results["updated_domain_entries"])
+
+        with transaction.atomic():
+            domains_to_update = self.process_domain_and_invitations(
+                transition_domains,
+                debug_on,
+                results["skipped_domain_entries"],
+                results["domains_to_create"],
+                results["updated_domain_entries"],
+                results["domain_invitations_to_create"],
+            )
+            new_domains = results["domains_to_create"][domains_to_create_count:]
+            Domain.objects.bulk_create(new_domains)
+            now = timezone.now()
+            for domain in domains_to_update:
+                # bulk updates skip auto_now
+                domain.updated_at = now
+            domain_fields_to_update = ["state", "created_at", "expiration_date"]
+            # bulk writes skip auditlog's signals, so their audit log entries are written here
+            log_bulk_update(domains_to_update, domain_fields_to_update)
+            ScriptDataHelper.bulk_update_fields(Domain, domains_to_update, domain_fields_to_update + ["updated_at"])
+
+            new_invitations = results["domain_invitations_to_create"][invitations_to_create_count:]
+            # the domains above now have ids, which bulk_create copies onto their invitations
+            log_bulk_create(DomainInvitation.objects.bulk_create(new_invitations))
+
+            self.contacts_to_save = {}
+            domain_information_to_update = self.process_domain_information(
+                transition_domains,
+                valid_agency_choices,
+                valid_fed_choices,
+                valid_org_choices,
+                debug_on,
+                results["skipped_domain_information_entries"],
+                results["domain_information_to_create"],
+                results["updated_domain_information"],
+            )
+            self.save_contacts()
+
+            new_domain_information = results["domain_information_to_create"][domain_information_to_create_count:]
+            TerminalHelper.print_conditional(
+                debug_on,
+                (f"{TerminalColors.YELLOW}" f"Trying to add: {new_domain_information}" f"{TerminalColors.ENDC}"),
+            )
+            DomainInformation.objects.bulk_create(new_domain_information)
+            log_bulk_update(domain_information_to_update, self.domain_information_fields_to_update)
+            ScriptDataHelper.bulk_update_fields(
+                DomainInformation, domain_information_to_update, self.domain_information_fields_to_update
+            )
+
+            # Mark everything created or updated as processed
+            processed_names = {domain.name for domain in new_domains}
+            processed_names.update(results["updated_domain_entries"][updated_domain_entries_count:])
+            TransitionDomain.objects.filter(domain_name__in=processed_names).update(processed=True)
 
     # ======================================================
     # ===================== HANDLE  ========================
@@ -743,28 +779,31 @@ class Command(BaseCommand):
     ):
         """Parse entries in TransitionDomain table
         and create (or update) corresponding entries in the
-        Domain and DomainInvitation tables."""
+        Domain and DomainInvitation tables.
+
+        Existing records are read up front, then transition domains are
+        transferred in batches of --batchSize, each in its own transaction."""
 
         # grab command line arguments and store locally...
         debug_on = options.get("debug")
         debug_max_entries_to_parse = int(options.get("limitParse"))  # set to 0 to parse all entries
+        batch_size = int(options.get("batchSize"))
 
         self.print_debug_mode_statements(debug_on, debug_max_entries_to_parse)
 
-        # domains to ADD
-        domains_to_create = []
-        domain_information_to_create = []
-
-        # domains we UPDATED
-        updated_domain_entries = []
-        updated_domain_information = []
-
-        # domains we SKIPPED
-        skipped_domain_entries = []
-        skipped_domain_information_entries = []
-
-        # domain invitations to ADD
-        domain_invitations_to_create = []
+        results = {
+            # domains to ADD
+            "domains_to_create": [],
+            "domain_information_to_create": [],
+            # domains we UPDATED
+            "updated_domain_entries": [],
+            "updated_domain_information": [],
+            # domains we SKIPPED
+            "skipped_domain_entries": [],
+            "skipped_domain_information_entries": [],
+            # domain invitations to ADD
+            "domain_invitations_to_create": [],
+        }
 
         # if we are limiting our parse (for testing purposes, keep
         # track of total rows parsed)
@@ -778,95 +817,45 @@ class Command(BaseCommand):
             {TerminalColors.ENDC}"""
         )
 
-        logger.info(
-            f"""{TerminalColors.OKCYAN}
-            ========= Adding Domains and Domain Invitations =========
-            {TerminalColors.ENDC}"""
-        )
-        (
-            skipped_domain_entries,
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
-        ) = self.process_domain_and_invitations(
-            debug_on,
-            skipped_domain_entries,
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
-            debug_max_entries_to_parse,
-            total_rows_parsed,
-        )
-
-        # First, save all Domain objects to the database
-        Domain.objects.bulk_create(domains_to_create)
-
-        # DomainInvitation.objects.bulk_create(domain_invitations_to_create)
-
-        # TODO: this is to resolve an error where bulk_create
-        # doesn't save to database in a way that invitation objects can
-        # utilize.
-        # Then, create DomainInvitation objects
-        for invitation in domain_invitations_to_create:
-            if debug_on:
-                logger.info(f"Pairing invite to its domain...{invitation}")
-            existing_domain = Domain.objects.filter(name=invitation.domain.name)
-            # Make sure the related Domain object is saved
-            if existing_domain.exists():
-                invitation.domain = existing_domain.get()
-            else:
-                # Raise an err for now
-                raise Exception(f"Domain {existing_domain} wants to be added" "but doesn't exist in the DB")
-            invitation.save()
+        changed_transition_domains = TransitionDomain.objects.filter(processed=False)
+        self.load_existing_records(changed_transition_domains)
+        # Ids are read up front, as each batch marks rows in later batches (which share a domain name) processed
+        transition_domain_ids = list(changed_transition_domains.order_by("id").values_list("id", flat=True))
+        if debug_max_entries_to_parse > 0:
+            transition_domain_ids = transition_domain_ids[:debug_max_entries_to_parse]
 
         valid_org_choices = [(name, value) for name, value in DomainRequest.OrganizationChoices.choices]
         valid_fed_choices = [value for name, value in BranchChoices.choices]
-        valid_agency_choices = FederalAgency.objects.all()
-        # ======================================================
-        # ================= DOMAIN INFORMATION =================
+        valid_agency_choices = list(FederalAgency.objects.all())
+
         logger.info(
             f"""{TerminalColors.OKCYAN}
-            ========= Adding Domains Information Objects =========
+            ========= Adding Domains, Domain Invitations and Domain Information =========
             {TerminalColors.ENDC}"""
         )
-
-        (
-            skipped_domain_information_entries,
-            domain_information_to_create,
-            updated_domain_information,
-        ) = self.process_domain_information(
-            valid_agency_choices,
-            valid_fed_choices,
-            valid_org_choices,
-            debug_on,
-            skipped_domain_information_entries,
-            domain_information_to_create,
-            updated_domain_information,
-            debug_max_entries_to_parse,
-            total_rows_parsed,
-        )
-
-        TerminalHelper.print_conditional(
-            debug_on,
-            (f"{TerminalColors.YELLOW}" f"Trying to add: {domain_information_to_create}" f"{TerminalColors.ENDC}"),
-        )
-        DomainInformation.objects.bulk_create(domain_information_to_create)
-
-        # Loop through the list of everything created, and mark it as processed
-        for domain in domains_to_create:
-            name = domain.name
-            TransitionDomain.objects.filter(domain_name=name).update(processed=True)
-
-        # Loop through the list of everything updated, and mark it as processed
-        for name in updated_domain_entries:
-            TransitionDomain.objects.filter(domain_name=name).update(processed=True)
+        for start in range(0, len(transition_domain_ids), batch_size):
+            batch_ids = transition_domain_ids[start : start + batch_size]
+            transition_domains = list(TransitionDomain.objects.filter(id__in=batch_ids).order_by("id"))
+            self.transfer_batch(
+                transition_domains,
+                debug_on,
+                results,
+                valid_agency_choices,
+                valid_fed_choices,
+                valid_org_choices,
+            )
+            total_rows_parsed += len(batch_ids)
+            logger.info(
+                f"{TerminalColors.OKCYAN}Transferred {total_rows_parsed} transition domains{TerminalColors.ENDC}"
+            )
+        self.parse_limit_reached(debug_max_entries_to_parse, total_rows_parsed)
 
         self.print_summary_of_findings(
-            domains_to_create,
-            updated_domain_entries,
-            domain_invitations_to_create,
-            skipped_domain_entries,
-            domain_information_to_create,
-            updated_domain_information,
+            results["domains_to_create"],
+            results["updated_domain_entries"],
+            results["domain_invitations_to_create"],
+            results["skipped_domain_entries"],
+            results["domain_information_to_create"],
+            results["updated_domain_information"],
             debug_on,
         )
@@ -0,0 +1,88 @@
+"""Utilities for scripts which work through many records in batches, such as registry syncs"""
+
+import json
+import logging
+import os
+import time
+
+from registrar.management.commands.utility.process_pool import process_pool
+from registrar.management.commands.utility.terminal_helper import TerminalColors
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_processes(function, *arguments, workers=1):
+    """
+    Calls function with each item of arguments (zipped together, like map), over up to
+    `workers` processes, and returns the results in order.
+
+    function must be defined at the top level of a module, so that it can be sent to the
+    other processes. With one worker (or one item) it runs in this process instead.
+    """
+    arguments = [list(items) for items in arguments]
+    count = len(arguments[0]) if arguments else 0
+    if workers <= 1 or count <= 1:
+        return list(map(function, *arguments))
+
+    with process_pool(min(workers, count)) as executor:
+        return list(executor.map(function, *arguments))
+
+
+class RateLimiter:
+    """
+    Spaces out work so that it averages no more than `per_second` items a second.
+
+    Call wait(count) before starting on count items. A per_second of 0 (or None) turns
+    the limit off.
+    """
+
+    def __init__(self, per_second, clock=time.monotonic, sleep=time.sleep):
+        self.per_second = per_second
+        self._clock = clock
+        self._sleep = sleep
+        # when the next batch of items may start
+        self._next_start = None
+
+    def wait(self, count=1):
+        """Blocks until count more items can start without going over the limit"""
+        if not self.per_second:
+            return
+        now = self._clock()
+        if self._next_start is not None and self._next_start > now:
+            self._sleep(self._next_start - now)
+            now = self._next_start
+        self._next_start = now + count / self.per_second
+
+
+class Checkpoint:
+    """
+    Records how far a script got in a JSON file, so that a later run can resume from there.
+
+    A filepath of None turns checkpoints off: load returns None and save does nothing.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+    def load(self):
+        """Returns the state saved by the last run, or None if there is none"""
+        if not self.filepath or not os.path.exists(self.filepath):
+            return None
+        with open(self.filepath, "r") as file:
+            state = json.load(file)
+        logger.info(f"{TerminalColors.OKCYAN}Resuming from checkpoint {self.filepath}: {state}{TerminalColors.ENDC}")
+        return state
+
+    def save(self, state: dict):
+        """Saves state, replacing the file in one step so that an interrupted run never leaves half of it"""
+        if not self.filepath:
+            return
+        temporary_path = f"{self.filepath}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(state, file)
+        os.replace(temporary_path, self.filepath)
+
+    def clear(self):
+        """Removes the checkpoint, once the script has finished"""
+        if self.filepath and os.path.exists(self.filepath):
+            os.remove(self.filepath)
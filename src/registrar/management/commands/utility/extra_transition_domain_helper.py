@@ -1,9 +1,9 @@
 """"""
 
 import csv
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
-import io
 import glob
 import re
 import logging
@@ -968,6 +968,106 @@ class OrganizationDataLoader:
             logger.warning(f"Updated existing {field_name} to '{changed_value}' on {domain_name}")
 
 
+class AdhocFileReader:
+    """Reads the rows of a seperated adhoc file in a single pass.
+
+    Some files use the seperator inside of values, padded with spaces (" | ").
+    Lines with more values than the header are repaired as they are read,
+    by treating padded seperators as part of a value, so the file is never
+    read (or held in memory) twice.
+
+    Rows are read with the byte offset they start at, which can be passed
+    to read_row_at to read that row again later.
+    """
+
+    bad_seperator_placeholder = ";badseperator;"
+
+    def __init__(self, file, seperator):
+        self.file = file
+        self.seperator = seperator
+        self.bad_seperator_regex = re.compile(rf" {re.escape(seperator)} ")
+        self.fieldnames: List[str] = []
+        self.found_bad_data = False
+
+    def read_rows(self):
+        """Yields (offset, row) for each row in the file, where row is a dict
+        of header -> value. Rows which cannot be repaired are skipped."""
+        with open(self.file, "rb") as requested_file:
+            self.fieldnames = self._split(requested_file.readline().decode("utf-8-sig"))
+            offset = requested_file.tell()
+            for line in iter(requested_file.readline, b""):
+                row = self._parse_line(line.decode("utf-8"))
+                if row is not None:
+                    yield offset, row
+                offset = requested_file.tell()
+
+    def read_row_at(self, offset):
+        """Reads the row which starts at offset, as given by read_rows"""
+        with open(self.file, "rb") as requested_file:
+            requested_file.seek(offset)
+            return self._parse_line(requested_file.readline().decode("utf-8"))
+
+    def _split(self, line):
+        return next(csv.reader([line], delimiter=self.seperator), [])
+
+    def _parse_line(self, line):
+        values = self._split(line)
+        if not values:
+            return None
+
+        repaired = len(values) > len(self.fieldnames)
+        if repaired:
+            if not self.found_bad_data:
+                logger.warning(
+                    f"{TerminalColors.YELLOW}"
+                    f"Found bad data in {self.file}. Attempting to clean."
+                    f"{TerminalColors.ENDC}"
+                )
+                self.found_bad_data = True
+            values = self._split(self.bad_seperator_regex.sub(self.bad_seperator_placeholder, line))
+
+        # If there are still too many values, something
+        # is wrong with the file.
+        if len(values) > len(self.fieldnames):
+            logger.error(
+                f"{TerminalColors.FAIL}" f"Corrupt data found for {values[0]}. Skipping." f"{TerminalColors.ENDC}"
+            )
+            return None
+
+        if repaired:
+            values = [value.replace(self.bad_seperator_placeholder, f" {self.seperator} ") for value in values]
+        # Like csv.DictReader, missing values are None
+        values += [None] * (len(self.fieldnames) - len(values))
+        return dict(zip(self.fieldnames, values))
+
+
+class IndexedAdhocFile(Mapping):
+    """A read-only dict of row id -> dataclass_type for an adhoc file, which only
+    holds the byte offset of each row in memory. Rows are read from disk when looked up.
+
+    Used in place of a dict of every row by ExtraTransitionDomain with index_files,
+    for files too large to comfortably hold in memory.
+    """
+
+    def __init__(self, reader: AdhocFileReader, dataclass_type, offsets: Dict[str, int]):
+        self.reader = reader
+        self.dataclass_type = dataclass_type
+        self.offsets = offsets
+
+    def __getitem__(self, row_id):
+        row = self.reader.read_row_at(self.offsets[row_id])
+        return self.dataclass_type(**row)
+
+    def __contains__(self, row_id):
+        return row_id in self.offsets
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+
 class ExtraTransitionDomain:
     """Helper class to aid in storing TransitionDomain data spread across
     multiple files."""
@@ -980,6 +1080,8 @@ class ExtraTransitionDomain:
             options.directory += "/"
         self.directory = options.directory
         self.seperator = options.sep
+        # Index rows by their place in each file, rather than holding them in memory
+        self.index_files = options.index_files
 
         self.all_files = glob.glob(f"{self.directory}*")
 
@@ -1181,64 +1283,19 @@ class ExtraTransitionDomain:
             return row_id
 
     def _read_csv_file(self, file, seperator, dataclass_type, id_field):
+        """Reads each row of file into a dict of row id -> dataclass_type,
+        or an IndexedAdhocFile of the same if index_files is set"""
+        reader = AdhocFileReader(file, seperator)
         dict_data = {}
-        # Used when we encounter bad data
-        updated_file_content = None
-        with open(file, "r", encoding="utf-8-sig") as requested_file:
-            reader = csv.DictReader(requested_file, delimiter=seperator)
-            for row in reader:
-                # Checks if we encounter any bad data.
-                # If we do, we (non-destructively) clean the file
-                if None in row:
-                    logger.warning(
-                        f"{TerminalColors.YELLOW}"
-                        f"Found bad data in {file}. Attempting to clean."
-                        f"{TerminalColors.ENDC}"
-                    )
-                    updated_file_content = self.replace_bad_seperators(file, f"{seperator}", ";badseperator;")
-                    dict_data = {}
-                    break
-
-                row_id = self._grab_row_id(row, id_field, file, dataclass_type)
-
-                # To maintain pairity with the load_transition_domain
-                # script, we store this data in lowercase.
-                if id_field == "domainname" and row_id is not None:
-                    row_id = row_id.lower()
-                dict_data[row_id] = dataclass_type(**row)
-
-        # After we clean the data, try to parse it again
-        if updated_file_content:
-            logger.info(f"{TerminalColors.MAGENTA}" f"Retrying load for {file}" f"{TerminalColors.ENDC}")
-            # Store the file locally rather than writing to the file.
-            # This is to avoid potential data corruption.
-            updated_file = io.StringIO(updated_file_content)
-            reader = csv.DictReader(updated_file, delimiter=seperator)
-            for row in reader:
-                row_id = row[id_field]
-                # If the key is still none, something
-                # is wrong with the file.
-                if None in row:
-                    logger.error(
-                        f"{TerminalColors.FAIL}" f"Corrupt data found for {row_id}. Skipping." f"{TerminalColors.ENDC}"
-                    )
-                    continue
+        for offset, row in reader.read_rows():
+            row_id = self._grab_row_id(row, id_field, file, dataclass_type)
 
-                for key, value in row.items():
-                    if value is not None and isinstance(value, str):
-                        value = value.replace(";badseperator;", f" {seperator} ")
-                    row[key] = value
+            # To maintain pairity with the load_transition_domain
+            # script, we store this data in lowercase.
+            if id_field == "domainname" and row_id is not None:
+                row_id = row_id.lower()
+            dict_data[row_id] = offset if self.index_files else dataclass_type(**row)
 
-                # To maintain pairity with the load_transition_domain
-                # script, we store this data in lowercase.
-                if id_field == "domainname" and row_id is not None:
-                    row_id = row_id.lower()
-                dict_data[row_id] = dataclass_type(**row)
+        if self.index_files:
+            return IndexedAdhocFile(reader, dataclass_type, dict_data)
         return dict_data
-
-    def replace_bad_seperators(self, filename, delimiter, special_character):
-        with open(filename, "r", encoding="utf-8-sig") as file:
-            contents = file.read()
-
-        new_content = re.sub(rf" \{delimiter} ", special_character, contents)
-        return new_content
@@ -0,0 +1,26 @@
+"""A pool of processes for scripts which spread CPU-heavy work over several processes"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from django.db import connections
+
+
+@contextmanager
+def process_pool(workers, initializer=None, initargs=()):
+    """
+    Yields a ProcessPoolExecutor of up to `workers` forked processes.
+
+    Forked processes must not share this process's database connections, so they are
+    closed first: each process then opens its own. Processes can't be started from a
+    daemonic process, such as a worker of `manage.py test --parallel`.
+    """
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        yield executor
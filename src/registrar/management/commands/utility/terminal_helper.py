@@ -1,8 +1,12 @@
+import itertools
 import logging
 import sys
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from django.core.paginator import Paginator
 from typing import List
+from registrar.management.commands.utility.process_pool import process_pool
 from registrar.utility.enums import LogCode
 
 logger = logging.getLogger(__name__)
@@ -25,6 +29,40 @@ class TerminalColors:
     BackgroundLightYellow = "\033[103m"
 
 
+class BatchProgress:
+    """Counts processed items and logs progress and throughput after each batch"""
+
+    def __init__(self, total: int, label="records", clock=time.monotonic):
+        self.total = total
+        self.label = label
+        self.processed = 0
+        self._clock = clock
+        self._started = clock()
+
+    @property
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    @property
+    def per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def record_batch(self, count: int, **counts):
+        """Adds count processed items, and logs progress along with any other counts given"""
+        self.processed += count
+        details = "".join(f", {name.replace('_', ' ')}: {value}" for name, value in counts.items())
+        logger.info(
+            f"{TerminalColors.OKCYAN}"
+            f"Processed {self.processed}/{self.total} {self.label} "
+            f"({self.per_second:.1f}/s){details}"
+            f"{TerminalColors.ENDC}"
+        )
+
+    def summary(self) -> str:
+        return f"Processed {self.processed} {self.label} in {self.elapsed:.1f}s ({self.per_second:.1f}/s)"
+
+
 class ScriptDataHelper:
     """Helper method with utilities to speed up development of scripts that do DB operations"""
 
@@ -74,6 +112,18 @@ class PopulateScriptTemplate(ABC):
     # The header when printing the script run summary (after the script finishes)
     run_summary_header = None
 
+    # How many records to read, update and save at a time
+    chunk_size: int = 1000
+
+    # How many processes to run update_record in. Only worth raising for CPU-heavy update_records,
+    # as records (and their updates) are copied between processes.
+    workers: int = 1
+
+    # What update_one_record did with a record
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
     @abstractmethod
     def update_record(self, record):
         """Defines how we update each field. Must be defined before using mass_update_records."""
@@ -83,42 +133,51 @@ class PopulateScriptTemplate(ABC):
         """Loops through each valid "object_class" object - specified by filter_conditions - and
         updates fields defined by fields_to_update using update_record.
 
+        Records are read chunk_size at a time, and each chunk is saved with a bulk update
+        before the next is read, so memory use doesn't grow with the number of records.
+        With more than one worker, update_record runs in that many processes.
+
         You must define update_record before you can use this function.
         """
-
-        records = object_class.objects.filter(**filter_conditions)
+        records = object_class.objects.filter(**filter_conditions).order_by("pk")
         readable_class_name = self.get_class_name(object_class)
+        total = records.count()
 
         # Code execution will stop here if the user prompts "N"
         TerminalHelper.prompt_for_execution(
             system_exit_on_terminate=True,
             info_to_inspect=f"""
             ==Proposed Changes==
-            Number of {readable_class_name} objects to change: {len(records)}
+            Number of {readable_class_name} objects to change: {total}
             These fields will be updated on each record: {fields_to_update}
             """,
             prompt_title=self.prompt_title,
         )
         logger.info("Updating...")
 
-        to_update: List[object_class] = []
-        to_skip: List[object_class] = []
-        failed_to_update: List[object_class] = []
-        for record in records:
-            try:
-                if not self.should_skip_record(record):
-                    self.update_record(record)
-                    to_update.append(record)
-                else:
-                    to_skip.append(record)
-            except Exception as err:
-                fail_message = self.get_failure_message(record)
-                failed_to_update.append(record)
-                logger.error(err)
-                logger.error(fail_message)
-
-        # Do a bulk update on the desired field
-        ScriptDataHelper.bulk_update_fields(object_class, to_update, fields_to_update)
+        # Only the string form of each record is kept, for the summary
+        to_update: List[str] = []
+        to_skip: List[str] = []
+        failed_to_update: List[str] = []
+        progress = BatchProgress(total, label=f"{readable_class_name} records")
+        iterator = records.iterator(chunk_size=self.chunk_size)
+        with self.record_updater() as update_records:
+            while chunk := list(itertools.islice(iterator, self.chunk_size)):
+                updated = []
+                for outcome, record in update_records(chunk):
+                    if outcome == self.UPDATED:
+                        updated.append(record)
+                        to_update.append(str(record))
+                    elif outcome == self.SKIPPED:
+                        to_skip.append(str(record))
+                    else:
+                        failed_to_update.append(str(record))
+
+                # Do a bulk update on the desired field
+                ScriptDataHelper.bulk_update_fields(object_class, updated, fields_to_update)
+                progress.record_batch(
+                    len(chunk), updated=len(to_update), skipped=len(to_skip), failed=len(failed_to_update)
+                )
 
         # Log what happened
         TerminalHelper.log_script_run_summary(
@@ -126,10 +185,36 @@ class PopulateScriptTemplate(ABC):
             failed_to_update,
             to_skip,
             debug=debug,
-            log_header=self.run_summary_header,
+            log_header=self.run_summary_header or f"============= FINISHED =============== {progress.summary()}",
             display_as_str=True,
         )
 
+    def update_one_record(self, record):
+        """Skips or updates record (without saving it). Returns UPDATED, SKIPPED or FAILED, and the record."""
+        try:
+            if self.should_skip_record(record):
+                return self.SKIPPED, record
+            self.update_record(record)
+            return self.UPDATED, record
+        except Exception as err:
+            fail_message = self.get_failure_message(record)
+            logger.error(err)
+            logger.error(fail_message)
+            return self.FAILED, record
+
+    @contextmanager
+    def record_updater(self):
+        """Yields a function which calls update_one_record on each of a list of records, returning
+        the results in order. With more than one worker, records are sent to a pool of processes."""
+        if self.workers <= 1:
+            yield lambda records: [self.update_one_record(record) for record in records]
+            return
+
+        with process_pool(self.workers, initializer=_start_populate_script_process, initargs=(self,)) as executor:
+            yield lambda records: list(
+                executor.map(_update_record_in_process, records, chunksize=max(1, len(records) // (self.workers * 4)))
+            )
+
     def get_class_name(self, sender) -> str:
         """Returns the class name that we want to display for the terminal prompt.
         Example: DomainRequest => "Domain Request"
@@ -146,6 +231,19 @@ class PopulateScriptTemplate(ABC):
         return False
 
 
+# The script which processes started by PopulateScriptTemplate.record_updater work for
+_populate_script = None
+
+
+def _start_populate_script_process(script):
+    global _populate_script
+    _populate_script = script
+
+
+def _update_record_in_process(record):
+    return _populate_script.update_one_record(record)
+
+
 class TerminalHelper:
     @staticmethod
     def log_script_run_summary(
@@ -53,3 +53,4 @@ class TransitionDomainArguments:
     debug: Optional[bool] = field(default=False, repr=True)
     resetTable: Optional[bool] = field(default=False, repr=True)
     infer_filenames: Optional[bool] = field(default=False, repr=True)
+    index_files: Optional[bool] = field(default=False, repr=True)
@@ -0,0 +1,80 @@
+# Generated by Django 4.2.10 on 2026-10-18 10:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("registrar", "0109_domaininformation_sub_organization_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnalyticsSnapshot",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("user_count", models.PositiveIntegerField(default=0)),
+                ("domain_count", models.PositiveIntegerField(default=0)),
+                ("ready_domain_count", models.PositiveIntegerField(default=0)),
+                ("last_30_days_applications", models.PositiveIntegerField(default=0)),
+                ("last_30_days_approved_applications", models.PositiveIntegerField(default=0)),
+                (
+                    "average_approval_time",
+                    models.DurationField(
+                        blank=True,
+                        help_text="Average approval time for requests approved in the 30 days before the snapshot",
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "created_at",
+            },
+        ),
+        migrations.CreateModel(
+            name="AnalyticsCount",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("managed_domains", "Managed domains"),
+                            ("unmanaged_domains", "Unmanaged domains"),
+                            ("ready_domains", "Ready domains"),
+                            ("deleted_domains", "Deleted domains"),
+                            ("requests", "Domain requests"),
+                            ("submitted_requests", "Submitted domain requests"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "date",
+                    models.DateField(
+                        help_text="Day of the date the category is counted by, such as first ready or submission date"
+                    ),
+                ),
+                ("generic_org_type", models.CharField(blank=True, max_length=255, null=True)),
+                ("is_election_board", models.BooleanField(blank=True, null=True)),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "snapshot",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="counts",
+                        to="registrar.analyticssnapshot",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["snapshot", "category", "date"], name="registrar_a_snapsho_41f056_idx")
+                ],
+            },
+        ),
+    ]
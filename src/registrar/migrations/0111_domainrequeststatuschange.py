@@ -0,0 +1,104 @@
+# Generated by Django 4.2.10 on 2026-10-18 11:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auditlog", "0015_alter_logentry_changes"),
+        ("registrar", "0110_analyticssnapshot_analyticscount"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DomainRequestStatusChange",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "status",
+                    models.TextField(
+                        blank=True,
+                        choices=[
+                            ("in review", "In review"),
+                            ("action needed", "Action needed"),
+                            ("approved", "Approved"),
+                            ("rejected", "Rejected"),
+                            ("ineligible", "Ineligible"),
+                            ("submitted", "Submitted"),
+                            ("withdrawn", "Withdrawn"),
+                            ("started", "Started"),
+                        ],
+                        null=True,
+                    ),
+                ),
+                (
+                    "rejection_reason",
+                    models.TextField(
+                        blank=True,
+                        choices=[
+                            ("purpose_not_met", "Purpose requirements not met"),
+                            ("requestor_not_eligible", "Requestor not eligible to make request"),
+                            ("org_has_domain", "Org already has a .gov domain"),
+                            ("contacts_not_verified", "Org contacts couldn't be verified"),
+                            ("org_not_eligible", "Org not eligible for a .gov domain"),
+                            ("naming_not_met", "Naming requirements not met"),
+                            ("other", "Other/Unspecified"),
+                        ],
+                        null=True,
+                    ),
+                ),
+                (
+                    "action_needed_reason",
+                    models.TextField(
+                        blank=True,
+                        choices=[
+                            ("eligibility_unclear", "Unclear organization eligibility"),
+                            ("questionable_senior_official", "Questionable senior official"),
+                            ("already_has_domains", "Already has domains"),
+                            ("bad_name", "Doesn’t meet naming requirements"),
+                            ("other", "Other (no auto-email sent)"),
+                        ],
+                        null=True,
+                    ),
+                ),
+                ("timestamp", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "domain_request",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="status_changes",
+                        to="registrar.domainrequest",
+                    ),
+                ),
+                (
+                    "log_entry",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="auditlog.logentry",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["domain_request", "-timestamp"], name="registrar_d_domain__d99faa_idx")
+                ],
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 from auditlog.registry import auditlog  # type: ignore
 from .contact import Contact
 from .domain_request import DomainRequest
+from .domain_request_status_change import DomainRequestStatusChange
 from .domain_information import DomainInformation
 from .domain import Domain
 from .draft_domain import DraftDomain
@@ -19,11 +20,13 @@ from .waffle_flag import WaffleFlag
 from .portfolio import Portfolio
 from .domain_group import DomainGroup
 from .suborganization import Suborganization
+from .analytics_snapshot import AnalyticsCount, AnalyticsSnapshot
 
 
 __all__ = [
     "Contact",
     "DomainRequest",
+    "DomainRequestStatusChange",
     "DomainInformation",
     "Domain",
     "DraftDomain",
@@ -42,6 +45,8 @@ __all__ = [
     "Portfolio",
     "DomainGroup",
     "Suborganization",
+    "AnalyticsSnapshot",
+    "AnalyticsCount",
 ]
 
 auditlog.register(Contact)
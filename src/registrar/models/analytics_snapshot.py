@@ -0,0 +1,74 @@
+from django.db import models
+
+from .utility.time_stamped_model import TimeStampedModel
+
+
+class AnalyticsSnapshot(TimeStampedModel):
+    """
+    The counts shown on the analytics page, as of when the snapshot was taken
+    by the take_analytics_snapshot command.
+    """
+
+    class Meta:
+        get_latest_by = "created_at"
+
+    user_count = models.PositiveIntegerField(default=0)
+    domain_count = models.PositiveIntegerField(default=0)
+    ready_domain_count = models.PositiveIntegerField(default=0)
+    last_30_days_applications = models.PositiveIntegerField(default=0)
+    last_30_days_approved_applications = models.PositiveIntegerField(default=0)
+    average_approval_time = models.DurationField(
+        null=True,
+        blank=True,
+        help_text="Average approval time for requests approved in the 30 days before the snapshot",
+    )
+
+    def __str__(self) -> str:
+        return f"Analytics snapshot {self.created_at}"
+
+
+class AnalyticsCount(models.Model):
+    """
+    How many domains or domain requests in a category have a date on a given day,
+    per organization type and election office, as of an AnalyticsSnapshot.
+    Summing the counts up to a date gives that category's count at the date.
+    """
+
+    class Category(models.TextChoices):
+        MANAGED_DOMAINS = "managed_domains", "Managed domains"
+        UNMANAGED_DOMAINS = "unmanaged_domains", "Unmanaged domains"
+        READY_DOMAINS = "ready_domains", "Ready domains"
+        DELETED_DOMAINS = "deleted_domains", "Deleted domains"
+        REQUESTS = "requests", "Domain requests"
+        SUBMITTED_REQUESTS = "submitted_requests", "Submitted domain requests"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["snapshot", "category", "date"]),
+        ]
+
+    snapshot = models.ForeignKey(
+        "registrar.AnalyticsSnapshot",
+        on_delete=models.CASCADE,
+        related_name="counts",
+    )
+    category = models.CharField(
+        max_length=50,
+        choices=Category.choices,
+    )
+    date = models.DateField(
+        help_text="Day of the date the category is counted by, such as first ready or submission date",
+    )
+    generic_org_type = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+    )
+    is_election_board = models.BooleanField(
+        null=True,
+        blank=True,
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.category} on {self.date}: {self.count}"
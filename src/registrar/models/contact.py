@@ -1,5 +1,6 @@
 from django.db import models
 
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 
 from phonenumber_field.modelfields import PhoneNumberField  # type: ignore
@@ -23,6 +24,9 @@ class Contact(TimeStampedModel):
         indexes = [
             models.Index(fields=["user"]),
             models.Index(fields=["email"]),
+            trigram_index("email", "contact_email_trgm_idx"),
+            trigram_index("first_name", "contact_first_name_trgm_idx"),
+            trigram_index("last_name", "contact_last_name_trgm_idx"),
         ]
 
     user = models.OneToOneField(
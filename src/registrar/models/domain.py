@@ -10,8 +10,6 @@ from django_fsm import FSMField, transition, TransitionNotAllowed  # type: ignor
 from django.db import models
 from django.utils import timezone
 from typing import Any
-from registrar.models.host import Host
-from registrar.models.host_ip import HostIP
 from registrar.utility.enums import DefaultEmail
 from registrar.utility import errors
 
@@ -33,9 +31,13 @@ from epplibwrapper import (
 
 from registrar.models.utility.contact_error import ContactError, ContactErrorCodes
 
-from django.db.models import DateField, TextField
+from django.db.models import Case, DateField, F, Q, TextField, Value, When
 from .utility.domain_field import DomainField
 from .utility.domain_helper import DomainHelper
+from .utility.host_reconciler import reconcile_hosts_and_ips
+from .utility.availability_cache import availability_cache
+from .utility.registry_cache import registry_cache
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 
 from .public_contact import PublicContact
@@ -73,6 +75,7 @@ class Domain(TimeStampedModel, DomainHelper):
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["state"]),
+            trigram_index("name", "domain_name_trgm_idx"),
         ]
 
     def __init__(self, *args, **kwargs):
@@ -240,8 +243,33 @@ class Domain(TimeStampedModel, DomainHelper):
             raise errors.InvalidDomainError()
 
         domain_name = domain.lower()
-        req = commands.CheckDomain([domain_name])
-        return registry.send(req, cleaned=True).res_data[0].avail
+        return cls.available_many([domain_name])[domain_name]
+
+    @classmethod
+    def available_many(cls, domains: list[str]) -> dict[str, bool]:
+        """Check if several domains are available, in one CheckDomain for
+        any which are not in the shared availability cache.
+
+        Returns the availability of each domain, keyed by lowercased name.
+
+        throws- RegistryError or InvalidDomainError"""
+        for domain in domains:
+            if not cls.string_could_be_domain(domain):
+                logger.warning("Not a valid domain: %s" % str(domain))
+                raise errors.InvalidDomainError()
+
+        domain_names = list(dict.fromkeys(domain.lower() for domain in domains))
+        availability = availability_cache.get_many(domain_names)
+        missing = [name for name in domain_names if name not in availability]
+        if missing:
+            req = commands.CheckDomain(missing)
+            checked = {result.name.lower(): result.avail for result in registry.send(req, cleaned=True).res_data}
+            unanswered = [name for name in missing if name not in checked]
+            if unanswered:
+                raise RegistryError(f"CheckDomain did not answer for {', '.join(unanswered)}")
+            availability_cache.set_many(checked)
+            availability.update(checked)
+        return availability
 
     @classmethod
     def registered(cls, domain: str) -> bool:
@@ -327,6 +355,8 @@ class Domain(TimeStampedModel, DomainHelper):
             self._cache["ex_date"] = registry.send(request, cleaned=True).res_data[0].ex_date
             self.expiration_date = self._cache["ex_date"]
             self.save()
+            # other requests may hold the old expiration date
+            registry_cache.delete(self.name)
         except RegistryError as err:
             # if registry error occurs, log the error, and raise it as well
             logger.error(f"registry error renewing domain: {err}")
@@ -1105,6 +1135,19 @@ class Domain(TimeStampedModel, DomainHelper):
         else:
             return self.state.capitalize()
 
+    @classmethod
+    def state_display_expression(cls):
+        """Return an expression which computes state_display in the database,
+        so that querysets can be filtered and sorted by it."""
+        is_expired = Q(expiration_date__isnull=True) | Q(expiration_date__lt=timezone.now().date())
+        return Case(
+            When(is_expired & ~Q(state=cls.State.UNKNOWN), then=Value("Expired")),
+            When(state__in=[cls.State.UNKNOWN, cls.State.DNS_NEEDED], then=Value("DNS needed")),
+            *[When(state=state, then=Value(state.capitalize())) for state in cls.State.values],
+            default=F("state"),
+            output_field=TextField(),
+        )
+
     def map_epp_contact_to_public_contact(self, contact: eppInfo.InfoContactResultData, contact_id, contact_type):
         """Maps the Epp contact representation to a PublicContact object.
 
@@ -1383,6 +1426,8 @@ class Domain(TimeStampedModel, DomainHelper):
         except RegistryError as err:
             if err.code != ErrorCode.OBJECT_EXISTS:
                 raise err
+        finally:
+            availability_cache.delete(self.name)
 
         self.addAllDefaults()
 
@@ -1598,9 +1643,10 @@ class Domain(TimeStampedModel, DomainHelper):
             choices.SECURITY: None,
             choices.TECHNICAL: None,
         }
-        for domainContact in contact_data:
-            req = commands.InfoContact(id=domainContact.contact)
-            data = registry.send(req, cleaned=True).res_data[0]
+        requests = [commands.InfoContact(id=domainContact.contact) for domainContact in contact_data]
+        responses = self._send_many(requests)
+        for domainContact, response in zip(contact_data, responses):
+            data = response.res_data[0]
 
             # Map the object we recieved from EPP to a PublicContact
             mapped_object = self.map_epp_contact_to_public_contact(data, domainContact.contact, domainContact.type)
@@ -1639,12 +1685,32 @@ class Domain(TimeStampedModel, DomainHelper):
         ip_addr = ipaddress.ip_address(ip)
         return ip_addr.version == 6
 
+    def _send_many(self, requests):
+        """Send independent info requests to the registry concurrently.
+        Returns the responses in the order of the requests.
+
+        Every request that failed is logged, and the first failure is raised,
+        as happened when the requests were sent one at a time."""
+        results = registry.send_many(requests, cleaned=True)
+        failures = [(request, result) for request, result in zip(requests, results) if isinstance(result, Exception)]
+        for request, error in failures:
+            logger.error(
+                "Registry threw error for %s, error code is %s full error is %s",
+                request,
+                error.code,
+                error,
+            )
+        if failures:
+            raise failures[0][1]
+        return results
+
     def _fetch_hosts(self, host_data):
         """Fetch host info."""
         hosts = []
-        for name in host_data:
-            req = commands.InfoHost(name=name)
-            data = registry.send(req, cleaned=True).res_data[0]
+        requests = [commands.InfoHost(name=name) for name in host_data]
+        responses = self._send_many(requests)
+        for name, response in zip(host_data, responses):
+            data = response.res_data[0]
             host = {
                 "name": name,
                 "addrs": [item.addr for item in getattr(data, "addrs", [])],
@@ -1830,6 +1896,7 @@ class Domain(TimeStampedModel, DomainHelper):
             self._update_dates(cleaned)
 
             self._cache = cleaned
+            registry_cache.merge(self.name, cleaned)
 
         except RegistryError as e:
             logger.error(e)
@@ -1900,45 +1967,16 @@ class Domain(TimeStampedModel, DomainHelper):
             self: the domain to be updated with hosts and ips from cleaned
             cleaned: dict containing hosts.  Hosts are provided as a list of dicts, e.g.
                 [{"name": "ns1.example.com",}, {"name": "ns1.example.gov"}, "addrs": ["0.0.0.0"])]
+
+        The differences with what is stored are applied in bulk, see reconcile_hosts_and_ips.
         """
         cleaned_hosts = cleaned["hosts"]
-        # Get all existing hosts from the database for this domain
-        existing_hosts_in_db = Host.objects.filter(domain=self)
-        # Identify hosts to delete
-        cleaned_host_names = set(cleaned_host["name"] for cleaned_host in cleaned_hosts)
-        hosts_to_delete_from_db = [
-            existing_host for existing_host in existing_hosts_in_db if existing_host.name not in cleaned_host_names
-        ]
-        # Delete hosts and their associated HostIP instances
-        for host_to_delete in hosts_to_delete_from_db:
-            # Delete associated HostIP instances
-            HostIP.objects.filter(host=host_to_delete).delete()
-            # Delete the host itself
-            host_to_delete.delete()
-        # Update or create Hosts and HostIPs
         for cleaned_host in cleaned_hosts:
-            # Check if the cleaned_host already exists
-            host_in_db, host_created = Host.objects.get_or_create(domain=self, name=cleaned_host["name"])
             # Check if the nameserver is a subdomain of the current domain
             # If it is NOT a subdomain, we remove the IP address
             if not Domain.isSubdomain(self.name, cleaned_host["name"]):
                 cleaned_host["addrs"] = []
-            # Get cleaned list of ips for update
-            cleaned_ips = cleaned_host["addrs"]
-            if not host_created:
-                # Get all existing ips from the database for this host
-                existing_ips_in_db = HostIP.objects.filter(host=host_in_db)
-                # Identify IPs to delete
-                ips_to_delete_from_db = [
-                    existing_ip for existing_ip in existing_ips_in_db if existing_ip.address not in cleaned_ips
-                ]
-                # Delete IPs
-                for ip_to_delete in ips_to_delete_from_db:
-                    # Delete the ip
-                    ip_to_delete.delete()
-            # Update or create HostIP instances
-            for ip_address in cleaned_ips:
-                HostIP.objects.get_or_create(address=ip_address, host=host_in_db)
+        reconcile_hosts_and_ips({self: cleaned_hosts})
 
     def _update_security_contact_in_db(self, cleaned):
         """Update security contact registry id in database if retrieved from registry.
@@ -2061,14 +2099,29 @@ class Domain(TimeStampedModel, DomainHelper):
     def _invalidate_cache(self):
         """Remove cache data when updates are made."""
         self._cache = {}
+        registry_cache.delete(self.name)
+
+    def _load_shared_cache(self):
+        """Fill in the cache from data another request already fetched from the registry."""
+        shared = registry_cache.get(self.name)
+        if shared:
+            self._cache = {**shared, **self._cache}
 
     def _get_property(self, property):
         """Get some piece of info about a domain."""
         if property not in self._cache:
-            self._fetch_cache(
-                fetch_hosts=(property == "hosts"),
-                fetch_contacts=(property == "contacts"),
-            )
+            self._load_shared_cache()
+
+        if property not in self._cache:
+            with registry_cache.fetch_lock(self.name) as fetching:
+                # While waiting, another request may have fetched what we need
+                if not fetching:
+                    self._load_shared_cache()
+                if property not in self._cache:
+                    self._fetch_cache(
+                        fetch_hosts=(property == "hosts"),
+                        fetch_contacts=(property == "contacts"),
+                    )
 
         if property in self._cache:
             return self._cache[property]
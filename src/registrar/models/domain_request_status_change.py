@@ -0,0 +1,105 @@
+from django.db import models
+from django.utils import timezone
+
+from .domain_request import DomainRequest
+
+
+class DomainRequestStatusChange(models.Model):
+    """
+    A change to a domain request's status, rejection reason or action needed reason,
+    as shown in the status changelog on the domain request change form.
+
+    These are recorded from the audit log as it is written (see signals.py), so that
+    the changelog is read with one indexed query rather than by searching the audit
+    log. The populate_domain_request_status_changes command records existing entries.
+    """
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["domain_request", "-timestamp"]),
+        ]
+
+    domain_request = models.ForeignKey(
+        "registrar.DomainRequest",
+        on_delete=models.CASCADE,
+        related_name="status_changes",
+    )
+    # The audit log entry this change was recorded from, so it is only recorded once
+    log_entry = models.OneToOneField(
+        "auditlog.LogEntry",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    # The status after the change. Changing either reason on its own implies the status that goes with it.
+    status = models.TextField(
+        choices=DomainRequest.DomainRequestStatus.choices,
+        null=True,
+        blank=True,
+    )
+    # The reasons are only set when the change set them
+    rejection_reason = models.TextField(
+        choices=DomainRequest.RejectionReasons.choices,
+        null=True,
+        blank=True,
+    )
+    action_needed_reason = models.TextField(
+        choices=DomainRequest.ActionNeededReasons.choices,
+        null=True,
+        blank=True,
+    )
+    actor = models.ForeignKey(
+        "registrar.User",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    timestamp = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f"{self.domain_request_id} changed to {self.status} at {self.timestamp}"
+
+    @classmethod
+    def from_log_entry(cls, log_entry):
+        """Returns the change recorded by an audit log entry for a domain request, unsaved, or None
+        if the entry changed none of the status, rejection reason or action needed reason (or is a deletion)."""
+        # the domain request is already gone by the time its deletion is logged
+        if log_entry.action == log_entry.Action.DELETE:
+            return None
+
+        changes = log_entry.changes or {}
+        status_changed = "status" in changes
+        rejection_reason_changed = "rejection_reason" in changes
+        action_needed_reason_changed = "action_needed_reason" in changes
+        if not (status_changed or rejection_reason_changed or action_needed_reason_changed):
+            return None
+
+        # The audit log stores values as strings, with "None" for None
+        status = cls._none_if_none_string(changes["status"][1]) if status_changed else None
+        rejection_reason = None
+        if rejection_reason_changed and changes["rejection_reason"][1]:
+            rejection_reason = cls._none_if_none_string(changes["rejection_reason"][1])
+            if not status_changed:
+                status = DomainRequest.DomainRequestStatus.REJECTED
+
+        action_needed_reason = None
+        if action_needed_reason_changed and changes["action_needed_reason"][1]:
+            action_needed_reason = cls._none_if_none_string(changes["action_needed_reason"][1])
+            if not status_changed:
+                status = DomainRequest.DomainRequestStatus.ACTION_NEEDED
+
+        return cls(
+            domain_request_id=log_entry.object_id,
+            log_entry=log_entry,
+            status=status,
+            rejection_reason=rejection_reason,
+            action_needed_reason=action_needed_reason,
+            actor_id=log_entry.actor_id,
+            timestamp=log_entry.timestamp,
+        )
+
+    @staticmethod
+    def _none_if_none_string(value):
+        return None if value in ("None", "") else value
@@ -3,6 +3,7 @@ import logging
 from django.db import models
 
 from .utility.domain_helper import DomainHelper
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 
 logger = logging.getLogger(__name__)
@@ -11,6 +12,13 @@ logger = logging.getLogger(__name__)
 class DraftDomain(TimeStampedModel, DomainHelper):
     """Store domain names which registrants have requested."""
 
+    class Meta:
+        """Contains meta information about this class"""
+
+        indexes = [
+            trigram_index("name", "draftdomain_name_trgm_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.name
 
@@ -1,4 +1,5 @@
 from django.db import models
+from .utility.search import trigram_index
 from .utility.time_stamped_model import TimeStampedModel
 
 
@@ -13,6 +14,14 @@ class TransitionDomain(TimeStampedModel):
     state of a domain upon transition between registry
     providers"""
 
+    class Meta:
+        """Contains meta information about this class"""
+
+        indexes = [
+            trigram_index("username", "transition_username_trgm_idx"),
+            trigram_index("domain_name", "transition_domain_trgm_idx"),
+        ]
+
     # This is necessary to expose the enum to external
     # classes that import TransitionDomain
     StatusChoices = StatusChoices
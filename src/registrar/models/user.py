@@ -11,6 +11,7 @@ from .transition_domain import TransitionDomain
 from .verified_by_staff import VerifiedByStaff
 from .domain import Domain
 from .domain_request import DomainRequest
+from .utility.search import trigram_index
 
 from phonenumber_field.modelfields import PhoneNumberField  # type: ignore
 
@@ -35,6 +36,10 @@ class User(AbstractUser):
         indexes = [
             models.Index(fields=["username"]),
             models.Index(fields=["email"]),
+            trigram_index("username", "user_username_trgm_idx"),
+            trigram_index("email", "user_email_trgm_idx"),
+            trigram_index("first_name", "user_first_name_trgm_idx"),
+            trigram_index("last_name", "user_last_name_trgm_idx"),
         ]
 
         permissions = [
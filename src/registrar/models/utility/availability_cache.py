@@ -0,0 +1,67 @@
+"""A cache of domain availability which is shared by every request and worker"""
+
+import threading
+
+from django.conf import settings
+
+from registrar.utility.safe_cache import SafeCache
+
+
+class AvailabilityCache:
+    """
+    Stores the registry's answer to CheckDomain, keyed by domain name, in one of
+    Django's caches (settings.AVAILABILITY_CACHE_ALIAS).
+
+    The request wizard checks availability as the user types, so the same names are
+    checked over and over. Names which are taken rarely become available, so they are
+    kept for settings.AVAILABILITY_CACHE_TAKEN_TIMEOUT seconds. Available names can be
+    taken at any moment, so they are only kept for AVAILABILITY_CACHE_AVAILABLE_TIMEOUT
+    seconds. A timeout of 0 turns caching off for that kind of answer.
+
+    Hits and misses are counted in each process's memory, rather than written to the
+    cache on every check, so stats() covers the process it is called in.
+    """
+
+    key_prefix = "availability:domain"
+
+    def __init__(self, alias=None):
+        self.cache = SafeCache("availability", "AVAILABILITY_CACHE_ALIAS", alias)
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+
+    def _key(self, domain_name) -> str:
+        return f"{self.key_prefix}:{domain_name.lower()}"
+
+    def get_many(self, domain_names) -> dict[str, bool]:
+        """Returns the cached availability of whichever of domain_names are cached, by name"""
+        keys = {self._key(name): name for name in domain_names}
+        cached = self.cache.get_many(keys.keys())
+        with self._stats_lock:
+            self._hits += len(cached)
+            self._misses += len(keys) - len(cached)
+        return {keys[key]: available for key, available in cached.items()}
+
+    def set_many(self, availability: dict[str, bool]) -> None:
+        """Caches the registry's answers, a dictionary of availability by domain name"""
+        timeouts = {
+            True: settings.AVAILABILITY_CACHE_AVAILABLE_TIMEOUT,
+            False: settings.AVAILABILITY_CACHE_TAKEN_TIMEOUT,
+        }
+        for available, timeout in timeouts.items():
+            values = {self._key(name): avail for name, avail in availability.items() if avail == available}
+            if values and timeout > 0:
+                self.cache.set_many(values, timeout)
+
+    def delete(self, domain_name) -> None:
+        """Forgets a domain's availability, e.g. once it has been created in the registry"""
+        self.cache.delete(self._key(domain_name))
+
+    def stats(self) -> dict[str, int]:
+        """Returns how many availability checks this process answered from the cache (hits) or sent to the
+        registry (misses)"""
+        with self._stats_lock:
+            return {"hits": self._hits, "misses": self._misses}
+
+
+availability_cache = AvailabilityCache()
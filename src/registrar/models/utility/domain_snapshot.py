@@ -0,0 +1,41 @@
+"""A compact record of a domain, small enough to keep in the session"""
+
+from datetime import datetime
+
+
+class DomainSnapshot:
+    """
+    Which version of a Domain (its `updated_at`) a session last saw.
+
+    Sessions only keep a snapshot's pk and version (see as_session_data),
+    rather than a pickled Domain with all the registry data in its `_cache`.
+    Pages reload the Domain itself, whose registry data comes from the shared
+    registry cache. A snapshot which is not current tells them the domain changed
+    since the session last saw it.
+    """
+
+    __slots__ = ("pk", "version")
+
+    def __init__(self, pk: int, version: datetime | None):
+        self.pk = pk
+        self.version = version
+
+    @classmethod
+    def from_domain(cls, domain) -> "DomainSnapshot":
+        return cls(pk=domain.pk, version=domain.updated_at)
+
+    @classmethod
+    def from_session_data(cls, data) -> "DomainSnapshot | None":
+        """Returns the snapshot kept in the session by as_session_data, or None for anything else"""
+        try:
+            version = datetime.fromisoformat(data["version"]) if data["version"] else None
+            return cls(pk=int(data["pk"]), version=version)
+        except (TypeError, KeyError, ValueError):
+            return None
+
+    def as_session_data(self) -> dict:
+        return {"pk": self.pk, "version": self.version.isoformat() if self.version else None}
+
+    def is_current(self, domain) -> bool:
+        """Whether domain is the same version of the domain as this snapshot"""
+        return self.pk == domain.pk and self.version == domain.updated_at
@@ -0,0 +1,109 @@
+"""Bring the Host and HostIP tables in line with the registry's nameservers, in bulk"""
+
+import logging
+
+from django.db import transaction
+from django.db.models import Prefetch
+
+from registrar.models.host import Host
+from registrar.models.host_ip import HostIP
+from registrar.utility.audit_log import log_bulk_create
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_hosts_and_ips(hosts_by_domain: dict) -> dict:
+    """
+    Makes the hosts and host IPs stored for each domain match its hosts from the registry.
+
+    hosts_by_domain maps a Domain (or its pk) to its hosts, in the form of
+    `Domain._get_hosts`: a list of dicts such as {"name": "ns1.example.gov", "addrs": ["1.2.3.4"]}.
+    Every domain's hosts are replaced, so an empty list removes all of them.
+
+    Existing hosts and IPs are read in two queries, whatever the number of domains,
+    and the differences are written with one bulk insert and one delete per table,
+    so domains whose hosts have not changed cost nothing more. Deletes go through
+    auditlog, which logs each deleted row, and the audit log entries for created
+    rows are written in bulk alongside them.
+    Duplicate hosts for a domain (same name) are removed, keeping the oldest.
+
+    Returns the number of hosts and IPs created and deleted, for logging.
+    """
+    wanted: dict[int, dict[str, list[str]]] = {}
+    # the Domains given, so that new hosts' audit log entries don't each query for their domain
+    domains = {}
+    for domain, hosts in hosts_by_domain.items():
+        domain_id = getattr(domain, "pk", domain)
+        if domain_id != domain:
+            domains[domain_id] = domain
+        # dict keys keep the order of names and addresses while removing repeats
+        wanted[domain_id] = {host["name"]: list(dict.fromkeys(host.get("addrs") or [])) for host in hosts}
+
+    counts = {"hosts_created": 0, "hosts_deleted": 0, "ips_created": 0, "ips_deleted": 0}
+    if not wanted:
+        return counts
+
+    existing_hosts = (
+        Host.objects.filter(domain_id__in=wanted)
+        .order_by("id")
+        .prefetch_related(Prefetch("ip", queryset=HostIP.objects.order_by("id")))
+    )
+
+    kept_hosts: dict[tuple[int, str], Host] = {}
+    host_ids_to_delete = []
+    ip_ids_to_delete = []
+    ips_to_create = []
+    for host in existing_hosts:
+        key = (host.domain_id, host.name)
+        if host.name not in wanted[host.domain_id] or key in kept_hosts:
+            host_ids_to_delete.append(host.pk)
+            ip_ids_to_delete.extend(ip.pk for ip in host.ip.all())
+            continue
+        kept_hosts[key] = host
+        ips_to_keep, ips_to_remove = _split_ips(host, wanted[host.domain_id][host.name])
+        ip_ids_to_delete.extend(ips_to_remove)
+        ips_to_create.extend(
+            HostIP(host=host, address=address)
+            for address in wanted[host.domain_id][host.name]
+            if address not in ips_to_keep
+        )
+
+    hosts_to_create = [
+        Host(domain=domains[domain_id], name=name) if domain_id in domains else Host(domain_id=domain_id, name=name)
+        for domain_id, hosts in wanted.items()
+        for name in hosts
+        if (domain_id, name) not in kept_hosts
+    ]
+
+    if not (ip_ids_to_delete or host_ids_to_delete or hosts_to_create or ips_to_create):
+        return counts
+
+    with transaction.atomic():
+        # IPs protect their hosts, so go first
+        if ip_ids_to_delete:
+            counts["ips_deleted"], _ = HostIP.objects.filter(id__in=ip_ids_to_delete).delete()
+        if host_ids_to_delete:
+            counts["hosts_deleted"], _ = Host.objects.filter(id__in=host_ids_to_delete).delete()
+
+        created_hosts = Host.objects.bulk_create(hosts_to_create)
+        log_bulk_create(created_hosts)
+        for host in created_hosts:
+            ips_to_create.extend(HostIP(host=host, address=address) for address in wanted[host.domain_id][host.name])
+        log_bulk_create(HostIP.objects.bulk_create(ips_to_create))
+
+    counts["hosts_created"] = len(created_hosts)
+    counts["ips_created"] = len(ips_to_create)
+    logger.debug("reconcile_hosts_and_ips() -> %s", counts)
+    return counts
+
+
+def _split_ips(host: Host, addresses: list[str]) -> tuple[set[str], list[int]]:
+    """Returns the addresses of host's prefetched IPs to keep, and the ids of those to delete"""
+    kept: set[str] = set()
+    to_delete = []
+    for ip in host.ip.all():
+        if ip.address in addresses and ip.address not in kept:
+            kept.add(ip.address)
+        else:
+            to_delete.append(ip.pk)
+    return kept, to_delete
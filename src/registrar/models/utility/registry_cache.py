@@ -0,0 +1,139 @@
+"""A cache of registry data which is shared by every request and worker"""
+
+import copy
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from registrar.utility.safe_cache import SafeCache
+
+
+class RegistryCache:
+    """
+    Stores what `Domain._fetch_cache` learned from the registry, keyed by domain name,
+    in one of Django's caches (settings.REGISTRY_CACHE_ALIAS).
+
+    Without this, every request starts with an empty `Domain._cache` and has to send
+    InfoDomain (plus InfoHost / InfoContact) again. Entries live for
+    settings.REGISTRY_CACHE_TIMEOUT seconds and are deleted whenever the domain
+    invalidates its cache after sending an update. A timeout of 0 turns sharing off.
+
+    To avoid a stampede of identical registry calls when an entry expires, only one
+    request per worker at a time fetches a given domain; the others wait briefly for
+    its result.
+    """
+
+    key_prefix = "registry:domain"
+    # entries which are only fetched on request, and the registry data each is built from
+    derived_keys = {"hosts": "_hosts", "contacts": "_contacts"}
+
+    def __init__(self, alias=None, timeout=None, lock_timeout=5):
+        self.cache = SafeCache("registry", "REGISTRY_CACHE_ALIAS", alias)
+        # defaults to settings.REGISTRY_CACHE_TIMEOUT, read on use
+        self._timeout = timeout
+        # how long a request waits on another request's fetch
+        self.lock_timeout = lock_timeout
+        # per domain locks for fetch_lock, with a count of who is using them.
+        # Reentrant, as fetching a domain can ask for more of its properties.
+        # gunicorn's gevent workers patch threading, so these block greenlets.
+        self._locks: dict[str, list] = {}
+        self._locks_guard = threading.Lock()
+
+    @property
+    def timeout(self) -> int:
+        if self._timeout is not None:
+            return self._timeout
+        return settings.REGISTRY_CACHE_TIMEOUT
+
+    @property
+    def enabled(self) -> bool:
+        return self.timeout > 0
+
+    def _key(self, domain_name) -> str:
+        return f"{self.key_prefix}:{str(domain_name).lower()}"
+
+    def get(self, domain_name) -> dict | None:
+        """Returns the cached registry data for a domain, or None."""
+        if not self.enabled:
+            return None
+        return self.cache.get(self._key(domain_name))
+
+    def set(self, domain_name, data: dict) -> None:
+        """Shares a domain's registry data with other requests."""
+        if not self.enabled:
+            return
+        self.cache.set(self._key(domain_name), self._prepare(data), self.timeout)
+
+    def merge(self, domain_name, data: dict) -> None:
+        """Shares a domain's registry data, without losing what the shared entry already has.
+
+        A fetch made without hosts or contacts would otherwise overwrite an entry which
+        another worker fetched with them. Those are kept, as long as the registry still
+        lists the same hosts (`_hosts`) or contacts (`_contacts`) they were built from."""
+        if not self.enabled:
+            return
+        missing = [key for key in self.derived_keys if key not in data]
+        existing = self.get(domain_name) if missing else None
+        if existing:
+            data = dict(data)
+            for key in missing:
+                source = self.derived_keys[key]
+                if key in existing and existing.get(source) == data.get(source):
+                    data[key] = existing[key]
+        self.set(domain_name, data)
+
+    def delete(self, domain_name) -> None:
+        """Drops a domain's shared registry data, e.g. after an update was sent."""
+        if not self.enabled:
+            return
+        self.cache.delete(self._key(domain_name))
+
+    def _prepare(self, data: dict) -> dict:
+        """Copy the data without references back to the requesting Domain instance.
+
+        The registrant may have been replaced by a PublicContact, whose related
+        domain would otherwise be pickled along with it."""
+        prepared = dict(data)
+        registrant = prepared.get("registrant")
+        if hasattr(registrant, "_state"):
+            registrant = copy.copy(registrant)
+            registrant._state = copy.copy(registrant._state)
+            registrant._state.fields_cache = {}
+            prepared["registrant"] = registrant
+        return prepared
+
+    @contextmanager
+    def fetch_lock(self, domain_name):
+        """Lets one request per worker at a time fetch a given domain from the registry.
+
+        Yields True if the caller got the lock straight away. A caller which had to wait
+        behind another fetch gets False, and should check the cache again before
+        fetching for itself. Waiting is capped at lock_timeout seconds.
+        """
+        if not self.enabled:
+            yield True
+            return
+
+        key = self._key(domain_name)
+        with self._locks_guard:
+            entry = self._locks.setdefault(key, [threading.RLock(), 0])
+            entry[1] += 1
+        lock = entry[0]
+
+        acquired = lock.acquire(blocking=False)
+        waited = not acquired
+        if waited:
+            acquired = lock.acquire(timeout=self.lock_timeout)
+        try:
+            yield not waited
+        finally:
+            if acquired:
+                lock.release()
+            with self._locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+
+
+registry_cache = RegistryCache()
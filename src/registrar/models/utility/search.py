@@ -0,0 +1,49 @@
+"""Trigram indexes for searched text fields, and ranking of search results"""
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Case, FloatField, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce, Greatest, Upper
+
+
+def trigram_index(field_name: str, name: str) -> GinIndex:
+    """
+    Returns a pg_trgm GIN index for searching field_name with icontains (and istartswith).
+
+    On postgres, Django compiles `field__icontains="x"` to `UPPER(field::text) LIKE UPPER('%x%')`.
+    An index on the column itself cannot serve that, so the index is on the same expression.
+    Terms shorter than three characters have no trigrams to look up, so still scan the table.
+    """
+    return GinIndex(OpClass(Upper(field_name), name="gin_trgm_ops"), name=name)
+
+
+def annotate_search_rank(queryset, field_names, term: str):
+    """
+    Annotates queryset with how well each row matches a search for term in field_names:
+
+    search_rank is 0 for an exact match of any of the fields (ignoring case), 1 when one
+    of them starts with term and 2 otherwise. search_similarity is the highest trigram
+    similarity between term and any of the fields, for ordering rows within a rank.
+
+    Ordering by "search_rank", "-search_similarity" lists the closest matches first.
+    Needs the pg_trgm extension, which is installed by a registrar migration.
+    """
+    exact_match = Q()
+    prefix_match = Q()
+    for field_name in field_names:
+        exact_match |= Q(**{f"{field_name}__iexact": term})
+        prefix_match |= Q(**{f"{field_name}__istartswith": term})
+
+    # fields which are null have no similarity, rather than putting the row first
+    similarities = [Coalesce(TrigramSimilarity(field_name, term), 0.0) for field_name in field_names]
+    return queryset.annotate(
+        search_rank=Case(
+            When(exact_match, then=Value(0)),
+            When(prefix_match, then=Value(1)),
+            default=Value(2),
+            output_field=IntegerField(),
+        ),
+        search_similarity=(
+            Greatest(*similarities, output_field=FloatField()) if len(similarities) > 1 else similarities[0]
+        ),
+    )
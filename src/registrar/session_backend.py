@@ -0,0 +1,45 @@
+"""Session engine for the registrar, see settings.SESSION_ENGINE"""
+
+import pickle  # nosec
+
+from django.contrib.sessions.backends.cache import SessionStore as CacheSessionStore
+
+
+class SessionStore(CacheSessionStore):
+    """
+    Stores sessions in settings.SESSION_CACHE_ALIAS, like Django's cache session engine,
+    but only writes a session back when its content has changed.
+
+    Views mark the session as modified whenever they might have changed something
+    nested in it (see DomainRequestWizard.storage), and CSRF tokens live in the
+    session, so otherwise most authenticated requests would rewrite their session.
+    """
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # the session as last read from or written to the cache, serialized
+        self._stored = None
+
+    def _serialize(self, session_data):
+        # cache backends pickle the session as is, rather than using SESSION_SERIALIZER
+        return pickle.dumps(session_data, pickle.HIGHEST_PROTOCOL)
+
+    def load(self):
+        session_data = super().load()
+        if self.session_key is not None:
+            self._stored = self._serialize(session_data)
+        return session_data
+
+    def save(self, must_create=False):
+        session_data = self._get_session(no_load=must_create)
+        if not must_create and self._stored is not None and self._serialize(session_data) == self._stored:
+            # the session middleware sends the cookie again with a new expiry, so keep the session as long
+            self._cache.touch(self.cache_key, self.get_expiry_age())
+            return
+        super().save(must_create=must_create)
+        self._stored = self._serialize(session_data)
+
+    def delete(self, session_key=None):
+        super().delete(session_key)
+        if session_key is None or session_key == self.session_key:
+            self._stored = None
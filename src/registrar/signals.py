@@ -1,9 +1,11 @@
 import logging
 
+from auditlog.models import LogEntry  # type: ignore
+from django.contrib.contenttypes.models import ContentType
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from .models import User, Contact
+from .models import User, Contact, DomainRequest, DomainRequestStatusChange
 
 
 logger = logging.getLogger(__name__)
@@ -57,3 +59,19 @@ def handle_profile(sender, instance, **kwargs):
                 "There are multiple Contacts with the same email address."
                 f" Picking #{contacts[0].id} for User #{instance.id}."
             )
+
+
+@receiver(post_save, sender=LogEntry)
+def record_domain_request_status_change(sender, instance, created, **kwargs):
+    """Method for when an audit log entry is saved.
+
+    If a new entry records a change to a domain request's status, rejection reason or
+    action needed reason, we record it as a DomainRequestStatusChange too, for the
+    status changelog on the domain request change form.
+    """
+    if not created or instance.content_type_id != ContentType.objects.get_for_model(DomainRequest).id:
+        return
+
+    status_change = DomainRequestStatusChange.from_log_entry(instance)
+    if status_change is not None:
+        status_change.save()
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, Mock, patch
 from typing import List, Dict
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.conf import settings
+from django.core.cache import caches
 from django.contrib.auth import get_user_model, login
 from django.utils.timezone import make_aware
 from datetime import date, datetime, timedelta
@@ -1421,9 +1422,14 @@ class MockEppLib(TestCase):
         elif "errordomain.gov" in getattr(_request, "names", None):
             raise RegistryError("Registry cannot find domain availability.")
         else:
-            return self._mockDomainName("domainnotfound.gov", False)
+            return MagicMock(
+                res_data=[
+                    responses.check.CheckDomainResultData(name=name, avail=False, reason=None)
+                    for name in _request.names
+                ]
+            )
 
-    def mockSend(self, _request, cleaned):
+    def mockSend(self, _request, cleaned, timeout=None):
         """Mocks the registry.send function used inside of domain.py
         registry is imported from epplibwrapper
         returns objects that simulate what would be in a epp response
@@ -1635,6 +1641,10 @@ class MockEppLib(TestCase):
 
     def setUp(self):
         """mock epp send function as this will fail locally"""
+        # Registry answers are cached, and each process keeps its own copies of cached
+        # values (see TieredCache), which the rollback after each test doesn't reach.
+        # The shared cache is rolled back, and holds the session of any client already logged in.
+        caches["default"].local.clear()
         self.mockSendPatch = patch("registrar.models.domain.registry.send")
         self.mockedSendFunction = self.mockSendPatch.start()
         self.mockedSendFunction.side_effect = self.mockSend
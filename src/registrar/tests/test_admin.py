@@ -1,7 +1,12 @@
 from datetime import date, datetime
 from django.utils import timezone
+import json
 import re
+from django.core.cache import caches
+from django.template.loader import get_template
+from django.db import connection
 from django.test import TestCase, RequestFactory, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.admin.sites import AdminSite
 from contextlib import ExitStack
 from api.tests.common import less_console_noise_decorator
@@ -1553,6 +1558,38 @@ class TestDomainRequestAdmin(MockEppLib):
 
         self.assertContains(response, "DOMAIN NAME DOES NOT MEET .GOV REQUIREMENTS")
 
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-emails"},
+        },
+        ACTION_NEEDED_EMAIL_CACHE_ALIAS="default",
+        ACTION_NEEDED_EMAIL_CACHE_TIMEOUT=60,
+    )
+    @less_console_noise_decorator
+    def test_action_needed_emails_cached(self):
+        """Action needed emails are rendered once, and again after the domain request or its senior official is saved"""
+        domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.IN_REVIEW)
+
+        with patch("registrar.admin.get_template", wraps=get_template) as mock_get_template:
+            emails = self.admin.get_all_action_needed_reason_emails_as_json(domain_request)
+            # a body and a subject for each reason but "other"
+            self.assertEqual(mock_get_template.call_count, 8)
+            self.assertEqual(self.admin.get_all_action_needed_reason_emails_as_json(domain_request), emails)
+            self.assertEqual(mock_get_template.call_count, 8)
+
+            domain_request.senior_official.first_name = "Changed"
+            domain_request.senior_official.save()
+            emails = json.loads(self.admin.get_all_action_needed_reason_emails_as_json(domain_request))
+            self.assertEqual(mock_get_template.call_count, 16)
+            reason = DomainRequest.ActionNeededReasons.QUESTIONABLE_SENIOR_OFFICIAL
+            self.assertIn("Changed", emails[reason]["email_body_text"])
+
+            domain_request.save()
+            self.admin.get_all_action_needed_reason_emails_as_json(domain_request)
+            self.assertEqual(mock_get_template.call_count, 24)
+
+        caches["default"].clear()
+
     @override_settings(IS_PRODUCTION=True)
     def test_save_model_sends_submitted_email_with_bcc_on_prod(self):
         """When transitioning to submitted from started or withdrawn on a domain request,
@@ -3451,10 +3488,100 @@ class TestListHeaderAdmin(TestCase):
                 ],
             )
 
+    def _add_changelist_rows(self, start, count):
+        """Adds count submitted domain requests (shown by default) and domains, with every related column filled in"""
+        federal_agency, _ = FederalAgency.objects.get_or_create(agency="Test agency")
+        for i in range(start, start + count):
+            completed_domain_request(
+                status=DomainRequest.DomainRequestStatus.SUBMITTED,
+                name=f"rows{i}.gov",
+                investigator=self.superuser,
+                federal_agency=federal_agency,
+            )
+            domain = Domain.objects.create(name=f"rows{i}.gov")
+            DomainInformation.objects.create(creator=self.superuser, domain=domain, federal_agency=federal_agency)
+
+    def _count_changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    @less_console_noise_decorator
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        """Related columns on the domain and domain request changelists are joined into
+        the changelist query, rather than queried for row by row"""
+        self.client.force_login(self.superuser)
+        urls = [reverse("admin:registrar_domain_changelist"), reverse("admin:registrar_domainrequest_changelist")]
+
+        self._add_changelist_rows(0, 2)
+        # The first request also sets up the session and caches, which later requests skip
+        for url in urls:
+            self.client.get(url)
+        query_counts = [self._count_changelist_queries(url) for url in urls]
+
+        self._add_changelist_rows(2, 5)
+        self.assertEqual([self._count_changelist_queries(url) for url in urls], query_counts)
+
+    def test_get_list_select_related(self):
+        """The relations shown in list_display and orderable_fk_fields are joined"""
+        request = self.factory.get("/admin/")
+        request.user = self.superuser
+        domain_admin = DomainAdmin(model=Domain, admin_site=self.site)
+        self.assertEqual(domain_admin.get_list_select_related(request), ["domain_info", "domain_info__federal_agency"])
+        domain_request_admin = DomainRequestAdmin(model=DomainRequest, admin_site=self.site)
+        self.assertCountEqual(
+            domain_request_admin.get_list_select_related(request),
+            ["requested_domain", "submitter", "investigator", "federal_agency"],
+        )
+
+    @less_console_noise_decorator
+    def test_search_results_ranked(self):
+        """Searches list exact matches first, then those starting with the term, then the rest,
+        unless a column is sorted on"""
+        for name in ["acity.gov", "cityhall.gov", "city.gov"]:
+            Domain.objects.create(name=name)
+        self.client.force_login(self.superuser)
+        url = reverse("admin:registrar_domain_changelist")
+
+        response = self.client.get(url, {"q": "city.gov"})
+        self.assertEqual([domain.name for domain in response.context["cl"].result_list], ["city.gov", "acity.gov"])
+
+        response = self.client.get(url, {"q": "city"})
+        self.assertEqual(
+            [domain.name for domain in response.context["cl"].result_list], ["city.gov", "cityhall.gov", "acity.gov"]
+        )
+
+        # sorted by the name column
+        response = self.client.get(url, {"q": "city", "o": "1"})
+        self.assertEqual(
+            [domain.name for domain in response.context["cl"].result_list], ["acity.gov", "city.gov", "cityhall.gov"]
+        )
+
+    def test_is_rankable_search_field(self):
+        """Plain searches of text columns through single-valued relations are ranked"""
+        domain_request_admin = DomainRequestAdmin(model=DomainRequest, admin_site=self.site)
+        self.assertTrue(domain_request_admin._is_rankable_search_field("requested_domain__name"))
+        self.assertTrue(domain_request_admin._is_rankable_search_field("submitter__email"))
+        self.assertFalse(domain_request_admin._is_rankable_search_field("^requested_domain__name"))
+        self.assertFalse(domain_request_admin._is_rankable_search_field("requested_domain__name__iexact"))
+        self.assertFalse(domain_request_admin._is_rankable_search_field("other_contacts__email"))
+        self.assertFalse(domain_request_admin._is_rankable_search_field("id"))
+
+    def test_search_uses_trigram_index(self):
+        """Searches with icontains can use the trigram indexes rather than reading the whole table"""
+        queryset = Domain.objects.filter(name__icontains="city")
+        with connection.cursor() as cursor:
+            # the table is too small for the planner to choose an index otherwise
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+        self.assertIn("domain_name_trgm_idx", plan)
+
     def tearDown(self):
         # delete any domain requests too
         DomainInformation.objects.all().delete()
         DomainRequest.objects.all().delete()
+        Domain.objects.all().delete()
         User.objects.all().delete()
 
 
@@ -1,5 +1,6 @@
 from django.test import TestCase, Client
 from django.urls import reverse
+from registrar.models import AnalyticsSnapshot
 from registrar.tests.common import create_superuser
 
 
@@ -40,3 +41,14 @@ class TestAdminViews(TestCase):
         # Check if the filename in the Content-Disposition header matches the expected pattern
         expected_filename = f"domain-growth-report-{start_date}-to-{end_date}.csv"
         self.assertIn(f'attachment; filename="{expected_filename}"', response["Content-Disposition"])
+
+    def test_analytics_view_reads_snapshot(self):
+        """The analytics page shows the counts from the latest analytics snapshot"""
+        self.client.force_login(self.superuser)
+        AnalyticsSnapshot.objects.create(user_count=1234)
+
+        response = self.client.get(reverse("analytics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "User Count: 1234")
+        self.assertContains(response, "Counts as of")
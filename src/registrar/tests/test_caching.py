@@ -0,0 +1,260 @@
+"""Test the tiered cache backend, the session engine and cached admin counts"""
+
+import tempfile
+from unittest.mock import Mock, patch
+
+from django.core.cache import caches
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from registrar.cache_backends import TieredCache
+from registrar.models import Website
+from registrar.session_backend import SessionStore
+from registrar.utility.admin_counts import AdminCounter, EstimatedCountPaginator, admin_counter
+from registrar.utility.safe_cache import SafeCache
+
+from .common import create_superuser
+
+
+class TestTieredCache(SimpleTestCase):
+    """Test the per-process cache in front of a shared, file based, cache"""
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "registrar.cache_backends.TieredCache",
+                    "LOCATION": "shared",
+                    "OPTIONS": {"LOCAL_TIMEOUT": 60},
+                },
+                "shared": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": self.directory.name,
+                },
+            }
+        )
+        self.settings_override.enable()
+        self.cache = caches["default"]
+        self.shared = caches["shared"]
+
+    def tearDown(self):
+        self.cache.clear()
+        self.settings_override.disable()
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_writes_go_to_the_shared_cache(self):
+        """Values set through the tiered cache can be read by other workers"""
+        self.cache.set("key", "value")
+        self.cache.set_many({"one": 1, "two": None})
+        self.assertEqual(self.shared.get("key"), "value")
+        self.assertEqual(self.shared.get_many(["one", "two"]), {"one": 1, "two": None})
+
+    def test_reads_are_kept_locally(self):
+        """Once read, a value is answered from the process's own copy"""
+        self.shared.set("key", "value")
+        self.assertEqual(self.cache.get("key"), "value")
+
+        with patch.object(TieredCache, "shared") as shared:
+            self.assertEqual(self.cache.get("key"), "value")
+            self.assertEqual(self.cache.get_many(["key"]), {"key": "value"})
+            shared.get.assert_not_called()
+            shared.get_many.assert_not_called()
+
+    def test_local_copies_expire(self):
+        """Local copies are kept no longer than LOCAL_TIMEOUT, or the entry's own timeout"""
+        self.assertEqual(self.cache._local_timeout(), 60)
+        self.assertEqual(self.cache._local_timeout(None), 60)
+        self.assertEqual(self.cache._local_timeout(5), 5)
+
+        self.cache.set("key", "value", timeout=0)
+        self.assertFalse(self.cache.local.has_key("key"))
+
+    def test_missing_values(self):
+        """Missing values return the default, while cached Nones are returned"""
+        self.assertEqual(self.cache.get("missing", "default"), "default")
+        self.cache.set("none", None)
+        self.assertIsNone(self.cache.get("none", "default"))
+
+    def test_delete_and_counters(self):
+        """Deletes and counters act on the shared cache, and drop local copies"""
+        self.cache.set("key", "value")
+        self.cache.delete("key")
+        self.assertIsNone(self.cache.get("key"))
+        self.assertIsNone(self.shared.get("key"))
+
+        self.cache.set("count", 1)
+        self.assertEqual(self.cache.incr("count", 2), 3)
+        self.assertEqual(self.cache.get("count"), 3)
+        self.assertEqual(self.cache.decr("count"), 2)
+        self.assertEqual(self.shared.get("count"), 2)
+
+    def test_add(self):
+        """add only sets values which are not in the shared cache"""
+        self.shared.set("key", "theirs")
+        self.assertFalse(self.cache.add("key", "ours"))
+        self.assertEqual(self.cache.get("key"), "theirs")
+        self.assertTrue(self.cache.add("new", "ours"))
+        self.assertEqual(self.shared.get("new"), "ours")
+
+
+class TestSafeCache(SimpleTestCase):
+    """Test that cache failures are logged rather than raised"""
+
+    def test_failures_are_ignored(self):
+        """Reads which fail are misses, and writes which fail are dropped"""
+        methods = ["get", "get_many", "set", "set_many", "delete"]
+        broken = Mock(**{f"{method}.side_effect": ConnectionError("down") for method in methods})
+        cache = SafeCache("test", "ADMIN_COUNT_CACHE_ALIAS", alias="broken")
+        with patch("registrar.utility.safe_cache.caches", {"broken": broken}):
+            with self.assertLogs("registrar.utility.safe_cache", "WARNING") as logs:
+                self.assertEqual(cache.get("key", "default"), "default")
+                self.assertEqual(cache.get_many(["key"]), {})
+                cache.set("key", "value", 60)
+                cache.set_many({"key": "value"}, 60)
+                cache.delete("key")
+        self.assertEqual(len(logs.output), 5)
+
+    @override_settings(ADMIN_COUNT_CACHE_ALIAS="shared")
+    def test_alias_read_on_use(self):
+        """The alias setting is read whenever the cache is used"""
+        self.assertIs(SafeCache("test", "ADMIN_COUNT_CACHE_ALIAS").backend, caches["shared"])
+
+
+@override_settings(
+    CACHES={"shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-sessions"}},
+    SESSION_CACHE_ALIAS="shared",
+)
+class TestSessionStore(SimpleTestCase):
+    """Test that sessions are only written back when they change"""
+
+    def setUp(self):
+        super().setUp()
+        session = SessionStore()
+        session["wizard"] = {"step": "contact"}
+        session.create()
+        self.session_key = session.session_key
+
+    def tearDown(self):
+        caches["shared"].clear()
+        super().tearDown()
+
+    def test_unchanged_session_not_saved(self):
+        """A session marked as modified, but without changes, is not written"""
+        session = SessionStore(self.session_key)
+        self.assertEqual(session["wizard"], {"step": "contact"})
+        session.modified = True
+        with patch("django.contrib.sessions.backends.cache.SessionStore.save") as save:
+            session.save()
+            save.assert_not_called()
+
+    def test_unchanged_session_expiry_extended(self):
+        """A session which isn't written is kept for as long as a written one would be"""
+        session = SessionStore(self.session_key)
+        session.load()
+        with patch.object(caches["shared"], "touch", wraps=caches["shared"].touch) as touch:
+            session.save()
+        touch.assert_called_once_with(session.cache_key, session.get_expiry_age())
+        self.assertEqual(SessionStore(self.session_key)["wizard"], {"step": "contact"})
+
+    def test_changed_session_saved(self):
+        """Changes, including to nested values, are written"""
+        session = SessionStore(self.session_key)
+        session["wizard"]["step"] = "purpose"
+        session.save()
+        self.assertEqual(SessionStore(self.session_key)["wizard"], {"step": "purpose"})
+
+    def test_cycled_session_keeps_data(self):
+        """A new session key still has the session's data"""
+        session = SessionStore(self.session_key)
+        session.cycle_key()
+        session.save()
+        self.assertNotEqual(session.session_key, self.session_key)
+        self.assertEqual(SessionStore(session.session_key)["wizard"], {"step": "contact"})
+        self.assertFalse(SessionStore().exists(self.session_key))
+
+    def test_flushed_session_saved(self):
+        """A flushed session is written when it is next saved"""
+        session = SessionStore(self.session_key)
+        session.flush()
+        session["wizard"] = {"step": "contact"}
+        session.save()
+        self.assertEqual(SessionStore(session.session_key)["wizard"], {"step": "contact"})
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-admin-counts"},
+        "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-admin-sessions"},
+    },
+    ADMIN_COUNT_CACHE_ALIAS="default",
+    ADMIN_COUNT_CACHE_TIMEOUT=60,
+    ADMIN_CACHED_COUNT_THRESHOLD=3,
+    ADMIN_ESTIMATED_COUNT_THRESHOLD=1000,
+)
+class TestAdminCounter(TestCase):
+    """Test that admin changelist counts are estimated or cached once they are large"""
+
+    def setUp(self):
+        super().setUp()
+        self.counter = AdminCounter()
+        for i in range(3):
+            Website.objects.create(website=f"counted{i}.gov")
+
+    def tearDown(self):
+        caches["default"].clear()
+        caches["shared"].clear()
+        super().tearDown()
+
+    def test_small_counts_are_exact(self):
+        """Counts under ADMIN_CACHED_COUNT_THRESHOLD are taken every time"""
+        websites = Website.objects.filter(website__startswith="counted1")
+        self.assertEqual(self.counter.count(websites), 1)
+        Website.objects.create(website="counted1.5.gov")
+        self.assertEqual(self.counter.count(websites), 2)
+
+    def test_large_counts_are_cached(self):
+        """Counts of at least ADMIN_CACHED_COUNT_THRESHOLD are kept, whatever order rows are listed in"""
+        websites = Website.objects.filter(website__startswith="counted")
+        self.assertEqual(self.counter.count(websites), 3)
+        Website.objects.create(website="counted3.gov")
+        self.assertEqual(self.counter.count(websites.order_by("-website")), 3)
+        # a different query is counted separately
+        self.assertEqual(self.counter.count(Website.objects.filter(website__startswith="count")), 4)
+
+    @override_settings(ADMIN_COUNT_CACHE_TIMEOUT=0)
+    def test_cache_timeout_of_zero_turns_caching_off(self):
+        websites = Website.objects.filter(website__startswith="counted")
+        self.assertEqual(self.counter.count(websites), 3)
+        Website.objects.create(website="counted3.gov")
+        self.assertEqual(self.counter.count(websites), 4)
+
+    def test_estimate(self):
+        """The planner's estimate is read from pg_class, if the table has one"""
+        estimate = self.counter.estimate(Website)
+        self.assertTrue(estimate is None or estimate >= 0)
+
+    def test_unfiltered_large_tables_are_estimated(self):
+        """Only unfiltered querysets on tables estimated to be large get the estimate"""
+        with patch.object(AdminCounter, "estimate", return_value=5000):
+            self.assertEqual(self.counter.count(Website.objects.all()), 5000)
+            self.assertEqual(EstimatedCountPaginator(Website.objects.order_by("id"), 100).num_pages, 50)
+            self.assertEqual(self.counter.count(Website.objects.filter(website__startswith="counted")), 3)
+
+        with patch.object(AdminCounter, "estimate", return_value=500):
+            self.assertEqual(self.counter.count(Website.objects.all()), Website.objects.count())
+
+    def test_changelist_counts(self):
+        """The audit log changelist shows the estimated total, and the exact filtered count"""
+        client = Client(HTTP_HOST="localhost:8080")
+        client.force_login(create_superuser())
+        with patch.object(admin_counter, "estimate", return_value=5000):
+            response = client.get(reverse("admin:auditlog_logentry_changelist"))
+            self.assertEqual(response.context["cl"].full_result_count, 5000)
+            self.assertEqual(response.context["cl"].result_count, 5000)
+
+            response = client.get(reverse("admin:auditlog_logentry_changelist"), {"q": "counted1.gov"})
+            self.assertEqual(response.context["cl"].full_result_count, 5000)
+            self.assertEqual(response.context["cl"].result_count, 1)
@@ -6,6 +6,7 @@ from api.views import available
 
 from registrar.forms.domain_request_wizard import (
     AlternativeDomainForm,
+    AlternativeDomainFormSet,
     CurrentSitesForm,
     DotGovDomainForm,
     SeniorOfficialForm,
@@ -20,6 +21,8 @@ from registrar.forms.domain_request_wizard import (
 )
 from registrar.forms.domain import ContactForm
 from registrar.tests.common import MockEppLib
+from unittest.mock import MagicMock
+from epplibwrapper import responses
 from django.contrib.auth import get_user_model
 
 
@@ -191,6 +194,35 @@ class TestFormValidation(MockEppLib):
                 # for good measure, test if the two objects are equal anyway
                 self.assertEqual([json_error], form_error)
 
+    def test_alternative_domains_checked_together(self):
+        """the alternative domains formset checks every domain's availability in one registry call"""
+        checked = []
+
+        def check_domains(_request, cleaned):
+            checked.append(_request.names)
+            return MagicMock(
+                res_data=[
+                    responses.check.CheckDomainResultData(name=name, avail=True, reason=None) for name in _request.names
+                ]
+            )
+
+        self.mockedSendFunction.side_effect = check_domains
+        formset = AlternativeDomainFormSet(
+            data={
+                "form-TOTAL_FORMS": "3",
+                "form-INITIAL_FORMS": "0",
+                "form-0-alternative_domain": "city",
+                "form-1-alternative_domain": "sub.city",
+                "form-2-alternative_domain": "county",
+            }
+        )
+
+        self.assertFalse(formset.is_valid())
+        self.assertEqual(checked, [["city.gov", "county.gov"]])
+        self.assertEqual(formset.forms[0].cleaned_data["alternative_domain"], "city")
+        self.assertEqual(formset.forms[2].cleaned_data["alternative_domain"], "county")
+        self.assertIn("alternative_domain", formset.forms[1].errors)
+
     def test_requested_domain_two_dots_invalid(self):
         """don't accept domains that are subdomains"""
         form = DotGovDomainForm(data={"requested_domain": "sub.top-level-agency.gov"})
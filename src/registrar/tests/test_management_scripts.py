@@ -1,7 +1,11 @@
 import copy
+import multiprocessing
+import os
+import tempfile
+from types import SimpleNamespace
 from datetime import date, datetime, time
 from django.core.management import call_command
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from registrar.utility.constants import BranchChoices
 from django.utils import timezone
 from django.utils.module_loading import import_string
@@ -9,10 +13,16 @@ import logging
 import pyzipper
 from registrar.management.commands.clean_tables import Command as CleanTablesCommand
 from registrar.management.commands.export_tables import Command as ExportTablesCommand
+from registrar.management.commands.import_tables import Command as ImportTablesCommand
+from registrar.management.commands.sync_registry_data import Command as SyncRegistryDataCommand
+from registrar.management.commands.utility.batch_helper import Checkpoint, RateLimiter, run_in_processes
+from registrar.management.commands.utility.terminal_helper import PopulateScriptTemplate, ScriptDataHelper
+from registrar.management.commands.populate_verification_type import Command as PopulateVerificationTypeCommand
 from registrar.models import (
     User,
     Domain,
     DomainRequest,
+    DomainRequestStatusChange,
     Contact,
     Website,
     DomainInvitation,
@@ -25,7 +35,7 @@ from registrar.models import (
 )
 import tablib
 from unittest.mock import patch, call, MagicMock, mock_open
-from epplibwrapper import commands, common
+from epplibwrapper import commands, common, ErrorCode, RegistryError
 
 from .common import MockEppLib, less_console_noise, completed_domain_request
 from api.tests.common import less_console_noise_decorator
@@ -129,6 +139,92 @@ class TestPopulateVerificationType(MockEppLib):
         self.assertEqual(self.untouched_user.verification_type, User.VerificationTypeChoices.GRANDFATHERED)
         self.assertEqual(self.fixture_user.verification_type, User.VerificationTypeChoices.FIXTURE_USER)
 
+    @less_console_noise_decorator
+    def test_verification_type_script_updates_in_chunks(self):
+        """Users are read and saved chunk_size at a time"""
+        total = User.objects.filter(verification_type__isnull=True).count()
+        with (
+            patch.object(PopulateVerificationTypeCommand, "chunk_size", 2),
+            patch.object(
+                ScriptDataHelper, "bulk_update_fields", wraps=ScriptDataHelper.bulk_update_fields
+            ) as bulk_update_fields,
+        ):
+            self.run_populate_verification_type()
+
+        expected_chunks = [2] * (total // 2) + [1] * (total % 2)
+        self.assertEqual([len(call.args[1]) for call in bulk_update_fields.call_args_list], expected_chunks)
+        self.assertFalse(User.objects.filter(verification_type__isnull=True).exists())
+
+
+class InlineProcessPoolExecutor:
+    """Stands in for ProcessPoolExecutor, running the work in this process instead. Processes can't be
+    started from the daemonic workers of `manage.py test --parallel`."""
+
+    instances = []
+
+    def __init__(self, max_workers, mp_context=None, initializer=None, initargs=()):
+        self.max_workers = max_workers
+        if initializer is not None:
+            initializer(*initargs)
+        InlineProcessPoolExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, function, *iterables, chunksize=1):
+        return map(function, *iterables)
+
+
+def skip_if_daemonic(test_case):
+    """Skips test_case when run in a daemonic process, which can't start processes of its own"""
+    if multiprocessing.current_process().daemon:
+        test_case.skipTest("processes can't be started from a daemonic process, such as with --parallel")
+
+
+class DoublingScript(PopulateScriptTemplate):
+    """Doubles each record's value, skipping zeroes"""
+
+    def update_record(self, record):
+        if record.value < 0:
+            raise ValueError("negative value")
+        record.value *= 2
+
+    def should_skip_record(self, record) -> bool:
+        return record.value == 0
+
+
+class TestPopulateScriptTemplate(SimpleTestCase):
+    """Tests for PopulateScriptTemplate, which populate scripts build on"""
+
+    def update(self, workers):
+        script = DoublingScript()
+        script.workers = workers
+        records = [SimpleNamespace(value=value) for value in [1, 0, 2, -1, 3]]
+        with less_console_noise(), script.record_updater() as update_records:
+            return [(outcome, record.value) for outcome, record in update_records(records)]
+
+    def test_record_updater(self):
+        """Each record is updated, skipped or failed, in order"""
+        expected = [("updated", 2), ("skipped", 0), ("updated", 4), ("failed", -1), ("updated", 6)]
+        self.assertEqual(self.update(workers=1), expected)
+
+    def test_record_updater_in_processes(self):
+        """With more than one worker, records are sent to a pool of that many processes, and come back in order"""
+        expected = [("updated", 2), ("skipped", 0), ("updated", 4), ("failed", -1), ("updated", 6)]
+        InlineProcessPoolExecutor.instances = []
+        with patch("registrar.management.commands.utility.process_pool.ProcessPoolExecutor", InlineProcessPoolExecutor):
+            self.assertEqual(self.update(workers=2), expected)
+        self.assertEqual([executor.max_workers for executor in InlineProcessPoolExecutor.instances], [2])
+
+    def test_record_updater_forks(self):
+        """Records are updated in forked processes. Only runs when tests are run serially."""
+        skip_if_daemonic(self)
+        expected = [("updated", 2), ("skipped", 0), ("updated", 4), ("failed", -1), ("updated", 6)]
+        self.assertEqual(self.update(workers=2), expected)
+
 
 class TestPopulateOrganizationType(MockEppLib):
     """Tests for the populate_organization_type script"""
@@ -718,6 +814,179 @@ class TestExtendExpirationDates(MockEppLib):
             # Explicitly test the expiration date - should be the same
             self.assertEqual(desired_domain.expiration_date, date(2024, 11, 15))
 
+    def test_extends_expiration_date_reads_transition_domains_once(self):
+        """
+        Tests that the idempotence data for every domain is read in a single query,
+        rather than once per domain
+        """
+        with less_console_noise():
+            Domain.objects.get_or_create(
+                name="fakeready.gov", state=Domain.State.READY, expiration_date=date(2023, 11, 15)
+            )
+            with patch.object(TransitionDomain.objects, "filter", wraps=TransitionDomain.objects.filter) as query:
+                self.run_extend_expiration_dates()
+            self.assertEqual(query.call_count, 1)
+            self.assertEqual(Domain.objects.get(name="waterbutpurple.gov").expiration_date, date(2024, 11, 15))
+
+    def test_extends_expiration_date_resumes_from_journal(self):
+        """
+        Tests that a run with a journal file skips the domains handled by an earlier run,
+        and removes the journal once it is done
+        """
+        with less_console_noise():
+            with tempfile.TemporaryDirectory() as directory:
+                journal_file = os.path.join(directory, "journal.json")
+                Checkpoint(journal_file).save(
+                    {
+                        "last_name": "waterbutpurple.gov",
+                        "update_success": ["waterbutpurple.gov"],
+                        "update_skipped": [],
+                        "update_failed": [],
+                    }
+                )
+                with patch(
+                    "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+                    return_value=True,
+                ):
+                    call_command("extend_expiration_dates", journalFile=journal_file)
+
+                # already renewed by the earlier run
+                self.assertEqual(Domain.objects.get(name="waterbutpurple.gov").expiration_date, date(2023, 11, 15))
+                self.assertFalse(os.path.exists(journal_file))
+
+
+class TestSyncRegistryData(MockEppLib):
+    def setUp(self):
+        """Creates domains whose dates differ from, or match, the mocked registry data"""
+        super().setUp()
+        registry_created_at = timezone.make_aware(datetime(2023, 5, 25, 19, 45, 35))
+        # the registry returns an expiration date of 2023-11-15 for this domain
+        self.outdated, _ = Domain.objects.get_or_create(
+            name="waterbutpurple.gov", state=Domain.State.READY, expiration_date=date(2023, 1, 1)
+        )
+        # and 2023-05-25 for the others
+        self.current, _ = Domain.objects.get_or_create(
+            name="current.gov", state=Domain.State.READY, expiration_date=date(2023, 5, 25)
+        )
+        Domain.objects.filter(id=self.current.id).update(created_at=registry_created_at)
+        self.unknown, _ = Domain.objects.get_or_create(
+            name="unknown.gov", state=Domain.State.UNKNOWN, expiration_date=date(2023, 1, 1)
+        )
+        self.later, _ = Domain.objects.get_or_create(
+            name="later.gov", state=Domain.State.DNS_NEEDED, expiration_date=date(2023, 1, 1)
+        )
+        self.current = Domain.objects.get(id=self.current.id)
+
+    def tearDown(self):
+        super().tearDown()
+        Domain.objects.all().delete()
+
+    def run_sync_registry_data(self, **options):
+        with less_console_noise():
+            call_command("sync_registry_data", disablePrompts=True, rateLimit=0, **options)
+
+    def test_updates_dates_which_differ(self):
+        """Dates are taken from the registry, while domains which match it are left alone"""
+        self.run_sync_registry_data(batchSize=2)
+
+        outdated = Domain.objects.get(id=self.outdated.id)
+        self.assertEqual(outdated.expiration_date, date(2023, 11, 15))
+        self.assertEqual(outdated.created_at, timezone.make_aware(datetime(2023, 5, 25, 19, 45, 35)))
+        self.assertGreater(outdated.updated_at, self.outdated.updated_at)
+        self.assertEqual(Domain.objects.get(id=self.later.id).expiration_date, date(2023, 5, 25))
+
+        current = Domain.objects.get(id=self.current.id)
+        self.assertEqual(current.updated_at, self.current.updated_at)
+
+        # domains in the unknown state are synced, but keep their state
+        unknown = Domain.objects.get(id=self.unknown.id)
+        self.assertEqual(unknown.expiration_date, date(2023, 5, 25))
+        self.assertEqual(unknown.state, Domain.State.UNKNOWN)
+
+    def test_skips_unknown_domains_not_in_registry(self):
+        """Domains in the unknown state which are not in the registry yet are skipped, not failed"""
+
+        def side_effect(request, cleaned, timeout=None):
+            if request.name in ["unknown.gov", "waterbutpurple.gov"]:
+                raise RegistryError(code=ErrorCode.OBJECT_DOES_NOT_EXIST)
+            return self.mockSend(request, cleaned)
+
+        self.mockedSendFunction.side_effect = side_effect
+        with patch.object(SyncRegistryDataCommand, "log_script_run_summary"):
+            command = SyncRegistryDataCommand()
+            with less_console_noise():
+                call_command(command, disablePrompts=True, rateLimit=0)
+
+        self.assertEqual(command.not_in_registry, ["unknown.gov"])
+        self.assertEqual(command.failed, ["waterbutpurple.gov"])
+        self.assertEqual(Domain.objects.get(id=self.unknown.id).expiration_date, date(2023, 1, 1))
+
+    def test_records_failures(self):
+        """A registry error for one domain does not stop the others from syncing"""
+
+        def side_effect(request, cleaned, timeout=None):
+            if request.name == "waterbutpurple.gov":
+                raise RegistryError(code=ErrorCode.OBJECT_DOES_NOT_EXIST)
+            return self.mockSend(request, cleaned)
+
+        self.mockedSendFunction.side_effect = side_effect
+        self.run_sync_registry_data()
+
+        self.assertEqual(Domain.objects.get(id=self.outdated.id).expiration_date, date(2023, 1, 1))
+        self.assertEqual(Domain.objects.get(id=self.later.id).expiration_date, date(2023, 5, 25))
+
+    def test_resumes_from_checkpoint(self):
+        """A run resumes after the domain in its checkpoint, and removes the checkpoint once done"""
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_file = os.path.join(directory, "checkpoint.json")
+            Checkpoint(checkpoint_file).save({"last_id": self.outdated.id})
+
+            # stop after one domain: the checkpoint is kept
+            self.run_sync_registry_data(checkpointFile=checkpoint_file, limitParse=1)
+            self.assertEqual(Checkpoint(checkpoint_file).load(), {"last_id": self.current.id})
+            self.assertEqual(Domain.objects.get(id=self.outdated.id).expiration_date, date(2023, 1, 1))
+
+            self.run_sync_registry_data(checkpointFile=checkpoint_file)
+            self.assertEqual(Domain.objects.get(id=self.later.id).expiration_date, date(2023, 5, 25))
+            self.assertFalse(os.path.exists(checkpoint_file))
+            self.assertEqual(Domain.objects.get(id=self.outdated.id).expiration_date, date(2023, 1, 1))
+
+    def test_rate_limiter(self):
+        """Batches are spaced out to average the given rate"""
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        rate_limiter = RateLimiter(10, clock=lambda: now[0], sleep=sleep)
+        rate_limiter.wait(5)
+        rate_limiter.wait(5)
+        now[0] += 2
+        rate_limiter.wait(5)
+        self.assertEqual(sleeps, [0.5])
+
+
+class TestRunInProcesses(SimpleTestCase):
+    """Test run_in_processes, used by export_tables and import_tables"""
+
+    def test_run_in_processes(self):
+        """Results come back in order, whether run in a pool of processes or in this one"""
+        InlineProcessPoolExecutor.instances = []
+        with patch("registrar.management.commands.utility.process_pool.ProcessPoolExecutor", InlineProcessPoolExecutor):
+            self.assertEqual(run_in_processes(pow, [2, 3, 4], [2, 2, 2], workers=2), [4, 9, 16])
+            self.assertEqual(run_in_processes(pow, [2, 3, 4], [2, 2, 2], workers=8), [4, 9, 16])
+            self.assertEqual(run_in_processes(pow, [2, 3, 4], [2, 2, 2], workers=1), [4, 9, 16])
+            self.assertEqual(run_in_processes(pow, [], [], workers=2), [])
+        # no more processes than items, and none at all for one worker or no items
+        self.assertEqual([executor.max_workers for executor in InlineProcessPoolExecutor.instances], [2, 3])
+
+    def test_run_in_processes_forks(self):
+        """Work is done in forked processes. Only runs when tests are run serially."""
+        skip_if_daemonic(self)
+        self.assertEqual(run_in_processes(pow, [2, 3, 4], [2, 2, 2], workers=2), [4, 9, 16])
+
 
 class TestDiscloseEmails(MockEppLib):
     def setUp(self):
@@ -918,12 +1187,11 @@ class TestExportTables(MockEppLib):
         # Mock directory listing
         mock_listdir.side_effect = lambda path: [f"{table}_1.csv" for table in table_names]
 
-        # Mock the resource class and its export method
-        mock_dataset = tablib.Dataset()
-        mock_dataset.headers = ["header1", "header2"]
-        mock_dataset.append(["row1_col1", "row1_col2"])
+        # Mock the resource class and the methods used to export each row
         mock_resource_class = MagicMock()
-        mock_resource_class().export.return_value = mock_dataset
+        mock_resource_class().get_export_headers.return_value = ["header1", "header2"]
+        mock_resource_class().iter_queryset.return_value = [MagicMock()]
+        mock_resource_class().export_resource.return_value = ["row1_col1", "row1_col2"]
         mock_getattr.return_value = mock_resource_class
 
         command_instance = ExportTablesCommand()
@@ -933,6 +1201,9 @@ class TestExportTables(MockEppLib):
         mock_makedirs.assert_called_once_with("tmp", exist_ok=True)
 
         # Check that the CSV file was written
+        for table_name in table_names:
+            mock_open.assert_any_call(f"tmp/{table_name}_1.csv", "w", newline="")
+        mock_open().write.assert_any_call("row1_col1,row1_col2\r\n")
         for table_name in table_names:
             # Check that os.remove was called
             mock_remove.assert_any_call(f"tmp/{table_name}_1.csv")
@@ -971,7 +1242,7 @@ class TestExportTables(MockEppLib):
         """Test that general exceptions in the handle method are handled correctly"""
         with less_console_noise():
             mock_resource_class = MagicMock()
-            mock_resource_class().export.side_effect = Exception("Test Exception")
+            mock_resource_class().iter_queryset.side_effect = Exception("Test Exception")
             mock_getattr.return_value = mock_resource_class
 
             # Import the command to avoid any locale or gettext issues
@@ -982,9 +1253,97 @@ class TestExportTables(MockEppLib):
             self.logger_mock.error.assert_called_with("Failed to export TestTable: Test Exception")
 
 
+class TestExportImportTablesFiles(TestCase):
+    """Test export_tables and import_tables against the database and files in a temporary directory"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.working_directory = os.getcwd()
+        # The scripts read and write files in ./tmp
+        os.chdir(self.directory.name)
+        os.makedirs("tmp")
+        for number in range(5):
+            Website.objects.create(website=f"https://example{number}.gov")
+
+    def tearDown(self):
+        os.chdir(self.working_directory)
+        self.directory.cleanup()
+        Website.objects.all().delete()
+
+    def read_csv(self, filename):
+        with open(f"tmp/{filename}", "r") as csvfile:
+            return tablib.Dataset().load(csvfile.read(), format="csv")
+
+    @less_console_noise_decorator
+    def test_export_table_writes_chunks(self):
+        """Rows are written to files of at most rows_per_file rows, each with the headers"""
+        command = ExportTablesCommand()
+        command.rows_per_file = 2
+        command.export_table("Website")
+
+        self.assertEqual(sorted(os.listdir("tmp")), ["Website_1.csv", "Website_2.csv", "Website_3.csv"])
+        datasets = [self.read_csv(f"Website_{number}.csv") for number in range(1, 4)]
+        self.assertEqual([len(dataset) for dataset in datasets], [2, 2, 1])
+        self.assertEqual(
+            sorted(row[datasets[0].headers.index("website")] for dataset in datasets for row in dataset),
+            sorted(Website.objects.values_list("website", flat=True)),
+        )
+
+    @less_console_noise_decorator
+    def test_export_table_writes_headers_for_empty_table(self):
+        """An empty table is exported as one file of headers"""
+        Website.objects.all().delete()
+        ExportTablesCommand().export_table("Website")
+
+        self.assertEqual(os.listdir("tmp"), ["Website_1.csv"])
+        dataset = self.read_csv("Website_1.csv")
+        self.assertEqual(len(dataset), 0)
+        self.assertIn("website", dataset.headers)
+
+    @less_console_noise_decorator
+    def test_import_table_in_bulk(self):
+        """Exported rows are imported again, in bulk batches, updating existing rows and creating missing ones"""
+        ExportTablesCommand().export_table("Website")
+        Website.objects.filter(website="https://example0.gov").delete()
+        Website.objects.filter(website="https://example1.gov").update(website="https://changed.gov")
+
+        command = ImportTablesCommand()
+        command.skip_epp_save = True
+        self.assertTrue(command.can_import_in_bulk(Website))
+        command.import_table("Website")
+
+        self.assertEqual(
+            sorted(Website.objects.values_list("website", flat=True)),
+            [f"https://example{number}.gov" for number in range(5)],
+        )
+
+
 class TestImportTables(TestCase):
     """Test the import_tables script"""
 
+    def test_group_tables_by_dependency(self):
+        """Tables are grouped in order, and no table is grouped with a table it has a foreign key to"""
+        groups = ImportTablesCommand().group_tables_by_dependency(
+            ["User", "Contact", "Domain", "Host", "HostIp", "DraftDomain", "Website", "UserDomainRole"]
+        )
+        self.assertEqual(
+            groups,
+            [["User"], ["Contact", "Domain"], ["Host"], ["HostIp", "DraftDomain", "Website", "UserDomainRole"]],
+        )
+
+    def test_can_import_in_bulk(self):
+        """Only models without many to many fields or their own save are imported in bulk"""
+        command = ImportTablesCommand()
+        command.skip_epp_save = True
+        self.assertTrue(command.can_import_in_bulk(Domain))
+        self.assertTrue(command.can_import_in_bulk(PublicContact))
+        self.assertFalse(command.can_import_in_bulk(Contact))
+        self.assertFalse(command.can_import_in_bulk(User))
+        self.assertFalse(command.can_import_in_bulk(DomainRequest))
+
+        command.skip_epp_save = False
+        self.assertFalse(command.can_import_in_bulk(PublicContact))
+
     @patch("registrar.management.commands.import_tables.os.makedirs")
     @patch("registrar.management.commands.import_tables.os.path.exists")
     @patch("registrar.management.commands.import_tables.os.remove")
@@ -1225,3 +1584,53 @@ class TestTransferFederalAgencyType(TestCase):
 
         # We don't expect this field to be updated (as it has duplicate data)
         self.assertEqual(self.gov_admin.federal_type, None)
+
+
+class TestPopulateDomainRequestStatusChanges(TestCase):
+    """Tests for the populate_domain_request_status_changes script"""
+
+    def setUp(self):
+        super().setUp()
+        self.domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.SUBMITTED)
+        self.domain_request.status = DomainRequest.DomainRequestStatus.REJECTED
+        self.domain_request.rejection_reason = DomainRequest.RejectionReasons.DOMAIN_PURPOSE
+        self.domain_request.save()
+        self.domain_request.rejection_reason = DomainRequest.RejectionReasons.NAMING_REQUIREMENTS
+        self.domain_request.save()
+
+        # Changes recorded as the audit log was written, as the script should record them
+        self.expected_changes = self.get_changes()
+        # Audit log entries from before status changes were recorded
+        DomainRequestStatusChange.objects.all().delete()
+
+    def tearDown(self):
+        DomainRequest.objects.all().delete()
+        User.objects.all().delete()
+        super().tearDown()
+
+    def get_changes(self):
+        changes = DomainRequestStatusChange.objects.order_by("log_entry_id")
+        return list(changes.values_list("domain_request", "log_entry", "status", "rejection_reason", "timestamp"))
+
+    @less_console_noise_decorator
+    def run_populate_domain_request_status_changes(self, **options):
+        call_command("populate_domain_request_status_changes", disablePrompts=True, **options)
+
+    def test_status_changes_recorded(self):
+        """Each audit log entry which changed the status or a reason is recorded once, in every batch"""
+        self.assertEqual(len(self.expected_changes), 3)
+        self.run_populate_domain_request_status_changes(batchSize=2)
+        self.assertEqual(self.get_changes(), self.expected_changes)
+
+        # Running the script again records nothing new
+        self.run_populate_domain_request_status_changes()
+        self.assertEqual(self.get_changes(), self.expected_changes)
+
+    def test_deleted_domain_requests_skipped(self):
+        """Audit log entries for domain requests which no longer exist are skipped"""
+        other_request = completed_domain_request(name="other.gov")
+        DomainRequestStatusChange.objects.all().delete()
+        other_request.delete()
+
+        self.run_populate_domain_request_status_changes()
+        self.assertEqual(self.get_changes(), self.expected_changes)
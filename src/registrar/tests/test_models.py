@@ -8,6 +8,7 @@ from django.test import RequestFactory
 from registrar.models import (
     Contact,
     DomainRequest,
+    DomainRequestStatusChange,
     DomainInformation,
     User,
     Website,
@@ -19,6 +20,7 @@ from registrar.models import (
 )
 
 import boto3_mocking
+from auditlog.context import set_actor  # type: ignore
 from registrar.models.transition_domain import TransitionDomain
 from registrar.models.verified_by_staff import VerifiedByStaff  # type: ignore
 from registrar.utility.constants import BranchChoices
@@ -1490,6 +1492,64 @@ class TestDomainRequestCustomSave(TestCase):
         self.assertEqual(domain_request_election.generic_org_type, DomainRequest.OrganizationChoices.CITY)
 
 
+class TestDomainRequestStatusChange(TestCase):
+    """Tests that changes to a domain request's status and reasons are recorded from the audit log"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create(username="analyst", first_name="Ana", last_name="Lyst")
+        self.domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.SUBMITTED)
+
+    def tearDown(self):
+        DomainRequest.objects.all().delete()
+        User.objects.all().delete()
+        super().tearDown()
+
+    def get_changes(self):
+        changes = DomainRequestStatusChange.objects.filter(domain_request=self.domain_request).order_by("id")
+        return list(changes.values_list("status", "rejection_reason", "action_needed_reason"))
+
+    def test_creation_recorded(self):
+        """Creating a domain request records its first status"""
+        self.assertEqual(self.get_changes(), [(DomainRequest.DomainRequestStatus.SUBMITTED, None, None)])
+
+    def test_changes_recorded(self):
+        """Changing the status or either reason is recorded, with who changed it. Other changes are not."""
+        with set_actor(self.user):
+            self.domain_request.status = DomainRequest.DomainRequestStatus.ACTION_NEEDED
+            self.domain_request.action_needed_reason = DomainRequest.ActionNeededReasons.BAD_NAME
+            self.domain_request.save()
+
+            self.domain_request.status = DomainRequest.DomainRequestStatus.REJECTED
+            self.domain_request.rejection_reason = DomainRequest.RejectionReasons.DOMAIN_PURPOSE
+            self.domain_request.save()
+
+            # a new reason on its own implies the status
+            self.domain_request.rejection_reason = DomainRequest.RejectionReasons.NAMING_REQUIREMENTS
+            self.domain_request.save()
+
+            self.domain_request.anything_else = "Something else"
+            self.domain_request.save()
+
+        self.assertEqual(
+            self.get_changes(),
+            [
+                (DomainRequest.DomainRequestStatus.SUBMITTED, None, None),
+                (DomainRequest.DomainRequestStatus.ACTION_NEEDED, None, DomainRequest.ActionNeededReasons.BAD_NAME),
+                (DomainRequest.DomainRequestStatus.REJECTED, DomainRequest.RejectionReasons.DOMAIN_PURPOSE, None),
+                (DomainRequest.DomainRequestStatus.REJECTED, DomainRequest.RejectionReasons.NAMING_REQUIREMENTS, None),
+            ],
+        )
+        latest = DomainRequestStatusChange.objects.filter(domain_request=self.domain_request).latest("id")
+        self.assertEqual(latest.actor, self.user)
+        self.assertEqual(latest.timestamp, latest.log_entry.timestamp)
+
+    def test_deleting_request_deletes_changes(self):
+        """Deleting a domain request is not recorded, and removes its changes"""
+        self.domain_request.delete()
+        self.assertFalse(DomainRequestStatusChange.objects.exists())
+
+
 class TestDomainInformationCustomSave(TestCase):
     """Tests custom save behaviour on the DomainInformation object"""
 
@@ -4,12 +4,14 @@ Feature being tested: Registry Integration
 This file tests the various ways in which the registrar interacts with the registry.
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.db.utils import IntegrityError
+from auditlog.models import LogEntry  # type: ignore
 from unittest.mock import MagicMock, patch, call
 import datetime
 from django.utils.timezone import make_aware
 from registrar.models import Domain, Host, HostIP
+from registrar.models.utility.host_reconciler import reconcile_hosts_and_ips
 
 from unittest import skip
 from registrar.models.domain_request import DomainRequest
@@ -19,6 +21,8 @@ from registrar.models.public_contact import PublicContact
 from registrar.models.user import User
 from registrar.utility.errors import ActionNotAllowed, NameserverError
 
+from registrar.models.utility.availability_cache import availability_cache
+from registrar.models.utility.registry_cache import registry_cache
 from registrar.models.utility.contact_error import ContactError, ContactErrorCodes
 from registrar.utility import errors
 
@@ -345,6 +349,92 @@ class TestDomainCache(MockEppLib):
             self.assertEqual(PublicContact.objects.filter(domain=domain.id).count(), 2)
 
 
+class TestSharedRegistryCache(MockEppLib):
+    """Registry data fetched by one request is reused by later requests"""
+
+    def tearDown(self):
+        PublicContact.objects.all().delete()
+        HostIP.objects.all().delete()
+        Host.objects.all().delete()
+        Domain.objects.all().delete()
+        super().tearDown()
+
+    def info_domain_calls(self):
+        """Returns how many InfoDomain commands were sent"""
+        return len(
+            [
+                mock_call
+                for mock_call in self.mockedSendFunction.call_args_list
+                if isinstance(mock_call.args[0], commands.InfoDomain)
+            ]
+        )
+
+    def test_other_instances_read_shared_cache(self):
+        """A second Domain instance for the same name does not contact the registry"""
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="igorville.gov")
+            _ = domain.creation_date
+            calls = self.info_domain_calls()
+
+            same_domain = Domain.objects.get(name="igorville.gov")
+            self.assertEqual(same_domain._cache, {})
+            self.assertEqual(same_domain.creation_date, self.mockDataInfoDomain.cr_date)
+            self.assertEqual(same_domain.statuses, domain.statuses)
+            self.assertEqual(self.info_domain_calls(), calls)
+
+    def test_invalidating_clears_shared_cache(self):
+        """Invalidating the cache on one instance makes other instances fetch again"""
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="igorville.gov")
+            _ = domain.creation_date
+            calls = self.info_domain_calls()
+            domain._invalidate_cache()
+
+            same_domain = Domain.objects.get(name="igorville.gov")
+            _ = same_domain.creation_date
+            self.assertEqual(self.info_domain_calls(), calls + 1)
+
+    def test_setter_clears_shared_cache(self):
+        """Sending an update through a property setter invalidates the shared cache"""
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="igorville.gov")
+            _ = domain.creation_date
+            calls = self.info_domain_calls()
+            domain.dnssecdata = []
+
+            same_domain = Domain.objects.get(name="igorville.gov")
+            _ = same_domain.creation_date
+            self.assertEqual(self.info_domain_calls(), calls + 1)
+
+    def test_partial_fetch_keeps_shared_hosts(self):
+        """A fetch without hosts does not drop the hosts another instance shared"""
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="igorville.gov")
+            _ = domain.nameservers
+            hosts = registry_cache.get(domain.name)["hosts"]
+
+            same_domain = Domain.objects.get(name="igorville.gov")
+            same_domain._fetch_cache()
+            self.assertEqual(registry_cache.get(domain.name)["hosts"], hosts)
+
+            # hosts built from what the registry no longer lists are dropped
+            registry_cache.set(domain.name, {**registry_cache.get(domain.name), "_hosts": ["old.igorville.gov"]})
+            same_domain._fetch_cache()
+            self.assertNotIn("hosts", registry_cache.get(domain.name))
+
+    @override_settings(REGISTRY_CACHE_TIMEOUT=0)
+    def test_shared_cache_can_be_disabled(self):
+        """With a timeout of 0 every instance contacts the registry"""
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="igorville.gov")
+            _ = domain.creation_date
+            calls = self.info_domain_calls()
+
+            same_domain = Domain.objects.get(name="igorville.gov")
+            _ = same_domain.creation_date
+            self.assertEqual(self.info_domain_calls(), calls + 1)
+
+
 class TestDomainCreation(MockEppLib):
     """Rule: An approved domain request must result in a domain"""
 
@@ -640,6 +730,96 @@ class TestDomainAvailable(MockEppLib):
                 Domain.available("raises-error.gov")
             patcher.stop()
 
+    def test_domain_availability_is_cached(self):
+        """
+        Scenario: Checking the same domain twice
+            Only the first check is sent to the registry
+            The second is counted as a cache hit
+        """
+
+        def side_effect(_request, cleaned):
+            return MagicMock(
+                res_data=[responses.check.CheckDomainResultData(name="cached.gov", avail=False, reason="In Use")],
+            )
+
+        with less_console_noise():
+            with patch("registrar.models.domain.registry.send") as mocked_send:
+                mocked_send.side_effect = side_effect
+                hits = availability_cache.stats()["hits"]
+
+                self.assertFalse(Domain.available("cached.gov"))
+                self.assertFalse(Domain.available("Cached.gov"))
+
+                self.assertEqual(mocked_send.call_count, 1)
+                self.assertEqual(availability_cache.stats()["hits"], hits + 1)
+
+    @override_settings(AVAILABILITY_CACHE_AVAILABLE_TIMEOUT=0)
+    def test_available_domains_cached_separately(self):
+        """
+        Scenario: Caching of available domains is turned off
+            Taken domains are still cached, available ones are checked every time
+        """
+
+        def side_effect(_request, cleaned):
+            return MagicMock(
+                res_data=[
+                    responses.check.CheckDomainResultData(name="free.gov", avail=True, reason=None),
+                    responses.check.CheckDomainResultData(name="taken.gov", avail=False, reason="In Use"),
+                ],
+            )
+
+        with less_console_noise():
+            with patch("registrar.models.domain.registry.send") as mocked_send:
+                mocked_send.side_effect = side_effect
+                self.assertEqual(
+                    Domain.available_many(["free.gov", "taken.gov"]), {"free.gov": True, "taken.gov": False}
+                )
+                self.assertFalse(Domain.available("taken.gov"))
+                self.assertEqual(mocked_send.call_count, 1)
+
+                Domain.available_many(["free.gov", "taken.gov"])
+                mocked_send.assert_called_with(commands.CheckDomain(["free.gov"]), cleaned=True)
+
+    def test_domain_available_many(self):
+        """
+        Scenario: Checking several domains
+            Sends one CheckDomain for all of them
+            Matches the results to the domains by name, whatever order they come back in
+        """
+
+        def side_effect(_request, cleaned):
+            return MagicMock(
+                res_data=[
+                    responses.check.CheckDomainResultData(name=name, avail=(name == "first.gov"), reason=None)
+                    for name in reversed(_request.names)
+                ],
+            )
+
+        with less_console_noise():
+            with patch("registrar.models.domain.registry.send") as mocked_send:
+                mocked_send.side_effect = side_effect
+                availability = Domain.available_many(["first.gov", "SECOND.gov", "first.gov"])
+                mocked_send.assert_called_once_with(commands.CheckDomain(["first.gov", "second.gov"]), cleaned=True)
+                self.assertEqual(availability, {"first.gov": True, "second.gov": False})
+
+    def test_domain_available_many_unanswered(self):
+        """
+        Scenario: The registry leaves a domain out of its answer
+            Raises a RegistryError, and caches nothing
+        """
+
+        def side_effect(_request, cleaned):
+            return MagicMock(
+                res_data=[responses.check.CheckDomainResultData(name="answered.gov", avail=False, reason="In Use")],
+            )
+
+        with less_console_noise():
+            with patch("registrar.models.domain.registry.send") as mocked_send:
+                mocked_send.side_effect = side_effect
+                with self.assertRaises(RegistryError):
+                    Domain.available_many(["answered.gov", "unanswered.gov"])
+                self.assertEqual(availability_cache.get_many(["answered.gov"]), {})
+
 
 class TestRegistrantContacts(MockEppLib):
     """Rule: Registrants may modify their WHOIS data"""
@@ -1692,21 +1872,12 @@ class TestRegistrantNameservers(MockEppLib):
             # make the domain
             domain, _ = Domain.objects.get_or_create(name="meow.gov", state=Domain.State.READY)
 
-            # mock the get_or_create methods for Host and HostIP
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
-
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
 
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.meow.gov")
-                # Retrieve the mocked_host from the return value of the mock
-                actual_mocked_host, _ = mock_host_get_or_create.return_value
-                mock_host_ip_get_or_create.assert_called_with(address="2.0.0.8", host=actual_mocked_host)
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 1)
+            host = Host.objects.get(domain=domain)
+            self.assertEqual(host.name, "fake.meow.gov")
+            self.assertEqual(list(host.ip.values_list("address", flat=True)), ["2.0.0.8"])
 
     def test_nameservers_stored_on_fetch_cache_a_subdomain_without_ip(self):
         """
@@ -1717,24 +1888,17 @@ class TestRegistrantNameservers(MockEppLib):
             # make the domain
             domain, _ = Domain.objects.get_or_create(name="subdomainwoip.gov", state=Domain.State.READY)
 
-            # mock the get_or_create methods for Host and HostIP
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
-
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
 
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.subdomainwoip.gov")
-                mock_host_ip_get_or_create.assert_not_called()
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 0)
+            host = Host.objects.get(domain=domain)
+            self.assertEqual(host.name, "fake.subdomainwoip.gov")
+            self.assertFalse(host.ip.exists())
 
     def test_nameservers_stored_on_fetch_cache_not_subdomain_with_ip(self):
         """
         Scenario: Nameservers are stored in db when they are retrieved from fetch_cache.
-            Verify the success of this by asserting get_or_create calls to db.
+            Verify the success of this by checking the hosts stored in the db.
             The mocked data for the EPP calls returns a host name
             of 'fake.host.com' from InfoDomain and an array of 2 IPs: 1.2.3.4 and 2.3.4.5
             from InfoHost
@@ -1745,18 +1909,12 @@ class TestRegistrantNameservers(MockEppLib):
         with less_console_noise():
             domain, _ = Domain.objects.get_or_create(name="fake.gov", state=Domain.State.READY)
 
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
-
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
 
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.host.com")
-                mock_host_ip_get_or_create.assert_not_called()
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 0)
+            host = Host.objects.get(domain=domain)
+            self.assertEqual(host.name, "fake.host.com")
+            self.assertFalse(host.ip.exists())
 
     def test_nameservers_stored_on_fetch_cache_not_subdomain_without_ip(self):
         """
@@ -1766,17 +1924,56 @@ class TestRegistrantNameservers(MockEppLib):
         with less_console_noise():
             domain, _ = Domain.objects.get_or_create(name="fakemeow.gov", state=Domain.State.READY)
 
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
-
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.meow.com")
-                mock_host_ip_get_or_create.assert_not_called()
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 0)
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
+
+            host = Host.objects.get(domain=domain)
+            self.assertEqual(host.name, "fake.meow.com")
+            self.assertFalse(host.ip.exists())
+
+    def test_reconcile_hosts_and_ips(self):
+        """
+        Scenario: Stored hosts differ from the registry's hosts for several domains.
+            Hosts and IPs which the registry no longer has, and duplicates, are deleted
+            and new ones created. Once they match, only the stored hosts and IPs are read.
+        """
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="reconcile.gov", state=Domain.State.READY)
+            other_domain, _ = Domain.objects.get_or_create(name="reconcile-other.gov", state=Domain.State.READY)
+            kept = Host.objects.create(domain=domain, name="ns1.reconcile.gov")
+            HostIP.objects.create(host=kept, address="1.1.1.1")
+            HostIP.objects.create(host=kept, address="2.2.2.2")
+            Host.objects.create(domain=domain, name="ns1.reconcile.gov")
+            removed = Host.objects.create(domain=domain, name="ns2.reconcile.gov")
+            HostIP.objects.create(host=removed, address="3.3.3.3")
+            Host.objects.create(domain=other_domain, name="ns1.other.gov")
+
+            hosts_by_domain = {
+                domain: [
+                    {"name": "ns1.reconcile.gov", "addrs": ["2.2.2.2", "4.4.4.4"]},
+                    {"name": "ns3.reconcile.gov", "addrs": ["5.5.5.5", "5.5.5.5"]},
+                ],
+                other_domain.pk: [],
+            }
+            counts = reconcile_hosts_and_ips(hosts_by_domain)
+
+            self.assertEqual(counts, {"hosts_created": 1, "hosts_deleted": 3, "ips_created": 2, "ips_deleted": 2})
+            stored = {
+                host.name: sorted(host.ip.values_list("address", flat=True))
+                for host in Host.objects.filter(domain=domain)
+            }
+            self.assertEqual(stored, {"ns1.reconcile.gov": ["2.2.2.2", "4.4.4.4"], "ns3.reconcile.gov": ["5.5.5.5"]})
+            self.assertTrue(Host.objects.filter(pk=kept.pk).exists())
+            self.assertFalse(Host.objects.filter(domain=other_domain).exists())
+
+            # created rows are audited, as deleted ones are
+            created_host = Host.objects.get(name="ns3.reconcile.gov")
+            for created in [created_host, *HostIP.objects.filter(address__in=["4.4.4.4", "5.5.5.5"])]:
+                self.assertTrue(LogEntry.objects.get_for_object(created).filter(action=LogEntry.Action.CREATE).exists())
+
+            with self.assertNumQueries(2):
+                counts = reconcile_hosts_and_ips(hosts_by_domain)
+            self.assertEqual(counts, {"hosts_created": 0, "hosts_deleted": 0, "ips_created": 0, "ips_deleted": 0})
 
     @skip("not implemented yet")
     def test_update_is_unsuccessful(self):
@@ -5,14 +5,22 @@ from io import StringIO
 from registrar.models.domain_request import DomainRequest
 from registrar.models.domain import Domain
 from registrar.models.utility.generic_helper import convert_queryset_to_dict
+from registrar.models import AnalyticsCount
 from registrar.utility.csv_export import (
     export_data_managed_domains_to_csv,
     export_data_unmanaged_domains_to_csv,
     get_sliced_domains,
+    get_sliced_domains_at_dates,
     get_sliced_requests,
+    get_sliced_requests_at_dates,
+    get_rows_for_domains,
+    stream_csv,
     write_csv_for_domains,
     get_default_start_date,
     get_default_end_date,
+    get_analytics_sliced_counts,
+    get_analytics_summary,
+    take_analytics_snapshot,
     DomainRequestExport,
 )
 
@@ -571,6 +579,45 @@ class ExportDataTest(MockDb, MockEppLib):
             expected_content = expected_content.replace(",,", "").replace(",", "").replace(" ", "").strip()
             self.assertEqual(csv_content, expected_content)
 
+    def test_stream_csv_for_domains_matches_written_csv(self):
+        """Test that streaming rows from get_rows_for_domains gives the same CSV as
+        write_csv_for_domains, with every domain manager column in the header."""
+
+        with less_console_noise():
+            columns = ["Domain name", "Status", "Security contact email"]
+            sort_fields = ["domain__name"]
+            filter_condition = {
+                "domain__state__in": [
+                    Domain.State.READY,
+                    Domain.State.DNS_NEEDED,
+                    Domain.State.ON_HOLD,
+                ],
+            }
+
+            csv_file = StringIO()
+            write_csv_for_domains(
+                csv.writer(csv_file),
+                list(columns),
+                sort_fields,
+                filter_condition,
+                should_get_domain_managers=True,
+                should_write_header=True,
+            )
+
+            rows = get_rows_for_domains(
+                list(columns),
+                sort_fields,
+                filter_condition,
+                should_get_domain_managers=True,
+                should_write_header=True,
+            )
+            # The header is known before any domain is read
+            header = next(rows)
+            self.assertEqual(header[-2:], ["Domain manager 4", "DM4 status"])
+
+            streamed_content = "".join(stream_csv([header])) + "".join(stream_csv(rows))
+            self.assertEqual(streamed_content, csv_file.getvalue())
+
     def test_export_data_managed_domains_to_csv(self):
         """Test get counts for domains that have domain managers for two different dates,
         get list of managed domains at end_date.
@@ -812,3 +859,42 @@ class HelperFunctions(MockDb):
             submitted_requests_sliced_at_end_date = get_sliced_requests(filter_condition)
             expected_content = [3, 2, 0, 0, 0, 0, 1, 0, 0, 1]
             self.assertEqual(submitted_requests_sliced_at_end_date, expected_content)
+
+    def test_get_sliced_domains_at_dates(self):
+        """Should get the same counts at both dates as get_sliced_domains does for each date."""
+
+        with less_console_noise():
+            sliced_at_start_date, sliced_at_end_date = get_sliced_domains_at_dates(
+                {"domain__permissions__isnull": False}, "domain__first_ready", self.start_date, self.end_date
+            )
+            expected_at_start_date = get_sliced_domains(
+                {"domain__permissions__isnull": False, "domain__first_ready__lte": self.start_date}
+            )
+            self.assertEqual(sliced_at_start_date, expected_at_start_date)
+            self.assertEqual(sliced_at_end_date, [3, 2, 1, 0, 0, 0, 0, 0, 0, 0])
+
+    def test_get_sliced_requests_at_dates(self):
+        """Should get the same counts at both dates as get_sliced_requests does for each date."""
+
+        with less_console_noise():
+            filter_condition = {"status": DomainRequest.DomainRequestStatus.SUBMITTED}
+            sliced_at_start_date, sliced_at_end_date = get_sliced_requests_at_dates(
+                filter_condition, "submission_date", self.start_date, self.end_date
+            )
+            expected_at_start_date = get_sliced_requests({**filter_condition, "submission_date__lte": self.start_date})
+            self.assertEqual(sliced_at_start_date, expected_at_start_date)
+            self.assertEqual(sliced_at_end_date, [3, 2, 0, 0, 0, 0, 1, 0, 0, 1])
+
+    def test_analytics_snapshot_counts_match_live_counts(self):
+        """Counts read from an analytics snapshot should match counting domains and requests live."""
+
+        with less_console_noise():
+            snapshot = take_analytics_snapshot()
+            for end_date in [self.end_date, timezone.now()]:
+                for category in AnalyticsCount.Category:
+                    with self.subTest(category=category, end_date=end_date):
+                        self.assertEqual(
+                            get_analytics_sliced_counts(category, self.start_date, end_date, snapshot),
+                            get_analytics_sliced_counts(category, self.start_date, end_date),
+                        )
+            self.assertEqual(get_analytics_summary(snapshot), get_analytics_summary())
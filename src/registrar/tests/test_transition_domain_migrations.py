@@ -1,7 +1,10 @@
 import datetime
+import os
+import tempfile
 
 from io import StringIO
 
+from auditlog.models import LogEntry  # type: ignore
 from django.test import TestCase
 
 from registrar.models import (
@@ -18,6 +21,12 @@ from django.core.management import call_command
 from unittest.mock import patch
 
 from registrar.models.contact import Contact
+from registrar.management.commands.utility.epp_data_containers import OrganizationAdhoc
+from registrar.management.commands.utility.extra_transition_domain_helper import (
+    ExtraTransitionDomain,
+    IndexedAdhocFile,
+)
+from registrar.management.commands.utility.transition_domain_arguments import TransitionDomainArguments
 
 from .common import MockSESClient, less_console_noise
 import boto3_mocking  # type: ignore
@@ -232,7 +241,7 @@ class TestOrganizationMigration(TestCase):
         with less_console_noise():
             call_command("transfer_transition_domains_to_domains")
 
-    def run_load_organization_data(self):
+    def run_load_organization_data(self, **options):
         """
         This method executes the load_organization_data command.
 
@@ -254,6 +263,7 @@ class TestOrganizationMigration(TestCase):
                     "load_organization_data",
                     self.migration_json_filename,
                     directory=self.test_data_file_location,
+                    **options,
                 )
 
     def compare_tables(
@@ -358,6 +368,19 @@ class TestOrganizationMigration(TestCase):
 
             self.assertEqual(transition, expected_transition_domain)
 
+    def test_load_organization_data_with_index_files(self):
+        """Organization data read through an index of the adhoc files is the same as when held in memory"""
+        with less_console_noise():
+            self.run_load_domains()
+            self.run_transfer_domains()
+            self.run_load_organization_data(index_files=True)
+
+            transition = TransitionDomain.objects.filter(domain_name="fakewebsite2.gov").first()
+            self.assertEqual(transition.address_line, "93001 Arizona Drive")
+            self.assertEqual(transition.city, "Columbus")
+            self.assertEqual(transition.state_territory, "Oh")
+            self.assertEqual(transition.zipcode, "43268")
+
     def test_transition_domain_status_unknown(self):
         """
         Test that a domain in unknown status can be loaded
@@ -789,6 +812,38 @@ class TestMigrations(TestCase):
                 expected_missing_domain_invitations,
             )
 
+    def test_transfer_transition_domains_to_domains_in_batches(self):
+        """Transferring a few transition domains per transaction gives the same tables as one batch"""
+        with less_console_noise():
+            self.run_load_domains()
+            call_command("transfer_transition_domains_to_domains", batchSize=2)
+
+            self.compare_tables(9, 5, 5, 8, 0, 0, 0, 1)
+            self.assertFalse(TransitionDomain.objects.filter(processed=False).exists())
+
+            # invitations are created in bulk, but still audited
+            for invitation in DomainInvitation.objects.all():
+                log_entries = LogEntry.objects.get_for_object(invitation)
+                self.assertTrue(log_entries.filter(action=LogEntry.Action.CREATE).exists())
+            contacts = Contact.objects.filter(user__isnull=True)
+            self.assertTrue(contacts.exists())
+            for contact in contacts:
+                log_entries = LogEntry.objects.get_for_object(contact)
+                self.assertTrue(log_entries.filter(action=LogEntry.Action.CREATE).exists())
+
+    def test_load_transition_domain_audits_updated_entries(self):
+        """Reloading updates the status of unprocessed entries in bulk, but still audits them"""
+        with less_console_noise():
+            self.run_load_domains()
+            entries = TransitionDomain.objects.filter(domain_name="fakewebsite2.gov")
+            entries.update(status=TransitionDomain.StatusChoices.READY)
+            self.run_load_domains()
+
+            for entry in entries:
+                self.assertEqual(entry.status, TransitionDomain.StatusChoices.ON_HOLD)
+                log_entries = LogEntry.objects.get_for_object(entry).filter(action=LogEntry.Action.UPDATE)
+                self.assertIn("status", log_entries.latest("timestamp").changes_dict)
+
     def test_logins(self):
         with less_console_noise():
             # TODO: setup manually instead of calling other scripts
@@ -868,3 +923,47 @@ class TestMigrations(TestCase):
         self.assertIn("Found 2 transition domains", output)
         self.assertTrue("would send email to testuser@gmail.com", output)
         self.assertTrue("would send email to agustina.wyman7@test.com", output)
+
+
+class TestExtraTransitionDomainFiles(TestCase):
+    """Tests reading the adhoc files used to load additional TransitionDomain data"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "organization.adhoc.dotgov.txt")
+        with open(self.filename, "w", encoding="utf-8") as file:
+            file.write(
+                "orgid|orgname|orgstreet|orgcity|orgstate|orgzip|orgcountrycode\n"
+                "1|Flashdog|298 Monument Hill|Lakeland|Florida|33805|US\n"
+                "2|Gigaclub | Gigaclub Labs|782 Mosinee Lane|Alexandria|Louisiana|71307|US\n"
+                "3|Brightdog|1 Main St|Lakeland|Florida|33805|US|extra|values\n"
+                "4|Shortdog\n"
+            )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_file(self, index_files):
+        options = TransitionDomainArguments(directory=self.directory.name, index_files=index_files)
+        parser = ExtraTransitionDomain(options)
+        with less_console_noise():
+            return parser._read_csv_file(self.filename, "|", OrganizationAdhoc, "orgid")
+
+    def test_read_csv_file_repairs_bad_seperators(self):
+        """Seperators inside of values are repaired, and rows which cannot be repaired are skipped"""
+        data = self.read_file(index_files=False)
+
+        self.assertEqual(list(data), ["1", "2", "4"])
+        self.assertEqual(data["1"].orgname, "Flashdog")
+        self.assertEqual(data["2"].orgname, "Gigaclub | Gigaclub Labs")
+        self.assertEqual(data["2"].orgstreet, "782 Mosinee Lane")
+        self.assertEqual(data["4"], OrganizationAdhoc(orgid="4", orgname="Shortdog"))
+
+    def test_read_csv_file_with_index_files(self):
+        """An indexed file holds the same rows as the dict, reading them from disk"""
+        data = self.read_file(index_files=True)
+
+        self.assertIsInstance(data, IndexedAdhocFile)
+        self.assertEqual(dict(data), self.read_file(index_files=False))
+        self.assertIn("2", data)
+        self.assertIsNone(data.get("3"))
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, ANY, patch
 
 from django.conf import settings
 from django.urls import reverse
+from django.test import RequestFactory
 from django.contrib.auth import get_user_model
 
 from .common import MockEppLib, MockSESClient, create_user  # type: ignore
@@ -38,6 +39,7 @@ from django.utils import timezone
 
 from .common import less_console_noise
 from .test_views import TestWithUser
+from registrar.views.utility.domain_access import get_domain_with_access
 
 import logging
 
@@ -178,6 +180,23 @@ class TestDomainPermissions(TestWithDomainPermissions):
                     response = self.client.get(reverse(view_name, kwargs={"pk": self.domain.id}))
                 self.assertEqual(response.status_code, 403)
 
+    def test_domain_with_access_looked_up_once_per_request(self):
+        """The domain, its information and the user's role come from one query, kept on the request"""
+        request = RequestFactory().get("/")
+        request.user = self.user
+        with self.assertNumQueries(1):
+            domain = get_domain_with_access(request, self.domain.id)
+            self.assertEqual(domain, self.domain)
+            self.assertEqual(domain.user_role, UserDomainRole.Roles.MANAGER)
+            self.assertEqual(domain.domain_info, self.domain_information)
+            self.assertIs(get_domain_with_access(request, str(self.domain.id)), domain)
+
+        self.role.delete()
+        other_request = RequestFactory().get("/")
+        other_request.user = self.user
+        self.assertIsNone(get_domain_with_access(other_request, self.domain.id).user_role)
+        self.assertIsNone(get_domain_with_access(other_request, 0))
+
     def test_domain_pages_blocked_for_on_hold_and_deleted(self):
         """Test that the domain pages are blocked for on hold and deleted domains"""
 
@@ -244,6 +263,30 @@ class TestDomainDetail(TestDomainOverview):
 
             self.assertNotContains(detail_page, "DNS needed")
 
+    def test_domain_detail_keeps_compact_snapshot_in_session(self):
+        """The session only holds the domain's pk and version, not the domain"""
+        with less_console_noise():
+            self.client.get(reverse("domain", kwargs={"pk": self.domain.id}))
+            domain = Domain.objects.get(id=self.domain.id)
+            self.assertEqual(
+                self.client.session[f"domain:{self.domain.id}"],
+                {"pk": domain.id, "version": domain.updated_at.isoformat()},
+            )
+
+    def test_domain_detail_refreshes_registry_data_for_changed_domain(self):
+        """Registry data is fetched afresh when the domain changed since the session last saw it"""
+        with less_console_noise():
+            self.client.get(reverse("domain", kwargs={"pk": self.domain.id}))
+            with patch("registrar.views.domain.registry_cache") as registry_cache:
+                self.client.get(reverse("domain", kwargs={"pk": self.domain.id}))
+                registry_cache.delete.assert_not_called()
+
+                session = self.client.session
+                session[f"domain:{self.domain.id}"] = {"pk": self.domain.id, "version": "2020-01-01T00:00:00+00:00"}
+                session.save()
+                self.client.get(reverse("domain", kwargs={"pk": self.domain.id}))
+                registry_cache.delete.assert_called_once_with(self.domain.name)
+
     def test_domain_detail_blocked_for_ineligible_user(self):
         """We could easily duplicate this test for all domain management
         views, but a single url test should be solid enough since all domain
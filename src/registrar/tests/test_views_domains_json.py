@@ -1,3 +1,5 @@
+import base64
+import json
 from registrar.models import UserDomainRole, Domain
 from django.urls import reverse
 from .test_views import TestWithUser
@@ -203,3 +205,48 @@ class GetDomainsJsonTest(TestWithUser, WebTest):
                 self.assertEqual(response.status_code, 200)
                 data = response.json
                 self.assertEqual(len(data["domains"]), num_domains)
+
+    @less_console_noise_decorator
+    def test_state_display_expression_matches_state_display(self):
+        """Test that the state_display annotation used for filtering and sorting agrees with state_display"""
+        Domain.objects.create(name="example4.com", expiration_date="2999-01-01", state="on hold")
+        Domain.objects.create(name="example5.com", expiration_date="2999-01-01", state="dns needed")
+        Domain.objects.create(name="example6.com", expiration_date=None, state="ready")
+        Domain.objects.create(name="example7.com", expiration_date=None, state="unknown")
+
+        domains = Domain.objects.annotate(display_state=Domain.state_display_expression())
+        self.assertEqual(domains.count(), 7)
+        for domain in domains:
+            with self.subTest(domain=domain.name):
+                self.assertEqual(domain.display_state, domain.state_display())
+
+    @less_console_noise_decorator
+    def test_cursor_pagination_by_state_display(self):
+        """Test that cursor pagination sorts by state_display like page numbers do"""
+        for order in ["asc", "desc"]:
+            with self.subTest(order=order):
+                params = {"sort_by": "state_display", "order": order}
+                paged = self.app.get(reverse("get_domains_json"), params).json
+                by_cursor = self.app.get(reverse("get_domains_json"), {**params, "cursor": ""}).json
+                # ties are broken by id in the sort order, rather than always ascending
+                self.assertEqual(
+                    [domain["state_display"] for domain in by_cursor["domains"]],
+                    [domain["state_display"] for domain in paged["domains"]],
+                )
+                self.assertCountEqual(by_cursor["domains"], paged["domains"])
+                self.assertIsNone(by_cursor["next"])
+                self.assertIsNone(by_cursor["previous"])
+
+    @less_console_noise_decorator
+    def test_cursor_pagination_invalid_cursor(self):
+        """Test that a cursor which can not be decoded is a bad request"""
+        response = self.app.get(reverse("get_domains_json"), {"cursor": "not-a-cursor"}, expect_errors=True)
+        self.assertEqual(response.status_code, 400)
+
+    @less_console_noise_decorator
+    def test_cursor_pagination_forged_cursor(self):
+        """Test that a cursor whose value doesn't match the sort key is a bad request, not an error"""
+        cursor = base64.urlsafe_b64encode(json.dumps({"v": "abc", "id": 1, "b": False}).encode()).decode()
+        params = {"sort_by": "expiration_date", "order": "asc", "cursor": cursor}
+        response = self.app.get(reverse("get_domains_json"), params, expect_errors=True)
+        self.assertEqual(response.status_code, 400)
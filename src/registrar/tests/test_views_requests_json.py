@@ -308,3 +308,55 @@ class GetRequestsJsonTest(TestWithUser, WebTest):
         # Ensure no approved requests are included
         for domain_request in data["domain_requests"]:
             self.assertNotEqual(domain_request["status"], DomainRequest.DomainRequestStatus.APPROVED)
+
+    def test_cursor_pagination(self):
+        """Test that paging forwards and backwards by cursor visits every non-approved request once,
+        in sort order, including requests without a requested domain"""
+        non_approved = [
+            domain_request
+            for domain_request in self.domain_requests
+            if domain_request.status != DomainRequest.DomainRequestStatus.APPROVED
+        ]
+        for order in ["asc", "desc"]:
+            with self.subTest(order=order):
+                # requests without a requested domain come last in either order
+                named = sorted(
+                    (r for r in non_approved if r.requested_domain),
+                    key=lambda r: (r.requested_domain.name, r.id),
+                    reverse=(order == "desc"),
+                )
+                unnamed = sorted((r for r in non_approved if not r.requested_domain), key=lambda r: r.id)
+                if order == "desc":
+                    unnamed.reverse()
+                expected_ids = [r.id for r in named + unnamed]
+
+                params = {"sort_by": "requested_domain__name", "order": order, "cursor": ""}
+                response = self.app.get(reverse("get_domain_requests_json"), params)
+                first_page = response.json
+                self.assertFalse(first_page["has_previous"])
+                self.assertTrue(first_page["has_next"])
+                self.assertNotIn("total", first_page)
+
+                response = self.app.get(reverse("get_domain_requests_json"), {**params, "cursor": first_page["next"]})
+                second_page = response.json
+                self.assertTrue(second_page["has_previous"])
+                self.assertFalse(second_page["has_next"])
+
+                ids = [r["id"] for r in first_page["domain_requests"] + second_page["domain_requests"]]
+                self.assertEqual(ids, expected_ids)
+
+                # the previous page of the second page is the first page
+                response = self.app.get(
+                    reverse("get_domain_requests_json"), {**params, "cursor": second_page["previous"]}
+                )
+                self.assertEqual(response.json["domain_requests"], first_page["domain_requests"])
+                self.assertFalse(response.json["has_previous"])
+
+    def test_cursor_pagination_total(self):
+        """Test that totals are only counted in cursor mode when asked for"""
+        response = self.app.get(reverse("get_domain_requests_json"), {"cursor": "", "include_total": "true"})
+        data = response.json
+        non_approved_count = DomainRequest.objects.exclude(status=DomainRequest.DomainRequestStatus.APPROVED).count()
+        self.assertEqual(data["total"], non_approved_count)
+        self.assertTrue(data["total_is_exact"])
+        self.assertEqual(data["unfiltered_total"], non_approved_count)
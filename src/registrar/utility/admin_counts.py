@@ -0,0 +1,87 @@
+"""Row counts for admin changelists, which take too long to count exactly on large tables"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .safe_cache import SafeCache
+
+
+class AdminCounter:
+    """
+    Counts the rows in admin changelist querysets.
+
+    Every changelist page counts its rows twice: once with the admin's filters and
+    search applied, and once for the whole table. On tables the size of the audit log,
+    each count is a full scan.
+
+    Unfiltered querysets on postgres tables which the planner estimates to have at
+    least settings.ADMIN_ESTIMATED_COUNT_THRESHOLD rows are given that estimate
+    (pg_class.reltuples) instead. Other querysets are counted exactly, and counts of at
+    least settings.ADMIN_CACHED_COUNT_THRESHOLD rows are kept in one of Django's caches
+    (settings.ADMIN_COUNT_CACHE_ALIAS) for settings.ADMIN_COUNT_CACHE_TIMEOUT seconds,
+    keyed by the query. Smaller counts are cheap, so are always exact. A timeout of 0
+    turns caching off.
+    """
+
+    key_prefix = "admin:count"
+
+    def __init__(self, alias=None):
+        self.cache = SafeCache("admin count", "ADMIN_COUNT_CACHE_ALIAS", alias)
+
+    def count(self, queryset) -> int:
+        """Returns the number of rows in queryset, estimated or cached where that is allowed"""
+        if not queryset.query.has_filters() and not queryset.query.distinct:
+            estimate = self.estimate(queryset.model, queryset.db)
+            if estimate is not None and estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+
+        key = self._key(queryset)
+        if key is not None:
+            count = self.cache.get(key)
+            if count is not None:
+                return count
+
+        count = queryset.count()
+        if key is not None and count >= settings.ADMIN_CACHED_COUNT_THRESHOLD:
+            self.cache.set(key, count, settings.ADMIN_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def estimate(self, model, using="default") -> int | None:
+        """Returns the postgres planner's estimate of the rows in model's table, or None if it has none"""
+        connection = connections[using]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)", [model._meta.db_table])
+            row = cursor.fetchone()
+        # reltuples is -1 for tables which have not been vacuumed or analyzed yet
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+    def _key(self, queryset) -> str | None:
+        if settings.ADMIN_COUNT_CACHE_TIMEOUT <= 0:
+            return None
+        try:
+            # the order rows are listed in makes no difference to how many there are
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        digest = hashlib.sha256(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+        return f"{self.key_prefix}:{queryset.model._meta.label_lower}:{digest}"
+
+
+admin_counter = AdminCounter()
+
+
+class EstimatedCountPaginator(Paginator):
+    """A paginator which counts its rows with admin_counter"""
+
+    @cached_property
+    def count(self):
+        return admin_counter.count(self.object_list)
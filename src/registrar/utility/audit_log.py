@@ -0,0 +1,65 @@
+"""Audit log entries for rows written in bulk, which auditlog's signals never see"""
+
+from auditlog.cid import get_cid  # type: ignore
+from auditlog.context import auditlog_disabled  # type: ignore
+from auditlog.diff import model_instance_diff  # type: ignore
+from auditlog.models import LogEntry  # type: ignore
+from auditlog.registry import auditlog  # type: ignore
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import pre_save
+from django.utils.encoding import smart_str
+
+
+def log_bulk_create(instances) -> list:
+    """
+    Writes the audit log entries for instances, just created with bulk_create, in one insert.
+
+    The entries are those saving each instance would have written. Returns them.
+    """
+    return _bulk_log(LogEntry.Action.CREATE, [(None, instance) for instance in instances])
+
+
+def log_bulk_update(instances, fields) -> list:
+    """
+    Writes the audit log entries for changes to fields of instances, in one insert.
+
+    Call this before saving instances with bulk_update (or ScriptDataHelper.bulk_update_fields),
+    as the values being replaced are read from the database, in one query. Returns the entries.
+    """
+    instances = list(instances)
+    if not instances or not auditlog.contains(type(instances[0])):
+        return []
+    stored = type(instances[0]).objects.in_bulk([instance.pk for instance in instances])
+    return _bulk_log(
+        LogEntry.Action.UPDATE,
+        [(stored[instance.pk], instance) for instance in instances if instance.pk in stored],
+        fields_to_check=fields,
+    )
+
+
+def _bulk_log(action, changes, fields_to_check=None) -> list:
+    """Writes a log entry for each (old, new) pair of instances which differ. Returns them."""
+    if auditlog_disabled.get() or not changes or not auditlog.contains(type(changes[0][1])):
+        return []
+
+    content_type = ContentType.objects.get_for_model(changes[0][1])
+    cid = get_cid()
+    log_entries = []
+    for old, new in changes:
+        diff = model_instance_diff(old, new, fields_to_check=fields_to_check)
+        if not diff:
+            continue
+        log_entry = LogEntry(
+            content_type=content_type,
+            object_pk=smart_str(new.pk),
+            object_id=new.pk if isinstance(new.pk, int) else None,
+            object_repr=smart_str(new),
+            serialized_data=LogEntry.objects._get_serialized_data_or_none(new),
+            action=action,
+            changes=diff,
+            cid=cid,
+        )
+        # bulk_create sends no signals, and the actor (from auditlog's middleware) is set on pre_save
+        pre_save.send(sender=LogEntry, instance=log_entry, raw=False, using=LogEntry.objects.db, update_fields=None)
+        log_entries.append(log_entry)
+    return LogEntry.objects.bulk_create(log_entries)
@@ -1,20 +1,24 @@
 import csv
 import logging
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from registrar.models import (
+    AnalyticsCount,
+    AnalyticsSnapshot,
     Domain,
     DomainInvitation,
     DomainRequest,
     DomainInformation,
     PublicContact,
+    User,
     UserDomainRole,
 )
-from django.db.models import QuerySet, Value, CharField, Count, Q, F
-from django.db.models import ManyToManyField
+from django.db import transaction
+from django.db.models import QuerySet, Value, CharField, Count, Q, F, Func, IntegerField, Max, OuterRef, Subquery, Sum
+from django.db.models import Avg, DateTimeField, ManyToManyField
 from django.utils import timezone
-from django.core.paginator import Paginator
-from django.db.models.functions import Concat, Coalesce
-from django.contrib.postgres.aggregates import StringAgg
+from django.db.models.functions import Concat, Coalesce, TruncDate
+from django.contrib.postgres.aggregates import ArrayAgg, StringAgg
+from django.contrib.postgres.fields import ArrayField
 from registrar.models.utility.generic_helper import convert_queryset_to_dict
 from registrar.templatetags.custom_filters import get_region
 from registrar.utility.enums import DefaultEmail
@@ -23,6 +27,26 @@ from registrar.utility.constants import BranchChoices
 
 logger = logging.getLogger(__name__)
 
+# How many rows to fetch from the database at a time while writing a report
+EXPORT_CHUNK_SIZE = 1000
+
+
+class Echo:
+    """A file-like object which hands back whatever is written to it.
+
+    Lets csv.writer format rows one at a time for a StreamingHttpResponse,
+    rather than writing them all into the response up front."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    """Yields each row as a line of CSV text, for use in a StreamingHttpResponse"""
+    writer = csv.writer(Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
 
 def write_header(writer, columns):
     """
@@ -32,11 +56,13 @@ def write_header(writer, columns):
     writer.writerow(columns)
 
 
-def get_domain_infos(filter_condition, sort_fields):
+def get_domain_infos(filter_condition, sort_fields, should_get_domain_managers=False):
     """
     Returns DomainInformation objects filtered and sorted based on the provided conditions.
     filter_condition -> A dictionary of conditions to filter the objects.
     sort_fields -> A list of fields to sort the resulting query set.
+    should_get_domain_managers -> Annotates each object with dms_active_emails and
+    dms_invited_emails, the emails of its domain managers and invited domain managers.
     returns: A queryset of DomainInformation objects
     """
     domain_infos = (
@@ -57,6 +83,30 @@ def get_domain_infos(filter_condition, sort_fields):
             output_field=CharField(),
         )
     )
+
+    if should_get_domain_managers:
+        # Aggregate the emails per domain in the database, rather than reading
+        # every UserDomainRole and DomainInvitation (and their users and domains) in python.
+        dms_active_emails = (
+            UserDomainRole.objects.filter(domain=OuterRef("domain"))
+            .order_by()
+            .values("domain")
+            .annotate(emails=ArrayAgg("user__email", ordering="id"))
+            .values("emails")
+        )
+        dms_invited_emails = (
+            DomainInvitation.objects.filter(
+                domain=OuterRef("domain"), status=DomainInvitation.DomainInvitationStatus.INVITED
+            )
+            .order_by()
+            .values("domain")
+            .annotate(emails=ArrayAgg("email", ordering="id"))
+            .values("emails")
+        )
+        domain_infos_cleaned = domain_infos_cleaned.annotate(
+            dms_active_emails=Subquery(dms_active_emails, output_field=ArrayField(CharField())),
+            dms_invited_emails=Subquery(dms_invited_emails, output_field=ArrayField(CharField())),
+        )
     return domain_infos_cleaned
 
 
@@ -65,10 +115,10 @@ def parse_row_for_domain(
     domain_info: DomainInformation,
     dict_security_emails=None,
     should_get_domain_managers=False,
-    dict_domain_invitations_with_invited_status=None,
-    dict_user_domain_roles=None,
 ):
-    """Given a set of columns, generate a new row from cleaned column data"""
+    """Given a set of columns, generate a new row from cleaned column data.
+    With should_get_domain_managers, domain_info must come from get_domain_infos
+    called with should_get_domain_managers=True."""
 
     # Domain should never be none when parsing this information
     if domain_info.domain is None:
@@ -120,8 +170,8 @@ def parse_row_for_domain(
     if should_get_domain_managers:
         # Get lists of emails for active and invited domain managers
 
-        dms_active_emails = dict_user_domain_roles.get(domain_info.domain.name, [])
-        dms_invited_emails = dict_domain_invitations_with_invited_status.get(domain_info.domain.name, [])
+        dms_active_emails = domain_info.dms_active_emails or []  # type: ignore
+        dms_invited_emails = domain_info.dms_invited_emails or []  # type: ignore
 
         # Set up the "matching headers" + row field data for email and status
         i = 0  # Declare i outside of the loop to avoid a reference before assignment in the second loop
@@ -160,11 +210,22 @@ def _get_security_emails(sec_contact_ids):
     return dict_security_emails
 
 
-def count_domain_managers(domain_name, dict_domain_invitations_with_invited_status, dict_user_domain_roles):
-    """Count active and invited domain managers"""
-    dms_active = len(dict_user_domain_roles.get(domain_name, []))
-    dms_invited = len(dict_domain_invitations_with_invited_status.get(domain_name, []))
-    return dms_active, dms_invited
+def get_max_domain_managers(domain_infos):
+    """
+    Returns the largest number of domain managers (active and invited) on any one
+    domain in domain_infos, a queryset from get_domain_infos with should_get_domain_managers.
+    This is done in a single query so that the "Domain manager N" columns are known
+    before any rows are written.
+    """
+    result = (
+        domain_infos.order_by()
+        .annotate(
+            dms_total=Coalesce(Func("dms_active_emails", function="CARDINALITY", output_field=IntegerField()), 0)
+            + Coalesce(Func("dms_invited_emails", function="CARDINALITY", output_field=IntegerField()), 0)
+        )
+        .aggregate(max_dms=Max("dms_total"))
+    )
+    return result["max_dms"] or 0
 
 
 def update_columns(columns, dms_total, should_update_columns):
@@ -180,61 +241,45 @@ def update_columns(columns, dms_total, should_update_columns):
     return columns, should_update_columns, dms_total
 
 
-def update_columns_with_domain_managers(
+def get_rows_for_domains(
     columns,
-    domain_info,
-    should_update_columns,
-    dms_total,
-    dict_domain_invitations_with_invited_status,
-    dict_user_domain_roles,
+    sort_fields,
+    filter_condition,
+    should_get_domain_managers=False,
+    should_write_header=True,
 ):
-    """Helper function to update columns with domain manager information"""
-
-    domain_name = domain_info.domain.name
-
-    try:
-        dms_active, dms_invited = count_domain_managers(
-            domain_name, dict_domain_invitations_with_invited_status, dict_user_domain_roles
-        )
-
-        if dms_active + dms_invited > dms_total:
-            dms_total = dms_active + dms_invited
-            should_update_columns = True
-
-    except Exception as err:
-        logger.error(f"Exception while parsing domain managers for reports: {err}")
-
-    return update_columns(columns, dms_total, should_update_columns)
-
-
-def build_dictionaries_for_domain_managers(dict_user_domain_roles, dict_domain_invitations_with_invited_status):
-    """Helper function that builds dicts for invited users and active domain
-    managers. We do so to avoid filtering within loops."""
-
-    user_domain_roles = UserDomainRole.objects.all()
+    """
+    Yields the header (if requested) followed by one row per filtered and sorted domain.
+    Rows are produced as the domains are read, EXPORT_CHUNK_SIZE at a time,
+    so the report is never held in memory as a whole.
+    should_get_domain_managers: Conditional bc we only use domain manager info for export_data_type_to_csv
+    should_write_header: Conditional bc export_data_domain_growth_to_csv calls write_body twice
+    """
 
-    # Iterate through each user domain role and populate the dictionary
-    for user_domain_role in user_domain_roles:
-        domain_name = user_domain_role.domain.name
-        email = user_domain_role.user.email
-        if domain_name not in dict_user_domain_roles:
-            dict_user_domain_roles[domain_name] = []
-        dict_user_domain_roles[domain_name].append(email)
+    # Retrieve domain information and all sec emails
+    all_domain_infos = get_domain_infos(filter_condition, sort_fields, should_get_domain_managers)
+    sec_contact_ids = all_domain_infos.values_list("domain__security_contact_registry_id", flat=True)
+    dict_security_emails = _get_security_emails(sec_contact_ids)
 
-    domain_invitations_with_invited_status = None
-    domain_invitations_with_invited_status = DomainInvitation.objects.filter(
-        status=DomainInvitation.DomainInvitationStatus.INVITED
-    ).select_related("domain")
+    # Add the domain manager columns if necessary
+    if should_get_domain_managers:
+        columns, _, _ = update_columns(columns, get_max_domain_managers(all_domain_infos), True)
 
-    # Iterate through each domain invitation and populate the dictionary
-    for invite in domain_invitations_with_invited_status:
-        domain_name = invite.domain.name
-        email = invite.email
-        if domain_name not in dict_domain_invitations_with_invited_status:
-            dict_domain_invitations_with_invited_status[domain_name] = []
-        dict_domain_invitations_with_invited_status[domain_name].append(email)
+    if should_write_header:
+        yield columns
 
-    return dict_user_domain_roles, dict_domain_invitations_with_invited_status
+    # Process domain information
+    for domain_info in all_domain_infos.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        try:
+            yield parse_row_for_domain(
+                columns,
+                domain_info,
+                dict_security_emails,
+                should_get_domain_managers,
+            )
+        except ValueError:
+            logger.error("csv_export -> Error when parsing row, domain was None")
+            continue
 
 
 def write_csv_for_domains(
@@ -248,62 +293,17 @@ def write_csv_for_domains(
     """
     Receives params from the parent methods and outputs a CSV with filtered and sorted domains.
     Works with write_header as long as the same writer object is passed.
-    should_get_domain_managers: Conditional bc we only use domain manager info for export_data_full_to_csv
-    should_write_header: Conditional bc export_data_domain_growth_to_csv calls write_body twice
+    See get_rows_for_domains for should_get_domain_managers and should_write_header.
     """
-
-    # Retrieve domain information and all sec emails
-    all_domain_infos = get_domain_infos(filter_condition, sort_fields)
-    sec_contact_ids = all_domain_infos.values_list("domain__security_contact_registry_id", flat=True)
-    dict_security_emails = _get_security_emails(sec_contact_ids)
-    paginator = Paginator(all_domain_infos, 1000)
-
-    # Initialize variables
-    dms_total = 0
-    should_update_columns = False
-    total_body_rows = []
-    dict_user_domain_roles = {}
-    dict_domain_invitations_with_invited_status = {}
-
-    # Build dictionaries if necessary
-    if should_get_domain_managers:
-        dict_user_domain_roles, dict_domain_invitations_with_invited_status = build_dictionaries_for_domain_managers(
-            dict_user_domain_roles, dict_domain_invitations_with_invited_status
+    writer.writerows(
+        get_rows_for_domains(
+            columns,
+            sort_fields,
+            filter_condition,
+            should_get_domain_managers=should_get_domain_managers,
+            should_write_header=should_write_header,
         )
-
-    # Process domain information
-    for page_num in paginator.page_range:
-        rows = []
-        page = paginator.page(page_num)
-        for domain_info in page.object_list:
-            if should_get_domain_managers:
-                columns, dms_total, should_update_columns = update_columns_with_domain_managers(
-                    columns,
-                    domain_info,
-                    should_update_columns,
-                    dms_total,
-                    dict_domain_invitations_with_invited_status,
-                    dict_user_domain_roles,
-                )
-
-            try:
-                row = parse_row_for_domain(
-                    columns,
-                    domain_info,
-                    dict_security_emails,
-                    should_get_domain_managers,
-                    dict_domain_invitations_with_invited_status,
-                    dict_user_domain_roles,
-                )
-                rows.append(row)
-            except ValueError:
-                logger.error("csv_export -> Error when parsing row, domain was None")
-                continue
-        total_body_rows.extend(rows)
-
-    if should_write_header:
-        write_header(writer, columns)
-    writer.writerows(total_body_rows)
+    )
 
 
 def export_data_type_to_csv(csv_file):
@@ -312,8 +312,12 @@ def export_data_type_to_csv(csv_file):
     This maps to the "All domain metadata" button.
     Exports domains of all statuses.
     """
-
     writer = csv.writer(csv_file)
+    writer.writerows(get_data_type_rows())
+
+
+def get_data_type_rows():
+    """Yields the rows of export_data_type_to_csv"""
     # define columns to include in export
     columns = [
         "Domain name",
@@ -338,15 +342,19 @@ def export_data_type_to_csv(csv_file):
         "federal_agency",
         "domain__name",
     ]
-    write_csv_for_domains(
-        writer, columns, sort_fields, filter_condition={}, should_get_domain_managers=True, should_write_header=True
+    return get_rows_for_domains(
+        columns, sort_fields, filter_condition={}, should_get_domain_managers=True, should_write_header=True
     )
 
 
 def export_data_full_to_csv(csv_file):
     """All domains report"""
-
     writer = csv.writer(csv_file)
+    writer.writerows(get_data_full_rows())
+
+
+def get_data_full_rows():
+    """Yields the rows of export_data_full_to_csv"""
     # define columns to include in export
     columns = [
         "Domain name",
@@ -371,14 +379,19 @@ def export_data_full_to_csv(csv_file):
             Domain.State.ON_HOLD,
         ],
     }
-    write_csv_for_domains(
-        writer, columns, sort_fields, filter_condition, should_get_domain_managers=False, should_write_header=True
+    return get_rows_for_domains(
+        columns, sort_fields, filter_condition, should_get_domain_managers=False, should_write_header=True
     )
 
 
 def export_data_federal_to_csv(csv_file):
     """Federal domains report"""
     writer = csv.writer(csv_file)
+    writer.writerows(get_data_federal_rows())
+
+
+def get_data_federal_rows():
+    """Yields the rows of export_data_federal_to_csv"""
     # define columns to include in export
     columns = [
         "Domain name",
@@ -404,8 +417,8 @@ def export_data_federal_to_csv(csv_file):
             Domain.State.ON_HOLD,
         ],
     }
-    write_csv_for_domains(
-        writer, columns, sort_fields, filter_condition, should_get_domain_managers=False, should_write_header=True
+    return get_rows_for_domains(
+        columns, sort_fields, filter_condition, should_get_domain_managers=False, should_write_header=True
     )
 
 
@@ -487,76 +500,240 @@ def export_data_domain_growth_to_csv(csv_file, start_date, end_date):
     )
 
 
-def get_sliced_domains(filter_condition):
-    """Get filtered domains counts sliced by org type and election office.
-    Pass distinct=True when filtering by permissions so we do not to count multiples
-    when a domain has more that one manager.
+# The organization types that get_sliced_domains and get_sliced_requests count, in order
+SLICED_ORGANIZATION_TYPES = [
+    DomainRequest.OrganizationChoices.FEDERAL,
+    DomainRequest.OrganizationChoices.INTERSTATE,
+    DomainRequest.OrganizationChoices.STATE_OR_TERRITORY,
+    DomainRequest.OrganizationChoices.TRIBAL,
+    DomainRequest.OrganizationChoices.COUNTY,
+    DomainRequest.OrganizationChoices.CITY,
+    DomainRequest.OrganizationChoices.SPECIAL_DISTRICT,
+    DomainRequest.OrganizationChoices.SCHOOL_DISTRICT,
+]
+
+
+def get_sliced_counts(queryset, conditions, sum_field=None):
+    """
+    Counts the objects in queryset matching each of conditions (Q objects, or None for all),
+    sliced by org type and election office, in a single query.
+    Distinct ids are counted so that joins, such as one row per domain manager, do not count multiples.
+    sum_field -> Sum this field instead of counting objects, for querysets of precomputed counts.
+    returns: One list of counts per condition, in the order [total, *SLICED_ORGANIZATION_TYPES, election office]
     """
+    slices = [
+        None,
+        *[Q(generic_org_type=org_type) for org_type in SLICED_ORGANIZATION_TYPES],
+        Q(is_election_board=True),
+    ]
 
-    domains = DomainInformation.objects.all().filter(**filter_condition).distinct()
-    domains_count = domains.count()
-    federal = domains.filter(generic_org_type=DomainRequest.OrganizationChoices.FEDERAL).distinct().count()
-    interstate = domains.filter(generic_org_type=DomainRequest.OrganizationChoices.INTERSTATE).count()
-    state_or_territory = (
-        domains.filter(generic_org_type=DomainRequest.OrganizationChoices.STATE_OR_TERRITORY).distinct().count()
-    )
-    tribal = domains.filter(generic_org_type=DomainRequest.OrganizationChoices.TRIBAL).distinct().count()
-    county = domains.filter(generic_org_type=DomainRequest.OrganizationChoices.COUNTY).distinct().count()
-    city = domains.filter(generic_org_type=DomainRequest.OrganizationChoices.CITY).distinct().count()
-    special_district = (
-        domains.filter(generic_org_type=DomainRequest.OrganizationChoices.SPECIAL_DISTRICT).distinct().count()
-    )
-    school_district = (
-        domains.filter(generic_org_type=DomainRequest.OrganizationChoices.SCHOOL_DISTRICT).distinct().count()
+    aggregates = {}
+    for i, condition in enumerate(conditions):
+        for j, slice_condition in enumerate(slices):
+            if condition is None or slice_condition is None:
+                count_filter = condition or slice_condition
+            else:
+                count_filter = condition & slice_condition
+            if sum_field is not None:
+                aggregates[f"count_{i}_{j}"] = Coalesce(Sum(sum_field, filter=count_filter), 0)
+            else:
+                aggregates[f"count_{i}_{j}"] = Count("id", distinct=True, filter=count_filter)
+
+    counts = queryset.aggregate(**aggregates)
+    return [[counts[f"count_{i}_{j}"] for j in range(len(slices))] for i in range(len(conditions))]
+
+
+def get_sliced_domains(filter_condition):
+    """Get filtered domains counts sliced by org type and election office."""
+    domains = DomainInformation.objects.filter(**filter_condition)
+    return get_sliced_counts(domains, [None])[0]
+
+
+def get_sliced_domains_at_dates(filter_condition, date_field, start_date, end_date):
+    """Get filtered domains counts sliced by org type and election office, as of start_date
+    and as of end_date (date_field on or before each), in a single query.
+    returns: A tuple of the counts at start_date and the counts at end_date"""
+    domains = DomainInformation.objects.filter(**filter_condition, **{f"{date_field}__lte": max(start_date, end_date)})
+    at_start_date, at_end_date = get_sliced_counts(
+        domains, [Q(**{f"{date_field}__lte": start_date}), Q(**{f"{date_field}__lte": end_date})]
     )
-    election_board = domains.filter(is_election_board=True).distinct().count()
-
-    return [
-        domains_count,
-        federal,
-        interstate,
-        state_or_territory,
-        tribal,
-        county,
-        city,
-        special_district,
-        school_district,
-        election_board,
-    ]
+    return at_start_date, at_end_date
 
 
 def get_sliced_requests(filter_condition):
     """Get filtered requests counts sliced by org type and election office."""
-    requests = DomainRequest.objects.all().filter(**filter_condition).distinct()
-    requests_count = requests.count()
-    federal = requests.filter(generic_org_type=DomainRequest.OrganizationChoices.FEDERAL).distinct().count()
-    interstate = requests.filter(generic_org_type=DomainRequest.OrganizationChoices.INTERSTATE).distinct().count()
-    state_or_territory = (
-        requests.filter(generic_org_type=DomainRequest.OrganizationChoices.STATE_OR_TERRITORY).distinct().count()
+    requests = DomainRequest.objects.filter(**filter_condition)
+    return get_sliced_counts(requests, [None])[0]
+
+
+def get_sliced_requests_at_dates(filter_condition, date_field, start_date, end_date):
+    """Get filtered requests counts sliced by org type and election office, as of start_date
+    and as of end_date (date_field on or before each), in a single query.
+    returns: A tuple of the counts at start_date and the counts at end_date"""
+    requests = DomainRequest.objects.filter(**filter_condition, **{f"{date_field}__lte": max(start_date, end_date)})
+    at_start_date, at_end_date = get_sliced_counts(
+        requests, [Q(**{f"{date_field}__lte": start_date}), Q(**{f"{date_field}__lte": end_date})]
     )
-    tribal = requests.filter(generic_org_type=DomainRequest.OrganizationChoices.TRIBAL).distinct().count()
-    county = requests.filter(generic_org_type=DomainRequest.OrganizationChoices.COUNTY).distinct().count()
-    city = requests.filter(generic_org_type=DomainRequest.OrganizationChoices.CITY).distinct().count()
-    special_district = (
-        requests.filter(generic_org_type=DomainRequest.OrganizationChoices.SPECIAL_DISTRICT).distinct().count()
+    return at_start_date, at_end_date
+
+
+# The sliced counts on the analytics page: the model counted, its filter and the date field it is counted by
+ANALYTICS_CATEGORIES = {
+    AnalyticsCount.Category.MANAGED_DOMAINS: (
+        DomainInformation,
+        {"domain__permissions__isnull": False},
+        "domain__first_ready",
+    ),
+    AnalyticsCount.Category.UNMANAGED_DOMAINS: (
+        DomainInformation,
+        {"domain__permissions__isnull": True},
+        "domain__first_ready",
+    ),
+    AnalyticsCount.Category.READY_DOMAINS: (
+        DomainInformation,
+        {"domain__state__in": [Domain.State.READY]},
+        "domain__first_ready",
+    ),
+    AnalyticsCount.Category.DELETED_DOMAINS: (
+        DomainInformation,
+        {"domain__state__in": [Domain.State.DELETED]},
+        "domain__deleted",
+    ),
+    AnalyticsCount.Category.REQUESTS: (
+        DomainRequest,
+        {},
+        "created_at",
+    ),
+    AnalyticsCount.Category.SUBMITTED_REQUESTS: (
+        DomainRequest,
+        {"status": DomainRequest.DomainRequestStatus.SUBMITTED},
+        "submission_date",
+    ),
+}
+
+# Snapshots older than this are ignored, and the analytics page counts live instead
+ANALYTICS_SNAPSHOT_MAX_AGE = timedelta(days=1)
+
+
+def _is_datetime_field(model, field_path):
+    """Whether field_path (such as domain__first_ready) on model is a DateTimeField"""
+    opts = model._meta
+    for name in field_path.split("__"):
+        field = opts.get_field(name)
+        if field.is_relation:
+            opts = field.related_model._meta
+    return isinstance(field, DateTimeField)
+
+
+def _get_snapshot_date_condition(model, date_field, date):
+    """Returns a Q on AnalyticsCount.date matching the counts of objects with date_field on or before date"""
+    local_date = timezone.localtime(date)
+    if _is_datetime_field(model, date_field) and local_date.time() == time.min:
+        # Counts are per day, so a datetime at midnight only takes in the days before it
+        return Q(date__lt=local_date.date())
+    return Q(date__lte=local_date.date())
+
+
+def get_analytics_summary(snapshot=None):
+    """
+    Returns the "at a glance" numbers on the analytics page as a dictionary, keyed by
+    AnalyticsSnapshot field name. Reads them from snapshot, if one is given.
+    """
+    if snapshot is not None:
+        return {
+            "user_count": snapshot.user_count,
+            "domain_count": snapshot.domain_count,
+            "ready_domain_count": snapshot.ready_domain_count,
+            "last_30_days_applications": snapshot.last_30_days_applications,
+            "last_30_days_approved_applications": snapshot.last_30_days_approved_applications,
+            "average_approval_time": snapshot.average_approval_time,
+        }
+
+    thirty_days_ago = timezone.now() - timedelta(days=30)
+    last_30_days_applications = DomainRequest.objects.filter(created_at__gt=thirty_days_ago)
+    last_30_days_approved_applications = last_30_days_applications.filter(
+        status=DomainRequest.DomainRequestStatus.APPROVED
     )
-    school_district = (
-        requests.filter(generic_org_type=DomainRequest.OrganizationChoices.SCHOOL_DISTRICT).distinct().count()
+    average_approval_time = last_30_days_approved_applications.annotate(
+        approval_time=F("approved_domain__created_at") - F("submission_date")
+    ).aggregate(Avg("approval_time"))["approval_time__avg"]
+    return {
+        "user_count": User.objects.count(),
+        "domain_count": Domain.objects.count(),
+        "ready_domain_count": Domain.objects.filter(state=Domain.State.READY).count(),
+        "last_30_days_applications": last_30_days_applications.count(),
+        "last_30_days_approved_applications": last_30_days_approved_applications.count(),
+        "average_approval_time": average_approval_time,
+    }
+
+
+def get_analytics_sliced_counts(category, start_date, end_date, snapshot=None):
+    """
+    Get the counts for an ANALYTICS_CATEGORIES category sliced by org type and election office,
+    as of start_date and as of end_date, in a single query.
+    Reads them from snapshot's AnalyticsCounts, if one is given, rather than counting domains or requests.
+    returns: A tuple of the counts at start_date and the counts at end_date
+    """
+    model, filter_condition, date_field = ANALYTICS_CATEGORIES[category]
+    if snapshot is None:
+        if model is DomainInformation:
+            return get_sliced_domains_at_dates(filter_condition, date_field, start_date, end_date)
+        return get_sliced_requests_at_dates(filter_condition, date_field, start_date, end_date)
+
+    counts = snapshot.counts.filter(category=category)
+    at_start_date, at_end_date = get_sliced_counts(
+        counts,
+        [
+            _get_snapshot_date_condition(model, date_field, start_date),
+            _get_snapshot_date_condition(model, date_field, end_date),
+        ],
+        sum_field="count",
     )
-    election_board = requests.filter(is_election_board=True).distinct().count()
-
-    return [
-        requests_count,
-        federal,
-        interstate,
-        state_or_territory,
-        tribal,
-        county,
-        city,
-        special_district,
-        school_district,
-        election_board,
-    ]
+    return at_start_date, at_end_date
+
+
+def get_latest_analytics_snapshot():
+    """Returns the latest AnalyticsSnapshot, or None if there is no recent one"""
+    return (
+        AnalyticsSnapshot.objects.filter(created_at__gte=timezone.now() - ANALYTICS_SNAPSHOT_MAX_AGE)
+        .order_by("-created_at")
+        .first()
+    )
+
+
+def take_analytics_snapshot():
+    """
+    Records the analytics page's numbers in a new AnalyticsSnapshot, and returns it.
+    The sliced counts are stored per day of their date field, org type and election office,
+    so that the page can total them for any start and end date.
+    """
+    with transaction.atomic():
+        snapshot = AnalyticsSnapshot.objects.create(**get_analytics_summary())
+
+        analytics_counts = []
+        for category, (model, filter_condition, date_field) in ANALYTICS_CATEGORIES.items():
+            day = TruncDate(date_field) if _is_datetime_field(model, date_field) else F(date_field)
+            rows = (
+                model.objects.filter(**filter_condition, **{f"{date_field}__isnull": False})
+                .annotate(day=day)
+                .order_by()
+                .values("day", "generic_org_type", "is_election_board")
+                .annotate(count=Count("id", distinct=True))
+            )
+            for row in rows:
+                analytics_counts.append(
+                    AnalyticsCount(
+                        snapshot=snapshot,
+                        category=category,
+                        date=row["day"],
+                        generic_org_type=row["generic_org_type"],
+                        is_election_board=row["is_election_board"],
+                        count=row["count"],
+                    )
+                )
+        AnalyticsCount.objects.bulk_create(analytics_counts, batch_size=1000)
+
+    return snapshot
 
 
 def export_data_managed_domains_to_csv(csv_file, start_date, end_date):
@@ -573,11 +750,9 @@ def export_data_managed_domains_to_csv(csv_file, start_date, end_date):
     sort_fields = [
         "domain__name",
     ]
-    filter_managed_domains_start_date = {
-        "domain__permissions__isnull": False,
-        "domain__first_ready__lte": start_date_formatted,
-    }
-    managed_domains_sliced_at_start_date = get_sliced_domains(filter_managed_domains_start_date)
+    managed_domains_sliced_at_start_date, managed_domains_sliced_at_end_date = get_sliced_domains_at_dates(
+        {"domain__permissions__isnull": False}, "domain__first_ready", start_date_formatted, end_date_formatted
+    )
 
     writer.writerow(["MANAGED DOMAINS COUNTS AT START DATE"])
     writer.writerow(
@@ -601,7 +776,6 @@ def export_data_managed_domains_to_csv(csv_file, start_date, end_date):
         "domain__permissions__isnull": False,
         "domain__first_ready__lte": end_date_formatted,
     }
-    managed_domains_sliced_at_end_date = get_sliced_domains(filter_managed_domains_end_date)
 
     writer.writerow(["MANAGED DOMAINS COUNTS AT END DATE"])
     writer.writerow(
@@ -646,11 +820,9 @@ def export_data_unmanaged_domains_to_csv(csv_file, start_date, end_date):
         "domain__name",
     ]
 
-    filter_unmanaged_domains_start_date = {
-        "domain__permissions__isnull": True,
-        "domain__first_ready__lte": start_date_formatted,
-    }
-    unmanaged_domains_sliced_at_start_date = get_sliced_domains(filter_unmanaged_domains_start_date)
+    unmanaged_domains_sliced_at_start_date, unmanaged_domains_sliced_at_end_date = get_sliced_domains_at_dates(
+        {"domain__permissions__isnull": True}, "domain__first_ready", start_date_formatted, end_date_formatted
+    )
 
     writer.writerow(["UNMANAGED DOMAINS AT START DATE"])
     writer.writerow(
@@ -674,7 +846,6 @@ def export_data_unmanaged_domains_to_csv(csv_file, start_date, end_date):
         "domain__permissions__isnull": True,
         "domain__first_ready__lte": end_date_formatted,
     }
-    unmanaged_domains_sliced_at_end_date = get_sliced_domains(filter_unmanaged_domains_end_date)
 
     writer.writerow(["UNMANAGED DOMAINS AT END DATE"])
     writer.writerow(
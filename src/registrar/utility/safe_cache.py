@@ -0,0 +1,63 @@
+"""Access to Django's caches for data which can always be fetched again"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class SafeCache:
+    """
+    One of Django's caches, whose failures are logged and otherwise ignored.
+
+    Everything the registrar caches can be fetched again, from the registry or the
+    database, so a cache which is unavailable should make requests slower, not fail them.
+    Reads which fail are treated as misses, and writes which fail are dropped.
+
+    The cache is `alias`, or else the one named by the setting `alias_setting`. The
+    setting is read on use, so overrides (e.g. in tests) apply. `name` is what the
+    cache holds, for log messages.
+    """
+
+    def __init__(self, name, alias_setting, alias=None):
+        self.name = name
+        self.alias_setting = alias_setting
+        self.alias = alias
+
+    @property
+    def backend(self):
+        return caches[self.alias or getattr(settings, self.alias_setting)]
+
+    def get(self, key, default=None):
+        try:
+            return self.backend.get(key, default)
+        except Exception as err:
+            logger.warning(f"Could not read {self.name} cache: {err}")
+            return default
+
+    def get_many(self, keys) -> dict:
+        try:
+            return self.backend.get_many(keys)
+        except Exception as err:
+            logger.warning(f"Could not read {self.name} cache: {err}")
+            return {}
+
+    def set(self, key, value, timeout) -> None:
+        try:
+            self.backend.set(key, value, timeout)
+        except Exception as err:
+            logger.warning(f"Could not write {self.name} cache: {err}")
+
+    def set_many(self, values: dict, timeout) -> None:
+        try:
+            self.backend.set_many(values, timeout)
+        except Exception as err:
+            logger.warning(f"Could not write {self.name} cache: {err}")
+
+    def delete(self, key) -> None:
+        try:
+            self.backend.delete(key)
+        except Exception as err:
+            logger.warning(f"Could not invalidate {self.name} cache: {err}")
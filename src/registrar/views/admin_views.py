@@ -1,14 +1,12 @@
 """Admin-related views."""
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.views import View
 from django.shortcuts import render
 from django.contrib import admin
-from django.db.models import Avg, F
 from .. import models
-import datetime
-from django.utils import timezone
 
+from registrar.models.utility.availability_cache import availability_cache
 from registrar.utility import csv_export
 
 import logging
@@ -18,16 +16,12 @@ logger = logging.getLogger(__name__)
 
 class AnalyticsView(View):
     def get(self, request):
-        thirty_days_ago = datetime.datetime.today() - datetime.timedelta(days=30)
-        thirty_days_ago = timezone.make_aware(thirty_days_ago)
+        # Read the counts from the latest snapshot (see take_analytics_snapshot) rather than
+        # counting every domain and request on each load. Without a recent one, count them live.
+        snapshot = csv_export.get_latest_analytics_snapshot()
+        summary = csv_export.get_analytics_summary(snapshot)
 
-        last_30_days_applications = models.DomainRequest.objects.filter(created_at__gt=thirty_days_ago)
-        last_30_days_approved_applications = models.DomainRequest.objects.filter(
-            created_at__gt=thirty_days_ago, status=models.DomainRequest.DomainRequestStatus.APPROVED
-        )
-        avg_approval_time = last_30_days_approved_applications.annotate(
-            approval_time=F("approved_domain__created_at") - F("submission_date")
-        ).aggregate(Avg("approval_time"))["approval_time__avg"]
+        avg_approval_time = summary["average_approval_time"]
         # Format the timedelta to display only days
         if avg_approval_time is not None:
             avg_approval_time_display = f"{avg_approval_time.days} days"
@@ -41,69 +35,32 @@ class AnalyticsView(View):
         start_date_formatted = csv_export.format_start_date(start_date)
         end_date_formatted = csv_export.format_end_date(end_date)
 
-        filter_managed_domains_start_date = {
-            "domain__permissions__isnull": False,
-            "domain__first_ready__lte": start_date_formatted,
-        }
-        filter_managed_domains_end_date = {
-            "domain__permissions__isnull": False,
-            "domain__first_ready__lte": end_date_formatted,
-        }
-        managed_domains_sliced_at_start_date = csv_export.get_sliced_domains(filter_managed_domains_start_date)
-        managed_domains_sliced_at_end_date = csv_export.get_sliced_domains(filter_managed_domains_end_date)
-
-        filter_unmanaged_domains_start_date = {
-            "domain__permissions__isnull": True,
-            "domain__first_ready__lte": start_date_formatted,
-        }
-        filter_unmanaged_domains_end_date = {
-            "domain__permissions__isnull": True,
-            "domain__first_ready__lte": end_date_formatted,
-        }
-        unmanaged_domains_sliced_at_start_date = csv_export.get_sliced_domains(filter_unmanaged_domains_start_date)
-        unmanaged_domains_sliced_at_end_date = csv_export.get_sliced_domains(filter_unmanaged_domains_end_date)
-
-        filter_ready_domains_start_date = {
-            "domain__state__in": [models.Domain.State.READY],
-            "domain__first_ready__lte": start_date_formatted,
-        }
-        filter_ready_domains_end_date = {
-            "domain__state__in": [models.Domain.State.READY],
-            "domain__first_ready__lte": end_date_formatted,
-        }
-        ready_domains_sliced_at_start_date = csv_export.get_sliced_domains(filter_ready_domains_start_date)
-        ready_domains_sliced_at_end_date = csv_export.get_sliced_domains(filter_ready_domains_end_date)
-
-        filter_deleted_domains_start_date = {
-            "domain__state__in": [models.Domain.State.DELETED],
-            "domain__deleted__lte": start_date_formatted,
-        }
-        filter_deleted_domains_end_date = {
-            "domain__state__in": [models.Domain.State.DELETED],
-            "domain__deleted__lte": end_date_formatted,
-        }
-        deleted_domains_sliced_at_start_date = csv_export.get_sliced_domains(filter_deleted_domains_start_date)
-        deleted_domains_sliced_at_end_date = csv_export.get_sliced_domains(filter_deleted_domains_end_date)
-
-        filter_requests_start_date = {
-            "created_at__lte": start_date_formatted,
-        }
-        filter_requests_end_date = {
-            "created_at__lte": end_date_formatted,
-        }
-        requests_sliced_at_start_date = csv_export.get_sliced_requests(filter_requests_start_date)
-        requests_sliced_at_end_date = csv_export.get_sliced_requests(filter_requests_end_date)
-
-        filter_submitted_requests_start_date = {
-            "status": models.DomainRequest.DomainRequestStatus.SUBMITTED,
-            "submission_date__lte": start_date_formatted,
-        }
-        filter_submitted_requests_end_date = {
-            "status": models.DomainRequest.DomainRequestStatus.SUBMITTED,
-            "submission_date__lte": end_date_formatted,
-        }
-        submitted_requests_sliced_at_start_date = csv_export.get_sliced_requests(filter_submitted_requests_start_date)
-        submitted_requests_sliced_at_end_date = csv_export.get_sliced_requests(filter_submitted_requests_end_date)
+        managed_domains_sliced_at_start_date, managed_domains_sliced_at_end_date = (
+            csv_export.get_analytics_sliced_counts(
+                models.AnalyticsCount.Category.MANAGED_DOMAINS, start_date_formatted, end_date_formatted, snapshot
+            )
+        )
+        unmanaged_domains_sliced_at_start_date, unmanaged_domains_sliced_at_end_date = (
+            csv_export.get_analytics_sliced_counts(
+                models.AnalyticsCount.Category.UNMANAGED_DOMAINS, start_date_formatted, end_date_formatted, snapshot
+            )
+        )
+        ready_domains_sliced_at_start_date, ready_domains_sliced_at_end_date = csv_export.get_analytics_sliced_counts(
+            models.AnalyticsCount.Category.READY_DOMAINS, start_date_formatted, end_date_formatted, snapshot
+        )
+        deleted_domains_sliced_at_start_date, deleted_domains_sliced_at_end_date = (
+            csv_export.get_analytics_sliced_counts(
+                models.AnalyticsCount.Category.DELETED_DOMAINS, start_date_formatted, end_date_formatted, snapshot
+            )
+        )
+        requests_sliced_at_start_date, requests_sliced_at_end_date = csv_export.get_analytics_sliced_counts(
+            models.AnalyticsCount.Category.REQUESTS, start_date_formatted, end_date_formatted, snapshot
+        )
+        submitted_requests_sliced_at_start_date, submitted_requests_sliced_at_end_date = (
+            csv_export.get_analytics_sliced_counts(
+                models.AnalyticsCount.Category.SUBMITTED_REQUESTS, start_date_formatted, end_date_formatted, snapshot
+            )
+        )
 
         context = dict(
             # Generate a dictionary of context variables that are common across all admin templates
@@ -112,11 +69,11 @@ class AnalyticsView(View):
             # This ensures that the admin interface styling and behavior are consistent with other admin pages.
             **admin.site.each_context(request),
             data=dict(
-                user_count=models.User.objects.all().count(),
-                domain_count=models.Domain.objects.all().count(),
-                ready_domain_count=models.Domain.objects.filter(state=models.Domain.State.READY).count(),
-                last_30_days_applications=last_30_days_applications.count(),
-                last_30_days_approved_applications=last_30_days_approved_applications.count(),
+                user_count=summary["user_count"],
+                domain_count=summary["domain_count"],
+                ready_domain_count=summary["ready_domain_count"],
+                last_30_days_applications=summary["last_30_days_applications"],
+                last_30_days_approved_applications=summary["last_30_days_approved_applications"],
                 average_application_approval_time_last_30_days=avg_approval_time_display,
                 managed_domains_sliced_at_start_date=managed_domains_sliced_at_start_date,
                 unmanaged_domains_sliced_at_start_date=unmanaged_domains_sliced_at_start_date,
@@ -132,6 +89,8 @@ class AnalyticsView(View):
                 submitted_requests_sliced_at_end_date=submitted_requests_sliced_at_end_date,
                 start_date=start_date,
                 end_date=end_date,
+                snapshot_taken_at=snapshot.created_at if snapshot else None,
+                availability_cache_stats=availability_cache.stats(),
             ),
         )
         return render(request, "admin/analytics.html", context)
@@ -140,27 +99,30 @@ class AnalyticsView(View):
 class ExportDataType(View):
     def get(self, request, *args, **kwargs):
         # match the CSV example with all the fields
-        response = HttpResponse(content_type="text/csv")
+        response = StreamingHttpResponse(
+            csv_export.stream_csv(csv_export.get_data_type_rows()), content_type="text/csv"
+        )
         response["Content-Disposition"] = 'attachment; filename="domains-by-type.csv"'
-        csv_export.export_data_type_to_csv(response)
         return response
 
 
 class ExportDataFull(View):
     def get(self, request, *args, **kwargs):
         # Smaller export based on 1
-        response = HttpResponse(content_type="text/csv")
+        response = StreamingHttpResponse(
+            csv_export.stream_csv(csv_export.get_data_full_rows()), content_type="text/csv"
+        )
         response["Content-Disposition"] = 'attachment; filename="current-full.csv"'
-        csv_export.export_data_full_to_csv(response)
         return response
 
 
 class ExportDataFederal(View):
     def get(self, request, *args, **kwargs):
         # Federal only
-        response = HttpResponse(content_type="text/csv")
+        response = StreamingHttpResponse(
+            csv_export.stream_csv(csv_export.get_data_federal_rows()), content_type="text/csv"
+        )
         response["Content-Disposition"] = 'attachment; filename="current-federal.csv"'
-        csv_export.export_data_federal_to_csv(response)
         return response
 
 
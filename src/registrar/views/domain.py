@@ -37,6 +37,9 @@ from registrar.utility.errors import (
     SecurityEmailErrorCodes,
 )
 from registrar.models.utility.contact_error import ContactError
+from registrar.models.utility.domain_snapshot import DomainSnapshot
+from registrar.models.utility.registry_cache import registry_cache
+from registrar.views.utility.domain_access import get_domain_with_access
 from registrar.views.utility.permission_views import UserDomainRolePermissionDeleteView
 
 from ..forms import (
@@ -71,6 +74,14 @@ class DomainBaseView(DomainPermissionView):
     and setting the domain in cache
     """
 
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        if hasattr(self, "session") and hasattr(response, "add_post_render_callback"):
+            # Rendering the page may save the domain, such as when it reads new
+            # registry data, so record the version the page ended up showing
+            response.add_post_render_callback(lambda _: self._update_session_with_domain())
+        return response
+
     def get(self, request, *args, **kwargs):
         self._get_domain(request)
         context = self.get_context_data(object=self.object)
@@ -78,29 +89,31 @@ class DomainBaseView(DomainPermissionView):
 
     def _get_domain(self, request):
         """
-        get domain from session cache or from db and set
-        to self.object
+        get domain from db and set to self.object. Its registry data
+        comes from the shared registry cache.
         set session to self for downstream functions to
-        update session cache
+        update the domain's snapshot in the session
         """
         self.session = request.session
-        # domain:private_key is the session key to use for
-        # caching the domain in the session
-        domain_pk = "domain:" + str(self.kwargs.get("pk"))
-        cached_domain = self.session.get(domain_pk)
+        self.object = self.get_object()
 
-        if cached_domain:
-            self.object = cached_domain
-        else:
-            self.object = self.get_object()
+        snapshot = DomainSnapshot.from_session_data(self.session.get(self._domain_session_key()))
+        if snapshot is not None and not snapshot.is_current(self.object):
+            # The domain changed since this session last saw it, such as by
+            # another manager or an analyst, so fetch its registry data afresh
+            registry_cache.delete(self.object.name)
         self._update_session_with_domain()
 
+    def _domain_session_key(self):
+        # domain:private_key is the session key to use for
+        # the domain's snapshot in the session
+        return "domain:" + str(self.kwargs.get("pk"))
+
     def _update_session_with_domain(self):
         """
-        update domain in the session cache
+        update the domain's snapshot in the session, which is only its pk and version
         """
-        domain_pk = "domain:" + str(self.kwargs.get("pk"))
-        self.session[domain_pk] = self.object
+        self.session[self._domain_session_key()] = DomainSnapshot.from_domain(self.object).as_session_data()
 
     def get_context_data(self, **kwargs):
         """Extend get_context_data to add has_profile_feature_flag to context"""
@@ -181,23 +194,8 @@ class DomainView(DomainBaseView):
         """Override in_editable_state from DomainPermission
         Allow detail page to be viewable"""
 
-        requested_domain = None
-        if Domain.objects.filter(id=pk).exists():
-            requested_domain = Domain.objects.get(id=pk)
-
         # return true if the domain exists, this will allow the detail page to load
-        if requested_domain:
-            return True
-        return False
-
-    def _get_domain(self, request):
-        """
-        override get_domain for this view so that domain overview
-        always resets the cache for the domain object
-        """
-        self.session = request.session
-        self.object = self.get_object()
-        self._update_session_with_domain()
+        return get_domain_with_access(self.request, pk) is not None
 
 
 class DomainOrgNameAddressView(DomainFormBaseView):
@@ -346,8 +344,6 @@ class DomainNameserversView(DomainFormBaseView):
     def form_valid(self, formset):
         """The formset is valid, perform something with it."""
 
-        self.request.session["nameservers_form_domain"] = self.object
-
         # Set the nameservers from the formset
         nameservers = []
         for form in formset:
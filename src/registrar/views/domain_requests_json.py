@@ -5,6 +5,7 @@ from django.utils.dateformat import format
 from django.contrib.auth.decorators import login_required
 from django.urls import reverse
 from django.db.models import Q
+from registrar.views.utility.cursor_pagination import CursorPaginator, InvalidCursor, get_approximate_count
 
 
 @login_required
@@ -12,10 +13,10 @@ def get_domain_requests_json(request):
     """Given the current request,
     get all domain requests that are associated with the request user and exclude the APPROVED ones"""
 
-    domain_requests = DomainRequest.objects.filter(creator=request.user).exclude(
+    unfiltered_domain_requests = DomainRequest.objects.filter(creator=request.user).exclude(
         status=DomainRequest.DomainRequestStatus.APPROVED
     )
-    unfiltered_total = domain_requests.count()
+    domain_requests = unfiltered_domain_requests
 
     # Handle sorting
     sort_by = request.GET.get("sort_by", "id")  # Default to 'id'
@@ -36,6 +37,9 @@ def get_domain_requests_json(request):
         else:
             domain_requests = domain_requests.filter(Q(requested_domain__name__icontains=search_term))
 
+    if "cursor" in request.GET:
+        return get_domain_requests_json_by_cursor(request, domain_requests, unfiltered_domain_requests, sort_by, order)
+
     if order == "desc":
         sort_by = f"-{sort_by}"
     domain_requests = domain_requests.order_by(sort_by)
@@ -43,48 +47,7 @@ def get_domain_requests_json(request):
     paginator = Paginator(domain_requests, 10)
     page_obj = paginator.get_page(page_number)
 
-    domain_requests_data = [
-        {
-            "requested_domain": domain_request.requested_domain.name if domain_request.requested_domain else None,
-            "submission_date": domain_request.submission_date,
-            "status": domain_request.get_status_display(),
-            "created_at": format(domain_request.created_at, "c"),  # Serialize to ISO 8601
-            "id": domain_request.id,
-            "is_deletable": domain_request.status
-            in [DomainRequest.DomainRequestStatus.STARTED, DomainRequest.DomainRequestStatus.WITHDRAWN],
-            "action_url": (
-                reverse("edit-domain-request", kwargs={"id": domain_request.id})
-                if domain_request.status
-                in [
-                    DomainRequest.DomainRequestStatus.STARTED,
-                    DomainRequest.DomainRequestStatus.ACTION_NEEDED,
-                    DomainRequest.DomainRequestStatus.WITHDRAWN,
-                ]
-                else reverse("domain-request-status", kwargs={"pk": domain_request.id})
-            ),
-            "action_label": (
-                "Edit"
-                if domain_request.status
-                in [
-                    DomainRequest.DomainRequestStatus.STARTED,
-                    DomainRequest.DomainRequestStatus.ACTION_NEEDED,
-                    DomainRequest.DomainRequestStatus.WITHDRAWN,
-                ]
-                else "Manage"
-            ),
-            "svg_icon": (
-                "edit"
-                if domain_request.status
-                in [
-                    DomainRequest.DomainRequestStatus.STARTED,
-                    DomainRequest.DomainRequestStatus.ACTION_NEEDED,
-                    DomainRequest.DomainRequestStatus.WITHDRAWN,
-                ]
-                else "settings"
-            ),
-        }
-        for domain_request in page_obj
-    ]
+    domain_requests_data = [serialize_domain_request(domain_request) for domain_request in page_obj]
 
     return JsonResponse(
         {
@@ -94,6 +57,71 @@ def get_domain_requests_json(request):
             "page": page_obj.number,
             "num_pages": paginator.num_pages,
             "total": paginator.count,
-            "unfiltered_total": unfiltered_total,
+            "unfiltered_total": unfiltered_domain_requests.count(),
         }
     )
+
+
+def get_domain_requests_json_by_cursor(request, domain_requests, unfiltered_domain_requests, sort_by, order):
+    """Returns the page of domain requests at the cursor request parameter, which is empty for the first page.
+    Totals are only counted, approximately, if the include_total parameter is true."""
+    paginator = CursorPaginator(domain_requests, sort_by, descending=(order == "desc"))
+    try:
+        page = paginator.get_page(request.GET.get("cursor"))
+    except InvalidCursor:
+        return JsonResponse({"error": "Invalid cursor"}, status=400)
+
+    data = {
+        "domain_requests": [serialize_domain_request(domain_request) for domain_request in page["object_list"]],
+        "next": page["next"],
+        "previous": page["previous"],
+        "has_next": page["next"] is not None,
+        "has_previous": page["previous"] is not None,
+    }
+    if request.GET.get("include_total") == "true":
+        data["total"], data["total_is_exact"] = paginator.get_approximate_count()
+        data["unfiltered_total"], data["unfiltered_total_is_exact"] = get_approximate_count(unfiltered_domain_requests)
+    return JsonResponse(data)
+
+
+def serialize_domain_request(domain_request):
+    """Converts a domain request to the JSON-serializable format of a table row"""
+    return {
+        "requested_domain": domain_request.requested_domain.name if domain_request.requested_domain else None,
+        "submission_date": domain_request.submission_date,
+        "status": domain_request.get_status_display(),
+        "created_at": format(domain_request.created_at, "c"),  # Serialize to ISO 8601
+        "id": domain_request.id,
+        "is_deletable": domain_request.status
+        in [DomainRequest.DomainRequestStatus.STARTED, DomainRequest.DomainRequestStatus.WITHDRAWN],
+        "action_url": (
+            reverse("edit-domain-request", kwargs={"id": domain_request.id})
+            if domain_request.status
+            in [
+                DomainRequest.DomainRequestStatus.STARTED,
+                DomainRequest.DomainRequestStatus.ACTION_NEEDED,
+                DomainRequest.DomainRequestStatus.WITHDRAWN,
+            ]
+            else reverse("domain-request-status", kwargs={"pk": domain_request.id})
+        ),
+        "action_label": (
+            "Edit"
+            if domain_request.status
+            in [
+                DomainRequest.DomainRequestStatus.STARTED,
+                DomainRequest.DomainRequestStatus.ACTION_NEEDED,
+                DomainRequest.DomainRequestStatus.WITHDRAWN,
+            ]
+            else "Manage"
+        ),
+        "svg_icon": (
+            "edit"
+            if domain_request.status
+            in [
+                DomainRequest.DomainRequestStatus.STARTED,
+                DomainRequest.DomainRequestStatus.ACTION_NEEDED,
+                DomainRequest.DomainRequestStatus.WITHDRAWN,
+            ]
+            else "settings"
+        ),
+    }
@@ -4,6 +4,8 @@ from registrar.models import UserDomainRole, Domain
 from django.contrib.auth.decorators import login_required
 from django.urls import reverse
 from django.db.models import Q
+from django.db.models.functions import Collate
+from registrar.views.utility.cursor_pagination import CursorPaginator, InvalidCursor, get_approximate_count
 
 
 @login_required
@@ -14,8 +16,8 @@ def get_domains_json(request):
     user_domain_roles = UserDomainRole.objects.filter(user=request.user)
     domain_ids = user_domain_roles.values_list("domain_id", flat=True)
 
-    objects = Domain.objects.filter(id__in=domain_ids)
-    unfiltered_total = objects.count()
+    unfiltered_objects = Domain.objects.filter(id__in=domain_ids)
+    objects = unfiltered_objects
 
     # Handle sorting
     sort_by = request.GET.get("sort_by", "id")  # Default to 'id'
@@ -27,6 +29,9 @@ def get_domains_json(request):
         objects = objects.filter(Q(name__icontains=search_term))
 
     # Handle state
+    # state_display is annotated as display_state, so that expired domains
+    # can be filtered and sorted in the database
+    objects = objects.annotate(display_state=Domain.state_display_expression())
     status_param = request.GET.get("status")
     if status_param:
         status_list = status_param.split(",")
@@ -46,24 +51,23 @@ def get_domains_json(request):
         if normal_states:
             state_query |= Q(state__in=normal_states)
 
-        # Handle custom states in Python, as expired can not be queried through ORM
         if "expired" in custom_states:
-            expired_domain_ids = [domain.id for domain in objects if domain.state_display() == "Expired"]
-            state_query |= Q(id__in=expired_domain_ids)
+            state_query |= Q(display_state="Expired")
+        else:
+            # If there are filtered states, and expired is not one of them, domains with
+            # state_display of 'Expired' must be removed
+            state_query &= ~Q(display_state="Expired")
 
         # Apply the combined query
         objects = objects.filter(state_query)
 
-        # If there are filtered states, and expired is not one of them, domains with
-        # state_display of 'Expired' must be removed
-        if "expired" not in custom_states:
-            expired_domain_ids = [domain.id for domain in objects if domain.state_display() == "Expired"]
-            objects = objects.exclude(id__in=expired_domain_ids)
+    if "cursor" in request.GET:
+        return get_domains_json_by_cursor(request, objects, unfiltered_objects, sort_by, order)
 
     if sort_by == "state_display":
-        # Fetch the objects and sort them in Python
-        objects = list(objects)  # Evaluate queryset to a list
-        objects.sort(key=lambda domain: domain.state_display(), reverse=(order == "desc"))
+        # Collate by code point, which is how the display values used to be sorted in Python
+        ordering = Collate("display_state", "C")
+        objects = objects.order_by(ordering.desc() if order == "desc" else ordering.asc(), "id")
     else:
         if order == "desc":
             sort_by = f"-{sort_by}"
@@ -74,20 +78,7 @@ def get_domains_json(request):
     page_obj = paginator.get_page(page_number)
 
     # Convert objects to JSON-serializable format
-    domains = [
-        {
-            "id": domain.id,
-            "name": domain.name,
-            "expiration_date": domain.expiration_date,
-            "state": domain.state,
-            "state_display": domain.state_display(),
-            "get_state_help_text": domain.get_state_help_text(),
-            "action_url": reverse("domain", kwargs={"pk": domain.id}),
-            "action_label": ("View" if domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD] else "Manage"),
-            "svg_icon": ("visibility" if domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD] else "settings"),
-        }
-        for domain in page_obj.object_list
-    ]
+    domains = [serialize_domain(domain) for domain in page_obj.object_list]
 
     return JsonResponse(
         {
@@ -97,6 +88,45 @@ def get_domains_json(request):
             "has_previous": page_obj.has_previous(),
             "has_next": page_obj.has_next(),
             "total": paginator.count,
-            "unfiltered_total": unfiltered_total,
+            "unfiltered_total": unfiltered_objects.count(),
         }
     )
+
+
+def get_domains_json_by_cursor(request, objects, unfiltered_objects, sort_by, order):
+    """Returns the page of domains at the cursor request parameter, which is empty for the first page.
+    Totals are only counted, approximately, if the include_total parameter is true."""
+    if sort_by == "state_display":
+        sort_by = Collate("display_state", "C")
+    paginator = CursorPaginator(objects, sort_by, descending=(order == "desc"))
+    try:
+        page = paginator.get_page(request.GET.get("cursor"))
+    except InvalidCursor:
+        return JsonResponse({"error": "Invalid cursor"}, status=400)
+
+    data = {
+        "domains": [serialize_domain(domain) for domain in page["object_list"]],
+        "next": page["next"],
+        "previous": page["previous"],
+        "has_previous": page["previous"] is not None,
+        "has_next": page["next"] is not None,
+    }
+    if request.GET.get("include_total") == "true":
+        data["total"], data["total_is_exact"] = paginator.get_approximate_count()
+        data["unfiltered_total"], data["unfiltered_total_is_exact"] = get_approximate_count(unfiltered_objects)
+    return JsonResponse(data)
+
+
+def serialize_domain(domain):
+    """Converts a domain to the JSON-serializable format of a table row"""
+    return {
+        "id": domain.id,
+        "name": domain.name,
+        "expiration_date": domain.expiration_date,
+        "state": domain.state,
+        "state_display": domain.state_display(),
+        "get_state_help_text": domain.get_state_help_text(),
+        "action_url": reverse("domain", kwargs={"pk": domain.id}),
+        "action_label": ("View" if domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD] else "Manage"),
+        "svg_icon": ("visibility" if domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD] else "settings"),
+    }
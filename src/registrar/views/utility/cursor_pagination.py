@@ -0,0 +1,127 @@
+"""Keyset (cursor) pagination for the JSON table endpoints"""
+
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+
+# counts above this are reported as approximate
+APPROXIMATE_COUNT_LIMIT = 1000
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor can not be decoded"""
+
+
+class CursorPaginator:
+    """
+    Pages through a queryset by its sort key and id, rather than by page number.
+
+    Each page is fetched with a WHERE on the last (or first) row of the previous page,
+    so there is no COUNT(*) and no OFFSET, and deep pages cost the same as the first.
+    Cursors are opaque to clients: they pass back the `next` or `previous` cursor of a
+    page to get the page after or before it.
+
+    Rows with a NULL sort key come last in either direction.
+
+    Usage:
+    paginator = CursorPaginator(queryset, "expiration_date", descending=True)
+    page = paginator.get_page(request.GET.get("cursor"))
+    """
+
+    # the annotation holding each row's sort key
+    key_name = "cursor_key"
+
+    def __init__(self, queryset, sort_by, descending=False, per_page=10):
+        """
+        sort_by -> str or expression: The field name, or an expression such as a Collate,
+        which the queryset is sorted by
+        """
+        self.queryset = queryset.annotate(**{self.key_name: F(sort_by) if isinstance(sort_by, str) else sort_by})
+        self.descending = descending
+        self.per_page = per_page
+
+    def _ordering(self, backwards=False):
+        """Orders by the sort key then id, reversed when paging backwards"""
+        descending = self.descending != backwards
+        nulls = {"nulls_first": True} if backwards else {"nulls_last": True}
+        key, pk = F(self.key_name), F("id")
+        if descending:
+            return [key.desc(**nulls), pk.desc()]
+        return [key.asc(**nulls), pk.asc()]
+
+    def _after(self, value, pk, backwards=False):
+        """Matches the rows which come after (value, pk) in the ordering, or before it when backwards"""
+        # whether rows after this one have a bigger sort key and id
+        bigger = self.descending == backwards
+        compare = "gt" if bigger else "lt"
+        key_is_null = Q(**{f"{self.key_name}__isnull": True})
+        same_key_later_id = Q(**{f"id__{compare}": pk})
+        if value is None:
+            same_key_later_id &= key_is_null
+            # NULLs come last, so every row with a key comes before them
+            return same_key_later_id | ~key_is_null if backwards else same_key_later_id
+        later_key = Q(**{f"{self.key_name}__{compare}": value})
+        same_key_later_id &= Q(**{self.key_name: value})
+        if backwards:
+            return later_key | same_key_later_id
+        return later_key | same_key_later_id | key_is_null
+
+    def encode_cursor(self, obj, backwards=False) -> str:
+        """Returns the cursor pointing after obj, or before it when backwards"""
+        value = getattr(obj, self.key_name)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        data = {"v": value, "id": obj.id, "b": backwards}
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Returns the (value, id, backwards) a cursor points at, or raises InvalidCursor"""
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            # cursors come from clients, so the value must be checked against the sort key's type
+            output_field = self.queryset.query.annotations[self.key_name].output_field
+            value = output_field.to_python(data["v"]) if data["v"] is not None else None
+            return value, int(data["id"]), bool(data["b"])
+        except (ValidationError, ValueError, TypeError, KeyError) as err:
+            raise InvalidCursor(f"Invalid cursor: {cursor}") from err
+
+    def get_page(self, cursor=None):
+        """
+        Returns the page which cursor points at, or the first page without one.
+        returns: A dictionary of the page's objects and the cursors next to it, which are None at either end
+        """
+        backwards = False
+        queryset = self.queryset
+        if cursor:
+            value, pk, backwards = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._after(value, pk, backwards))
+
+        # fetch one more row than needed to tell if there is another page
+        objects = list(queryset.order_by(*self._ordering(backwards))[: self.per_page + 1])
+        has_more = len(objects) > self.per_page
+        objects = objects[: self.per_page]
+        if backwards:
+            objects.reverse()
+
+        has_next = has_more if not backwards else True
+        has_previous = has_more if backwards else bool(cursor)
+        return {
+            "object_list": objects,
+            "next": self.encode_cursor(objects[-1]) if objects and has_next else None,
+            "previous": self.encode_cursor(objects[0], backwards=True) if objects and has_previous else None,
+        }
+
+    def get_approximate_count(self, limit=APPROXIMATE_COUNT_LIMIT):
+        """Counts the queryset up to limit, see get_approximate_count"""
+        return get_approximate_count(self.queryset, limit)
+
+
+def get_approximate_count(queryset, limit=APPROXIMATE_COUNT_LIMIT):
+    """
+    Counts the queryset, stopping at limit so that large result sets stay cheap to count.
+    returns: A tuple of the count and whether it is exact
+    """
+    count = queryset.order_by()[: limit + 1].count()
+    return min(count, limit), count <= limit
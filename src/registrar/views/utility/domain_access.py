@@ -0,0 +1,33 @@
+"""Look up a domain and the request user's access to it, once per request."""
+
+from django.db.models import OuterRef, Subquery
+
+from registrar.models import Domain, UserDomainRole
+
+# the attribute of the request which keeps the domains looked up for it, by pk
+REQUEST_ATTRIBUTE = "_domains_with_access"
+
+
+def get_domain_with_access(request, pk) -> Domain | None:
+    """
+    Returns the domain with pk, or None if there is none, along with what permission
+    checks need to know about it, in a single query:
+
+    - domain.domain_info and domain.domain_info.domain_request are selected with it
+    - domain.user_role is the request user's UserDomainRole role, or None if they have none
+
+    The result is kept on the request, so that each permission mixin and the view
+    itself get the same Domain instance without querying again.
+    """
+    domains = request.__dict__.setdefault(REQUEST_ATTRIBUTE, {})
+    key = str(pk)
+    if key not in domains:
+        queryset = Domain.objects.select_related("domain_info__domain_request")
+        if request.user.is_authenticated:
+            user_roles = UserDomainRole.objects.filter(domain=OuterRef("pk"), user=request.user)
+            queryset = queryset.annotate(user_role=Subquery(user_roles.values("role")[:1]))
+        domain = queryset.filter(pk=pk).first()
+        if domain is not None and not request.user.is_authenticated:
+            domain.user_role = None
+        domains[key] = domain
+    return domains[key]
@@ -3,12 +3,11 @@
 from django.contrib.auth.mixins import PermissionRequiredMixin
 
 from registrar.models import (
-    Domain,
     DomainRequest,
     DomainInvitation,
-    DomainInformation,
     UserDomainRole,
 )
+from registrar.views.utility.domain_access import get_domain_with_access
 import logging
 
 
@@ -183,7 +182,8 @@ class DomainPermission(PermissionsLoginMixin):
             return True
 
         # user needs to have a role on the domain
-        if not UserDomainRole.objects.filter(user=self.request.user, domain__id=pk).exists():
+        requested_domain = get_domain_with_access(self.request, pk)
+        if requested_domain is None or requested_domain.user_role is None:
             return False
 
         # if we need to check more about the nature of role, do it here.
@@ -192,9 +192,7 @@ class DomainPermission(PermissionsLoginMixin):
     def in_editable_state(self, pk):
         """Is the domain in an editable state"""
 
-        requested_domain = None
-        if Domain.objects.filter(id=pk).exists():
-            requested_domain = Domain.objects.get(id=pk)
+        requested_domain = get_domain_with_access(self.request, pk)
 
         # if domain is editable return true
         if requested_domain and requested_domain.is_editable():
@@ -240,18 +238,17 @@ class DomainPermission(PermissionsLoginMixin):
             None,
         ]
 
-        requested_domain = None
-        if DomainInformation.objects.filter(id=pk).exists():
-            requested_domain = DomainInformation.objects.get(id=pk)
+        requested_domain = get_domain_with_access(self.request, pk)
+        domain_info = getattr(requested_domain, "domain_info", None) if requested_domain else None
 
         # if no domain information or domain request exist, the user
         # should be able to manage the domain; however, if domain information
         # and domain request exist, and domain request is not in valid status,
         # user should not be able to manage domain
         if (
-            requested_domain
-            and requested_domain.domain_request
-            and requested_domain.domain_request.status not in valid_domain_statuses
+            domain_info
+            and domain_info.domain_request
+            and domain_info.domain_request.status not in valid_domain_statuses
         ):
             return False
 
@@ -2,11 +2,13 @@
 
 import abc  # abstract base class
 
+from django.http import Http404
 from django.views.generic import DetailView, DeleteView, TemplateView
 from registrar.models import Domain, DomainRequest, DomainInvitation
 from registrar.models.contact import Contact
 from registrar.models.user_domain_role import UserDomainRole
 
+from .domain_access import get_domain_with_access
 from .mixins import (
     DomainPermission,
     DomainRequestPermission,
@@ -33,6 +35,15 @@ class DomainPermissionView(DomainPermission, DetailView, abc.ABC):
     # variable name in template context for the model object
     context_object_name = "domain"
 
+    def get_object(self, queryset=None):
+        """Returns the domain which the permission check already looked up"""
+        if queryset is not None:
+            return super().get_object(queryset)
+        domain = get_domain_with_access(self.request, self.kwargs.get(self.pk_url_kwarg))
+        if domain is None:
+            raise Http404("No domain found matching the query")
+        return domain
+
     # Adds context information for user permissions
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)